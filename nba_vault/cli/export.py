@@ -19,6 +19,7 @@ logger = structlog.get_logger(__name__)
 
 # Internal tables to exclude from exports
 INTERNAL_TABLES = {
+    "_deferred_index",
     "_yoyo_log",
     "_yoyo_migration",
     "_yoyo_version",
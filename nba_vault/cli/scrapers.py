@@ -21,7 +21,7 @@ def ingest_injuries(
     source: str = typer.Option(
         "espn",
         "--source",
-        help="Data source: espn, rotowire, or nba",
+        help="Data source: espn, rotowire, all (espn and rotowire), or nba",
     ),
 ) -> None:
     """
@@ -1,7 +1,7 @@
 """Data ingestion framework.
 
-All ingestors are imported here to trigger @register_ingestor decoration
-and ensure auto-discovery via list_ingestors() / create_ingestor().
+All ingestors are imported here so their BaseIngestor subclasses register
+themselves and are discoverable via list_ingestors() / create_ingestor().
 """
 
 from nba_vault.ingestion.awards import AwardsIngestor
@@ -17,7 +17,7 @@ from nba_vault.ingestion.elo import EloIngestor
 from nba_vault.ingestion.games import GameOfficialIngestor, GameScheduleIngestor
 from nba_vault.ingestion.injuries import InjuryIngestor
 from nba_vault.ingestion.lineups import LineupsIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
+from nba_vault.ingestion.nba_stats_client import NBAStatsClient, get_nba_stats_client
 from nba_vault.ingestion.play_by_play import PlayByPlayIngestor
 from nba_vault.ingestion.player_bio import PlayerBioIngestor
 from nba_vault.ingestion.player_season_stats import PlayerSeasonStatsIngestor
@@ -68,6 +68,7 @@ __all__ = [
     "TeamOtherStatsIngestor",
     "create_ingestor",
     "get_ingestor",
+    "get_nba_stats_client",
     "list_ingestors",
     "register_ingestor",
 ]
@@ -16,6 +16,27 @@ class RateLimitError(Exception):
     """Raised when the NBA.com API responds with HTTP 429 (Too Many Requests)."""
 
 
+def _result_sets_from_payload(payload: Any) -> dict[str, Any] | None:
+    """
+    Convert a raw stats.nba.com payload into {name: {headers, data}}.
+
+    Returns None when the payload is not in the tabular resultSets/resultSet
+    format (e.g. the newer v3 JSON endpoints), so callers can fall back.
+    """
+    if not isinstance(payload, dict):
+        return None
+    results = payload.get("resultSets", payload.get("resultSet"))
+    if isinstance(results, dict):
+        results = [results]
+    if not isinstance(results, list):
+        return None
+    return {
+        rs["name"]: {"headers": rs.get("headers", []), "data": rs.get("rowSet", [])}
+        for rs in results
+        if isinstance(rs, dict) and "name" in rs
+    }
+
+
 class NBAStatsAdapter(ABC):
     """
     Abstract base class for NBA.com Stats API adapters.
@@ -525,10 +546,15 @@ class NbaApiAdapter(NBAStatsAdapter):
             # Make request with timeout
             response = endpoint_class(**params, timeout=self.timeout)
 
-            # Extract data from response using get_normalized_dict() which
-            # returns {dataset_name: [row_dict, ...]} regardless of nba_api version.
-            result: dict[str, Any] = {}
-            if hasattr(response, "get_normalized_dict"):
+            # Prefer the raw payload: get_dict() is a single json.loads and its
+            # resultSets are already in the {headers, rowSet} shape we need.
+            # get_normalized_dict() re-parses the JSON, builds a dict per row,
+            # and we would then have to split every row back into a list.
+            result: dict[str, Any] | None = None
+            if hasattr(response, "get_dict"):
+                result = _result_sets_from_payload(response.get_dict())
+            if result is None and hasattr(response, "get_normalized_dict"):
+                result = {}
                 normalized = response.get_normalized_dict()
                 # get_normalized_dict returns {name: [row, ...]} where each row is a dict
                 # Wrap into the {name: {headers: [...], data: [...]}} format expected downstream
@@ -540,7 +566,8 @@ class NbaApiAdapter(NBAStatsAdapter):
                         headers = []
                         data = []
                     result[dataset_name] = {"headers": headers, "data": data}
-            elif hasattr(response, "data_sets"):
+            elif result is None and hasattr(response, "data_sets"):
+                result = {}
                 ds = response.data_sets
                 if isinstance(ds, dict):
                     for dataset_name, dataset in ds.items():
@@ -550,7 +577,7 @@ class NbaApiAdapter(NBAStatsAdapter):
                         if hasattr(dataset, "name") and hasattr(dataset, "get_dict"):
                             result[dataset.name] = dataset.get_dict()
 
-            return result
+            return result or {}
 
         except Exception as e:
             error_str = str(e)
@@ -12,12 +12,44 @@ from typing import Any
 import pydantic
 import structlog
 
+from nba_vault.schema.connection import tune_for_ingest
 from nba_vault.utils.cache import ContentCache
 from nba_vault.utils.config import get_settings
 from nba_vault.utils.rate_limit import AsyncRateLimiter, RateLimiter, retry_with_backoff
 
 logger = structlog.get_logger(__name__)
 
+# entity_type -> ingestor class, filled by BaseIngestor.__init_subclass__
+_INGESTOR_REGISTRY: dict[str, type["BaseIngestor"]] = {}
+
+
+def result_set(raw: dict[str, Any], legacy_key: str) -> tuple[list[str], list[list[Any]]]:
+    """
+    Return (headers, data) from a headers/data fetch payload.
+
+    Payloads cached before that layout carry a list of row dicts under
+    legacy_key; those are folded back into the same shape.
+
+    Args:
+        raw: Fetch payload.
+        legacy_key: Key holding row dicts in older cached payloads.
+
+    Returns:
+        Column names and row lists.
+    """
+    if legacy_key in raw:
+        rows: list[dict[str, Any]] = raw.get(legacy_key) or []
+        headers = list(rows[0]) if rows else []
+        return headers, [[row.get(h) for h in headers] for row in rows]
+    return raw.get("headers", []), raw.get("data", [])
+
+
+def pad_row(row: list[Any], width: int) -> list[Any]:
+    """Truncate or None-pad a ragged row to exactly ``width`` cells."""
+    cells = list(row[:width])
+    cells.extend([None] * (width - len(cells)))
+    return cells
+
 
 class BaseIngestor(ABC):
     """
@@ -28,6 +60,18 @@ class BaseIngestor(ABC):
 
     entity_type: str  # e.g., "player", "game", "team"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Register every subclass that declares its own entity_type.
+
+        Subclasses inheriting a parent's entity_type are not registered, so a
+        specialised ingestor never replaces its parent in the registry.
+        """
+        super().__init_subclass__(**kwargs)
+        entity_type = cls.__dict__.get("entity_type")
+        if entity_type:
+            _INGESTOR_REGISTRY[entity_type] = cls
+
     def __init__(self, cache: ContentCache | None = None, rate_limiter: RateLimiter | None = None):
         """
         Initialize ingestor.
@@ -103,6 +147,23 @@ class BaseIngestor(ABC):
         """
         pass
 
+    def validated_rows(self, raw: dict[str, Any]) -> list[Any]:
+        """
+        Return the validated rows ingest() passes to upsert().
+
+        Defaults to validate(). Ingestors whose upsert() also accepts
+        upsert-ready rows (e.g. parameter tuples) override this to skip
+        holding a full list of models. Every row is validated before this
+        returns, so a ValidationError never follows a partial write.
+
+        Args:
+            raw: Raw data dictionary.
+
+        Returns:
+            A list of validated models or upsert-ready rows.
+        """
+        return self.validate(raw)
+
     def ingest(self, entity_id: str, conn, **kwargs: Any) -> dict[str, Any]:
         """
         Complete ingestion pipeline for an entity.
@@ -135,12 +196,16 @@ class BaseIngestor(ABC):
             self.logger.debug("fetch_complete", entity_id=entity_id)
 
             # Validate
-            validated = self.validate(raw_data)
+            validated = self.validated_rows(raw_data)
             self.logger.debug(
                 "validation_complete", entity_id=entity_id, record_count=len(validated)
             )
+            # raw_data is only kept for quarantining validation failures;
+            # drop it so a full-season payload is not held alongside the upsert.
+            raw_data = {}
 
             # Upsert
+            tune_for_ingest(conn)
             rows_affected = self.upsert(validated, conn)
 
             duration_ms = int((time.monotonic() - start_time) * 1000)
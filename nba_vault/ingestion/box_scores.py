@@ -14,8 +14,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import (
     check_data_availability,
     require_fk,
@@ -50,7 +49,6 @@ def _f(val: Any, default: float = 0.0) -> float | None:
         return None
 
 
-@register_ingestor
 class BoxScoreTraditionalIngestor(BaseIngestor):
     """
     Ingestor for traditional per-game box scores (player + team rows).
@@ -69,7 +67,7 @@ class BoxScoreTraditionalIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         game_id = entity_id
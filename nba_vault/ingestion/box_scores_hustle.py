@@ -14,8 +14,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import (
     check_data_availability,
     require_fk,
@@ -47,7 +46,6 @@ def _f(val: Any) -> float | None:
         return None
 
 
-@register_ingestor
 class BoxScoreHustleIngestor(BaseIngestor):
     """
     Ingestor for hustle-stat box scores (2015-16+).
@@ -65,7 +63,7 @@ class BoxScoreHustleIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         game_id = entity_id
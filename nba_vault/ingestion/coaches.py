@@ -14,8 +14,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import require_fk, upsert_audit
 from nba_vault.models.entities import CoachCreate, CoachStintCreate
 
@@ -24,7 +23,6 @@ logger = structlog.get_logger(__name__)
 _COACHES_DATASET = "Coaches"
 
 
-@register_ingestor
 class CoachIngestor(BaseIngestor):
     """
     Ingestor for coaching staff data.
@@ -43,7 +41,7 @@ class CoachIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         team_id = entity_id
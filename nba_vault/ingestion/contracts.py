@@ -22,7 +22,6 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
 
 if TYPE_CHECKING:
     import pydantic
@@ -30,7 +29,6 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
-@register_ingestor
 class ContractIngestor(BaseIngestor):
     """
     Stub ingestor — contract / salary data intentionally excluded (see module docstring).
@@ -17,8 +17,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.entities import DraftPickCreate
 
@@ -27,7 +26,6 @@ logger = structlog.get_logger(__name__)
 _DRAFT_DATASET = "DraftHistory"
 
 
-@register_ingestor
 class DraftIngestor(BaseIngestor):
     """
     Ingestor for draft pick history.
@@ -46,7 +44,7 @@ class DraftIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         # entity_id is "all" or a 4-digit year string
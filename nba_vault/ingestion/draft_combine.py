@@ -15,8 +15,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import check_data_availability, upsert_audit
 from nba_vault.models.entities import DraftCombineAnthroCreate
 
@@ -28,7 +27,6 @@ _ANTHRO_DATASET = "Results"
 _DRILLS_DATASET = "Results"
 
 
-@register_ingestor
 class DraftCombineIngestor(BaseIngestor):
     """
     Ingestor for NBA Draft Combine anthropometric + drill measurements.
@@ -46,7 +44,7 @@ class DraftCombineIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         draft_year = int(entity_id)
@@ -27,7 +27,6 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.entities import GameEloCreate
 
@@ -39,7 +38,6 @@ _FALLBACK_URL = (
 )
 
 
-@register_ingestor
 class EloIngestor(BaseIngestor):
     """
     Ingestor for FiveThirtyEight/Neil-Paine ELO ratings (1946-present).
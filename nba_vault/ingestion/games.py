@@ -16,8 +16,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import require_fk, upsert_audit
 from nba_vault.models.entities import GameCreate, GameOfficialCreate, OfficialCreate
 
@@ -29,7 +28,6 @@ _GAME_LOG_DATASET = "LeagueGameLog"
 _OFFICIALS_DATASET = "Officials"
 
 
-@register_ingestor
 class GameScheduleIngestor(BaseIngestor):
     """
     Ingestor for NBA game schedule / results.
@@ -52,7 +50,7 @@ class GameScheduleIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         season = entity_id
@@ -174,7 +172,6 @@ class GameScheduleIngestor(BaseIngestor):
         return rows_affected
 
 
-@register_ingestor
 class GameOfficialIngestor(BaseIngestor):
     """
     Ingestor for game officials (referees).
@@ -193,7 +190,7 @@ class GameOfficialIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         game_id = entity_id
@@ -14,15 +14,17 @@ from __future__ import annotations
 import difflib
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any
 
 import pydantic
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
 from nba_vault.ingestion.scrapers.injury_scrapers import (
     ESPNInjuryScraper,
     RotowireInjuryScraper,
@@ -35,15 +37,30 @@ logger = structlog.get_logger(__name__)
 
 _FUZZY_CUTOFF = 0.85
 
+# Transport-level retries for the scraped pages: a transient gateway error is
+# retried on the pooled keep-alive connection instead of failing the fetch and
+# re-running it (with a fresh DNS lookup and TLS handshake) from ingest().
+# DNS and connect failures are not retried here; ingest()'s own backoff
+# covers them.
+_HTTP_RETRY = Retry(
+    total=3,
+    connect=0,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    # Hand the last error response back so raise_for_status() reports it
+    raise_on_status=False,
+)
+# Keep-alive connections per host; the scrapers fetch at most one page at a time
+_HTTP_POOL_SIZE = 4
+
 
-@register_ingestor
 class InjuryIngestor(BaseIngestor):
     """
     Ingestor for player injury data from ESPN and Rotowire.
 
     entity_id:  "all" | "team:<abbr>" | "player:<name>"
     kwargs:
-        source (str): "espn" (default) | "rotowire"
+        source (str): "espn" (default) | "rotowire" | "all" (both, fetched concurrently)
 
     Usage:
         ingestor = InjuryIngestor()
@@ -64,6 +81,13 @@ class InjuryIngestor(BaseIngestor):
                 )
             }
         )
+        adapter = HTTPAdapter(
+            pool_connections=_HTTP_POOL_SIZE,
+            pool_maxsize=_HTTP_POOL_SIZE,
+            max_retries=_HTTP_RETRY,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.espn_scraper = ESPNInjuryScraper(self.rate_limiter, self.session)
         self.rotowire_scraper = RotowireInjuryScraper(self.rate_limiter, self.session)
 
@@ -200,6 +224,15 @@ class InjuryIngestor(BaseIngestor):
             return self.espn_scraper.fetch()  # type: ignore[return-value]
         if source == "rotowire":
             return self.rotowire_scraper.fetch()  # type: ignore[return-value]
+        if source == "all":
+            # The sites are independent, so overlap their round trips and
+            # parsing. They are on different hosts, so sharing the session
+            # never puts both threads on one pooled connection, and the rate
+            # limiter is lock-protected.
+            scrapers = (self.espn_scraper, self.rotowire_scraper)
+            with ThreadPoolExecutor(max_workers=len(scrapers)) as pool:
+                results = list(pool.map(lambda scraper: scraper.fetch(), scrapers))
+            return [injury for result in results for injury in result]
         raise ValueError(f"Unsupported injury source: {source!r}")
 
     def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
@@ -12,8 +12,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.advanced_stats import LineupCreate
 
@@ -54,7 +53,6 @@ def generate_lineup_id(
     return hashlib.sha256(key.encode()).hexdigest()
 
 
-@register_ingestor
 class LineupsIngestor(BaseIngestor):
     """
     Ingestor for lineup data from NBA.com Stats API.
@@ -81,7 +79,7 @@ class LineupsIngestor(BaseIngestor):
             rate_limiter: Rate limiter for API requests.
         """
         super().__init__(cache, rate_limiter)
-        self.nba_client = NBAStatsClient(cache, rate_limiter)
+        self.nba_client = get_nba_stats_client(cache, rate_limiter)
 
     def fetch(
         self,
@@ -8,6 +8,8 @@ making it easy to swap the underlying library (nba_api, direct HTTP, etc.)
 without changing client code.
 """
 
+import asyncio
+import functools
 from typing import Any
 
 import structlog
@@ -18,6 +20,10 @@ from nba_vault.utils.rate_limit import RateLimiter
 
 logger = structlog.get_logger(__name__)
 
+# Keep-alive pool size for the shared stats.nba.com session; enough for the
+# concurrent roster fan-out in PlayerTrackingIngestor plus headroom.
+_HTTP_POOL_SIZE = 32
+
 
 class NBAStatsClient:
     """
@@ -219,6 +225,31 @@ class NBAStatsClient:
             last_n_games=last_n_games,
         )
 
+    async def get_player_tracking_async(
+        self, player_id: int, season: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Async variant of get_player_tracking for concurrent fan-out.
+
+        The blocking request (cache, rate limiter, HTTP) runs on a worker
+        thread, so several players can be awaited together with
+        asyncio.gather.
+
+        Args:
+            player_id: NBA player ID.
+            season: Season in format "YYYY-YY" (e.g., "2023-24").
+            **kwargs: Any other get_player_tracking parameter.
+
+        Returns:
+            Dictionary with tracking stats.
+
+        Raises:
+            Exception: If request fails.
+        """
+        return await asyncio.to_thread(
+            self.get_player_tracking, player_id=player_id, season=season, **kwargs
+        )
+
     def get_team_lineups(
         self,
         team_id: int,
@@ -439,6 +470,26 @@ class NBAStatsClient:
             last_n_games=last_n_games,
         )
 
+    def get_common_team_roster(self, team_id: int, season: str) -> dict[str, Any]:
+        """
+        Get the roster (players and coaches) for a team/season.
+
+        Args:
+            team_id: NBA team ID.
+            season: Season in format "YYYY-YY" (e.g., "2023-24").
+
+        Returns:
+            Dictionary with "CommonTeamRoster" and "Coaches" datasets.
+
+        Raises:
+            Exception: If request fails.
+        """
+        return self._make_request(
+            "get_common_team_roster",
+            team_id=team_id,
+            season=season,
+        )
+
     def get_team_id_by_abbreviation(self, abbreviation: str) -> int | None:
         """
         Get NBA team ID from abbreviation.
@@ -462,3 +513,47 @@ class NBAStatsClient:
             Player ID if found, None otherwise.
         """
         return self.adapter.get_player_id_by_name(full_name)
+
+
+@functools.cache
+def _shared_adapter() -> NBAStatsAdapter:
+    """Return the process-wide NbaApiAdapter, configuring its HTTP session once.
+
+    nba_api sends every endpoint request through a class-level
+    requests.Session; mounting a larger connection pool on it lets all
+    ingestors reuse warm keep-alive connections instead of re-handshaking.
+    """
+    try:
+        import requests  # noqa: PLC0415
+        from nba_api.stats.library.http import NBAStatsHTTP  # noqa: PLC0415
+        from requests.adapters import HTTPAdapter  # noqa: PLC0415
+
+        session = requests.Session()
+        pooled = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+        session.mount("https://", pooled)
+        session.mount("http://", pooled)
+        NBAStatsHTTP.set_session(session)
+    except ImportError:
+        logger.debug("nba_api HTTP session not configurable; using library default")
+    return NbaApiAdapter()
+
+
+def get_nba_stats_client(
+    cache: ContentCache | None = None,
+    rate_limiter: RateLimiter | None = None,
+) -> NBAStatsClient:
+    """
+    Return an NBAStatsClient backed by the process-wide adapter and HTTP session.
+
+    Ingestors keep their own cache and rate limiter, but share the (stateless)
+    nba_api adapter and its pooled connections, so constructing many ingestors
+    no longer reloads the endpoint table or opens fresh TLS connections.
+
+    Args:
+        cache: Content cache for API responses. If None, creates default.
+        rate_limiter: Rate limiter for requests. If None, creates default.
+
+    Returns:
+        NBAStatsClient using the shared adapter.
+    """
+    return NBAStatsClient(cache=cache, rate_limiter=rate_limiter, adapter=_shared_adapter())
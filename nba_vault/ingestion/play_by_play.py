@@ -15,8 +15,7 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import (
     check_data_availability,
     quarantine_row,
@@ -31,7 +30,6 @@ logger = structlog.get_logger(__name__)
 _PBP_DATASET = "PlayByPlay"
 
 
-@register_ingestor
 class PlayByPlayIngestor(BaseIngestor):
     """
     Ingestor for play-by-play events (1996-97+).
@@ -49,7 +47,7 @@ class PlayByPlayIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         game_id = entity_id
@@ -7,37 +7,83 @@ weight_lbs, birthdate, draft year/round/pick, country, college.
 
 from __future__ import annotations
 
+import operator
 import sqlite3
 from typing import Any, cast
 
 import pydantic
 import structlog
 
+from nba_vault.ingestion import prefetch
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
-from nba_vault.ingestion.validation import require_fk, upsert_audit
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
+from nba_vault.ingestion.player_season_stats import career_stats_payload
+from nba_vault.ingestion.validation import existing_fk_values, upsert_audit
 from nba_vault.models.entities import PlayerBioCreate
+from nba_vault.utils.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
 _COMMON_PLAYER_INFO_DATASET = "CommonPlayerInfo"
 
+_BIO_UPDATE = """
+    UPDATE player SET
+        position          = COALESCE(?, position),
+        height_inches     = COALESCE(?, height_inches),
+        weight_lbs        = COALESCE(?, weight_lbs),
+        birthdate         = COALESCE(?, birthdate),
+        birthplace_city   = COALESCE(?, birthplace_city),
+        birthplace_state  = COALESCE(?, birthplace_state),
+        birthplace_country= COALESCE(?, birthplace_country),
+        country           = COALESCE(?, country),
+        college           = COALESCE(?, college),
+        draft_year        = COALESCE(?, draft_year),
+        draft_round       = COALESCE(?, draft_round),
+        draft_number      = COALESCE(?, draft_number),
+        bbref_id          = COALESCE(?, bbref_id)
+    WHERE player_id = ?
+"""
+
+_bio_to_row = operator.attrgetter(
+    "position",
+    "height_inches",
+    "weight_lbs",
+    "birthdate",
+    "birthplace_city",
+    "birthplace_state",
+    "birthplace_country",
+    "country",
+    "college",
+    "draft_year",
+    "draft_round",
+    "draft_number",
+    "bbref_id",
+    "player_id",
+)
+
 
 def _parse_height_inches(height_str: str) -> float | None:
     """Parse '6-9' format into total inches (81.0)."""
-    if not height_str:
+    # Heights are always "F-I" / "F-II"; index around the dash instead of
+    # split() + two float() parses.
+    dash = height_str.find("-")
+    if dash <= 0:
         return None
-    parts = height_str.split("-")
-    if len(parts) == 2:
-        try:
-            return float(parts[0]) * 12 + float(parts[1])
-        except ValueError:
-            pass
+    try:
+        return float(int(height_str[:dash]) * 12 + int(height_str[dash + 1 :]))
+    except ValueError:
+        return None
+
+
+def _digits_int(val: Any) -> int | None:
+    """Return val as an int if it is a non-negative integer (or all-digit string)."""
+    if type(val) is int:
+        return val if val >= 0 else None
+    if isinstance(val, str) and val.isdigit():
+        return int(val)
     return None
 
 
-@register_ingestor
 class PlayerBioIngestor(BaseIngestor):
     """
     Ingestor for player biographical data via CommonPlayerInfo.
@@ -46,6 +92,10 @@ class PlayerBioIngestor(BaseIngestor):
     table (UPDATE only — the player row must already exist from PlayerIngestor).
 
     entity_id convention: "<player_id>" e.g. "2544"
+    kwargs:
+        prefetch_career_stats (bool): Start the PerGame career-stats request
+            for PlayerSeasonStatsIngestor in the background (default: the
+            nba_api_prefetch setting)
 
     Usage:
         ingestor = PlayerBioIngestor()
@@ -56,14 +106,17 @@ class PlayerBioIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         player_id = int(entity_id)
+        prefetch_career = bool(kwargs.get("prefetch_career_stats", get_settings().nba_api_prefetch))
         cache_key = f"common_player_info_{player_id}"
         cached = self.cache.get(cache_key)
         if cached:
             self.logger.debug("Cache hit for player bio", player_id=player_id)
+            if prefetch_career:
+                self._prefetch_career_stats(player_id)
             return cached  # type: ignore[return-value]
 
         self.rate_limiter.acquire()
@@ -77,8 +130,34 @@ class PlayerBioIngestor(BaseIngestor):
 
         payload: dict[str, Any] = {"info": info, "player_id": player_id}
         self.cache.set(cache_key, payload)
+        if prefetch_career:
+            self._prefetch_career_stats(player_id)
         return payload
 
+    def _prefetch_career_stats(self, player_id: int) -> None:
+        """
+        Start the career-stats request PlayerSeasonStatsIngestor makes next.
+
+        The payload is written to the cache as soon as it arrives, so the
+        request is not wasted if the prefetch is evicted before it is claimed.
+        """
+        cache_key = f"player_career_{player_id}_PerGame"
+        if self._is_async or self.cache.contains(cache_key):
+            return
+
+        adapter = self._client.adapter
+        rate_limiter = self.rate_limiter
+        cache = self.cache
+
+        def _fetch() -> dict[str, Any]:
+            rate_limiter.acquire()
+            raw = adapter.get_player_career_stats(player_id=player_id, per_mode="PerGame")
+            payload = career_stats_payload(raw, str(player_id))
+            cache.set(cache_key, payload)
+            return payload
+
+        prefetch.schedule(cache_key, _fetch)
+
     def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
         info = raw.get("info", {})
         player_id = raw.get("player_id", 0)
@@ -87,32 +166,25 @@ class PlayerBioIngestor(BaseIngestor):
             return []
 
         try:
-            height_str = str(info.get("HEIGHT", "") or "")
-            weight_raw = info.get("WEIGHT")
-            draft_year_raw = info.get("DRAFT_YEAR")
-            draft_round_raw = info.get("DRAFT_ROUND")
-            draft_number_raw = info.get("DRAFT_NUMBER")
-            birthdate_raw = str(info.get("BIRTHDATE", "") or "")
-
-            def _safe_int(val: Any) -> int | None:
-                s = str(val) if val is not None else ""
-                return int(s) if s.isdigit() else None
+            # CommonPlayerInfo text fields are str | None; "" and None both mean unknown
+            birthdate = info.get("BIRTHDATE") or None
+            weight = _digits_int(info.get("WEIGHT"))
 
             model = PlayerBioCreate(
                 player_id=int(info.get("PERSON_ID", player_id)),
-                position=str(info.get("POSITION", "") or "") or None,
-                height_inches=_parse_height_inches(height_str),
-                weight_lbs=float(weight_raw) if weight_raw and str(weight_raw).isdigit() else None,
-                birthdate=birthdate_raw[:10] or None,
-                birthplace_city=str(info.get("BIRTHPLACE_CITY", "") or "") or None,
-                birthplace_state=str(info.get("BIRTHPLACE_STATE", "") or "") or None,
-                birthplace_country=str(info.get("BIRTHPLACE_COUNTRY", "") or "") or None,
-                country=str(info.get("COUNTRY", "") or "") or None,
-                college=str(info.get("SCHOOL", "") or "") or None,
-                draft_year=_safe_int(draft_year_raw),
-                draft_round=_safe_int(draft_round_raw),
-                draft_number=_safe_int(draft_number_raw),
-                bbref_id=str(info.get("BBREF_ID", "") or "") or None,
+                position=info.get("POSITION") or None,
+                height_inches=_parse_height_inches(info.get("HEIGHT") or ""),
+                weight_lbs=float(weight) if weight else None,
+                birthdate=birthdate[:10] if birthdate else None,
+                birthplace_city=info.get("BIRTHPLACE_CITY") or None,
+                birthplace_state=info.get("BIRTHPLACE_STATE") or None,
+                birthplace_country=info.get("BIRTHPLACE_COUNTRY") or None,
+                country=info.get("COUNTRY") or None,
+                college=info.get("SCHOOL") or None,
+                draft_year=_digits_int(info.get("DRAFT_YEAR")),
+                draft_round=_digits_int(info.get("DRAFT_ROUND")),
+                draft_number=_digits_int(info.get("DRAFT_NUMBER")),
+                bbref_id=info.get("BBREF_ID") or None,
             )
             return [model]
         except (pydantic.ValidationError, ValueError) as exc:
@@ -124,55 +196,19 @@ class PlayerBioIngestor(BaseIngestor):
             return []
 
     def upsert(self, model: list[pydantic.BaseModel], conn: Any) -> int:
-        rows_affected = 0
+        bios = [cast("PlayerBioCreate", m) for m in model]
+        known_players = existing_fk_values(conn, "player", "player_id", (b.player_id for b in bios))
+        rows = []
+        for b in bios:
+            if b.player_id not in known_players:
+                self.logger.warning("Player FK missing for bio, skipping", player_id=b.player_id)
+                continue
+            rows.append(_bio_to_row(b))
+
         conn.execute("BEGIN")
         try:
-            for item in model:
-                b = cast("PlayerBioCreate", item)
-                if not require_fk(conn, "player", "player_id", b.player_id):
-                    self.logger.warning(
-                        "Player FK missing for bio, skipping",
-                        player_id=b.player_id,
-                    )
-                    continue
-                # UPDATE only; INSERT was done by PlayerIngestor
-                conn.execute(
-                    """
-                    UPDATE player SET
-                        position          = COALESCE(?, position),
-                        height_inches     = COALESCE(?, height_inches),
-                        weight_lbs        = COALESCE(?, weight_lbs),
-                        birthdate         = COALESCE(?, birthdate),
-                        birthplace_city   = COALESCE(?, birthplace_city),
-                        birthplace_state  = COALESCE(?, birthplace_state),
-                        birthplace_country= COALESCE(?, birthplace_country),
-                        country           = COALESCE(?, country),
-                        college           = COALESCE(?, college),
-                        draft_year        = COALESCE(?, draft_year),
-                        draft_round       = COALESCE(?, draft_round),
-                        draft_number      = COALESCE(?, draft_number),
-                        bbref_id          = COALESCE(?, bbref_id)
-                    WHERE player_id = ?
-                    """,
-                    (
-                        b.position,
-                        b.height_inches,
-                        b.weight_lbs,
-                        b.birthdate,
-                        b.birthplace_city,
-                        b.birthplace_state,
-                        b.birthplace_country,
-                        b.country,
-                        b.college,
-                        b.draft_year,
-                        b.draft_round,
-                        b.draft_number,
-                        b.bbref_id,
-                        b.player_id,
-                    ),
-                )
-                changed: int = conn.execute("SELECT changes()").fetchone()[0]
-                rows_affected += changed
+            # UPDATE only; INSERT was done by PlayerIngestor
+            rows_affected = conn.executemany(_BIO_UPDATE, rows).rowcount if rows else 0
             conn.execute("COMMIT")
         except sqlite3.Error:
             conn.execute("ROLLBACK")
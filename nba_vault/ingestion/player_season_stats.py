@@ -7,16 +7,17 @@ Available for all seasons (1946-present).
 
 from __future__ import annotations
 
+import operator
 import sqlite3
 from typing import Any, cast
 
 import pydantic
 import structlog
 
-from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
-from nba_vault.ingestion.validation import require_fk, upsert_audit
+from nba_vault.ingestion import prefetch
+from nba_vault.ingestion.base import BaseIngestor, pad_row, result_set
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
+from nba_vault.ingestion.validation import existing_fk_values, upsert_audit
 from nba_vault.models.entities import PlayerSeasonStatsCreate
 
 logger = structlog.get_logger(__name__)
@@ -24,8 +25,94 @@ logger = structlog.get_logger(__name__)
 # Dataset keys returned by PlayerCareerStats
 _REG_TOTALS = "SeasonTotalsRegularSeason"
 
+# (model field, API column) pairs coerced column-at-a-time in validate()
+_INT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("games_played", "GP"),
+    ("games_started", "GS"),
+)
+_FLOAT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("minutes_played", "MIN"),
+    ("fgm", "FGM"),
+    ("fga", "FGA"),
+    ("fg_pct", "FG_PCT"),
+    ("fg3m", "FG3M"),
+    ("fg3a", "FG3A"),
+    ("fg3_pct", "FG3_PCT"),
+    ("ftm", "FTM"),
+    ("fta", "FTA"),
+    ("ft_pct", "FT_PCT"),
+    ("oreb", "OREB"),
+    ("dreb", "DREB"),
+    ("reb", "REB"),
+    ("ast", "AST"),
+    ("stl", "STL"),
+    ("blk", "BLK"),
+    ("tov", "TOV"),
+    ("pf", "PF"),
+    ("pts", "PTS"),
+)
+
+_SEASON_STATS_ADAPTER = pydantic.TypeAdapter(list[PlayerSeasonStatsCreate])
+
+# _SEASON_STATS_UPSERT columns, in parameter order
+_SEASON_COLUMNS = (
+    "player_id",
+    "season_id",
+    "team_id",
+    "stat_type",
+    *(field for field, _ in _INT_COLUMNS),
+    *(field for field, _ in _FLOAT_COLUMNS),
+)
+_season_to_row = operator.attrgetter(*_SEASON_COLUMNS)
+
+_SEASON_STATS_UPSERT = """
+    INSERT INTO player_season_stats
+        (player_id, season_id, team_id, stat_type,
+         games_played, games_started, minutes_played,
+         fgm, fga, fg_pct, fg3m, fg3a, fg3_pct,
+         ftm, fta, ft_pct,
+         oreb, dreb, reb, ast, stl, blk, tov, pf, pts)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(player_id, season_id, team_id, stat_type) DO UPDATE SET
+        games_played   = excluded.games_played,
+        games_started  = excluded.games_started,
+        minutes_played = excluded.minutes_played,
+        fgm            = excluded.fgm,
+        fga            = excluded.fga,
+        fg_pct         = excluded.fg_pct,
+        fg3m           = excluded.fg3m,
+        fg3a           = excluded.fg3a,
+        fg3_pct        = excluded.fg3_pct,
+        ftm            = excluded.ftm,
+        fta            = excluded.fta,
+        ft_pct         = excluded.ft_pct,
+        oreb           = excluded.oreb,
+        dreb           = excluded.dreb,
+        reb            = excluded.reb,
+        ast            = excluded.ast,
+        stl            = excluded.stl,
+        blk            = excluded.blk,
+        tov            = excluded.tov,
+        pf             = excluded.pf,
+        pts            = excluded.pts
+"""
+
+
+def career_stats_payload(raw: dict[str, Any], player_id: str) -> dict[str, Any]:
+    """
+    Build the cached fetch payload from a PlayerCareerStats response.
+
+    The result set keeps its raw headers/data shape; validate() indexes
+    columns by header position instead of materialising a dict per row.
+    """
+    ds = raw.get(_REG_TOTALS, {})
+    return {
+        "headers": ds.get("headers", []),
+        "data": ds.get("data", []),
+        "player_id": player_id,
+    }
+
 
-@register_ingestor
 class PlayerSeasonStatsIngestor(BaseIngestor):
     """
     Ingestor for player career / per-season statistics.
@@ -43,7 +130,7 @@ class PlayerSeasonStatsIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         player_id = entity_id
@@ -54,150 +141,108 @@ class PlayerSeasonStatsIngestor(BaseIngestor):
         if cached:
             return cached  # type: ignore[return-value]
 
-        self.rate_limiter.acquire()
-        self.logger.info("Fetching player career stats", player_id=player_id)
-        raw = self._client.adapter.get_player_career_stats(
-            player_id=int(player_id),
-            per_mode=per_mode,
-        )
-
-        def _parse_ds(key: str) -> list[dict[str, Any]]:
-            ds = raw.get(key, {})
-            hdrs: list[str] = ds.get("headers", [])
-            data: list[list[Any]] = ds.get("data", [])
-            return [dict(zip(hdrs, row, strict=False)) for row in data]
-
-        payload: dict[str, Any] = {
-            "totals": _parse_ds(_REG_TOTALS),
-            "player_id": player_id,
-        }
-        self.cache.set(cache_key, payload)
+        # PlayerBioIngestor may already have this request in flight; it
+        # caches the payload itself.
+        payload = prefetch.take(cache_key)
+        if payload is None:
+            self.rate_limiter.acquire()
+            self.logger.info("Fetching player career stats", player_id=player_id)
+            raw = self._client.adapter.get_player_career_stats(
+                player_id=int(player_id),
+                per_mode=per_mode,
+            )
+            payload = career_stats_payload(raw, player_id)
+            self.cache.set(cache_key, payload)
         self.logger.info(
             "Fetched career stats",
             player_id=player_id,
-            seasons=len(payload["totals"]),
+            seasons=len(payload["data"]),
         )
         return payload
 
     def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
         player_id = raw.get("player_id", "")
-        validated: list[pydantic.BaseModel] = []
-        for row in raw.get("totals", []):
-            try:
-                season_str = str(row.get("SEASON_ID", "") or "")
-                # SEASON_ID from NBA API is like "2023-24"
-                season_year = _safe_int(season_str[:4]) if len(season_str) >= 4 else None
-                if season_year is None:
-                    continue
-                team_id = _safe_int(row.get("TEAM_ID")) or 0
-                model = PlayerSeasonStatsCreate(
-                    player_id=int(player_id),
-                    season_id=season_year,
-                    team_id=team_id,
-                    stat_type="Regular Season",
-                    games_played=_safe_int(row.get("GP")),
-                    games_started=_safe_int(row.get("GS")),
-                    minutes_played=_safe_float(row.get("MIN")),
-                    fgm=_safe_float(row.get("FGM")),
-                    fga=_safe_float(row.get("FGA")),
-                    fg_pct=_safe_float(row.get("FG_PCT")),
-                    fg3m=_safe_float(row.get("FG3M")),
-                    fg3a=_safe_float(row.get("FG3A")),
-                    fg3_pct=_safe_float(row.get("FG3_PCT")),
-                    ftm=_safe_float(row.get("FTM")),
-                    fta=_safe_float(row.get("FTA")),
-                    ft_pct=_safe_float(row.get("FT_PCT")),
-                    oreb=_safe_float(row.get("OREB")),
-                    dreb=_safe_float(row.get("DREB")),
-                    reb=_safe_float(row.get("REB")),
-                    ast=_safe_float(row.get("AST")),
-                    stl=_safe_float(row.get("STL")),
-                    blk=_safe_float(row.get("BLK")),
-                    tov=_safe_float(row.get("TOV")),
-                    pf=_safe_float(row.get("PF")),
-                    pts=_safe_float(row.get("PTS")),
-                )
-                validated.append(model)
-            except (pydantic.ValidationError, ValueError) as exc:
-                self.logger.warning("Season stats validation error", error=str(exc), row=row)
+        headers, data = result_set(raw, "totals")
+        if not data:
+            self.logger.info("Validated season stat rows", count=0)
+            return []
+
+        # Transpose once (row-major -> column-major) so each numeric column is
+        # coerced in a single pass rather than ~25 dict lookups per row.
+        # Ragged rows are padded first so one short row cannot truncate every
+        # column.
+        idx = {h: i for i, h in enumerate(headers)}
+        width = len(headers)
+        columns = list(
+            zip(
+                *(row if len(row) == width else pad_row(row, width) for row in data),
+                strict=True,
+            )
+        )
+
+        def _column(name: str, coerce: Any) -> list[Any]:
+            i = idx.get(name)
+            if i is None or i >= len(columns):
+                return [None] * len(data)
+            return coerce(columns[i])
+
+        season_col = _column("SEASON_ID", lambda col: [_season_year(v) for v in col])
+        team_col = _column("TEAM_ID", _int_column)
+        stat_cols = [(field, _column(col, _int_column)) for field, col in _INT_COLUMNS]
+        stat_cols += [(field, _column(col, _float_column)) for field, col in _FLOAT_COLUMNS]
+
+        try:
+            pid = int(player_id)
+        except ValueError as exc:
+            self.logger.warning("Season stats validation error", error=str(exc))
+            return []
+
+        rows: list[dict[str, Any]] = []
+        row_index: list[int] = []
+        for r, season_year in enumerate(season_col):
+            if season_year is None:
+                continue
+            row = {field: values[r] for field, values in stat_cols}
+            row["player_id"] = pid
+            row["season_id"] = season_year
+            row["team_id"] = team_col[r] or 0
+            row["stat_type"] = "Regular Season"
+            rows.append(row)
+            row_index.append(r)
+
+        validated: list[pydantic.BaseModel]
+        try:
+            validated = list(_SEASON_STATS_ADAPTER.validate_python(rows))
+        except pydantic.ValidationError:
+            # Fall back to per-row validation so one bad season is skipped
+            # rather than discarding the whole career.
+            validated = []
+            for r, row in zip(row_index, rows, strict=True):
+                try:
+                    validated.append(PlayerSeasonStatsCreate.model_validate(row))
+                except pydantic.ValidationError as exc:
+                    raw_row = dict(zip(headers, data[r], strict=False))
+                    self.logger.warning(
+                        "Season stats validation error", error=str(exc), row=raw_row
+                    )
         self.logger.info("Validated season stat rows", count=len(validated))
         return validated
 
     def upsert(self, model: list[pydantic.BaseModel], conn: Any) -> int:
-        rows_affected = 0
-        player_id = ""
+        seasons = [cast("PlayerSeasonStatsCreate", m) for m in model]
+        player_id = str(seasons[-1].player_id) if seasons else ""
+        known_players = existing_fk_values(
+            conn, "player", "player_id", (s.player_id for s in seasons)
+        )
+        rows = [_season_to_row(s) for s in seasons if s.player_id in known_players]
         conn.execute("BEGIN")
         try:
-            for item in model:
-                s = cast("PlayerSeasonStatsCreate", item)
-                player_id = str(s.player_id)
-                if not require_fk(conn, "player", "player_id", s.player_id):
-                    continue
-                conn.execute(
-                    """
-                    INSERT INTO player_season_stats
-                        (player_id, season_id, team_id, stat_type,
-                         games_played, games_started, minutes_played,
-                         fgm, fga, fg_pct, fg3m, fg3a, fg3_pct,
-                         ftm, fta, ft_pct,
-                         oreb, dreb, reb, ast, stl, blk, tov, pf, pts)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT(player_id, season_id, team_id, stat_type) DO UPDATE SET
-                        games_played   = excluded.games_played,
-                        games_started  = excluded.games_started,
-                        minutes_played = excluded.minutes_played,
-                        fgm            = excluded.fgm,
-                        fga            = excluded.fga,
-                        fg_pct         = excluded.fg_pct,
-                        fg3m           = excluded.fg3m,
-                        fg3a           = excluded.fg3a,
-                        fg3_pct        = excluded.fg3_pct,
-                        ftm            = excluded.ftm,
-                        fta            = excluded.fta,
-                        ft_pct         = excluded.ft_pct,
-                        oreb           = excluded.oreb,
-                        dreb           = excluded.dreb,
-                        reb            = excluded.reb,
-                        ast            = excluded.ast,
-                        stl            = excluded.stl,
-                        blk            = excluded.blk,
-                        tov            = excluded.tov,
-                        pf             = excluded.pf,
-                        pts            = excluded.pts
-                    """,
-                    (
-                        s.player_id,
-                        s.season_id,
-                        s.team_id,
-                        s.stat_type,
-                        s.games_played,
-                        s.games_started,
-                        s.minutes_played,
-                        s.fgm,
-                        s.fga,
-                        s.fg_pct,
-                        s.fg3m,
-                        s.fg3a,
-                        s.fg3_pct,
-                        s.ftm,
-                        s.fta,
-                        s.ft_pct,
-                        s.oreb,
-                        s.dreb,
-                        s.reb,
-                        s.ast,
-                        s.stl,
-                        s.blk,
-                        s.tov,
-                        s.pf,
-                        s.pts,
-                    ),
-                )
-                rows_affected += 1
+            conn.executemany(_SEASON_STATS_UPSERT, rows)
             conn.execute("COMMIT")
         except sqlite3.Error:
             conn.execute("ROLLBACK")
             raise
+        rows_affected = len(rows)
 
         upsert_audit(
             conn, self.entity_type, player_id or "all", "nba_api", "SUCCESS", rows_affected
@@ -206,19 +251,64 @@ class PlayerSeasonStatsIngestor(BaseIngestor):
         return rows_affected
 
 
+def _season_year(val: Any) -> int | None:
+    """Extract the start year from a SEASON_ID such as "2023-24"."""
+    season_str = str(val or "")
+    return _safe_int(season_str[:4]) if len(season_str) >= 4 else None
+
+
+_NULL_TOKENS = frozenset(("", "None", "null"))
+
+
+def _float_column(values: tuple[Any, ...]) -> list[float | None]:
+    """Coerce a whole column to floats.
+
+    The API normally returns numbers already typed, so the entire column is
+    converted by one comprehension with no per-cell helper call. Any cell
+    that float() rejects ("", "null", ...) sends the column down the
+    per-cell _safe_float path instead.
+    """
+    try:
+        return [None if v is None else float(v) for v in values]
+    except (ValueError, TypeError):
+        return [_safe_float(v) for v in values]
+
+
+def _int_column(values: tuple[Any, ...]) -> list[int | None]:
+    """Coerce a whole column to ints; see _float_column."""
+    if all(v is None or type(v) is int for v in values):
+        return list(values)
+    return [_safe_int(v) for v in values]
+
+
 def _safe_int(val: Any) -> int | None:
-    if val is None or str(val).strip() in ("", "None", "null"):
+    # The API returns most numbers already typed; only strings need stripping.
+    if val is None:
         return None
     try:
-        return int(float(str(val).strip()))
+        if type(val) is int:
+            return val
+        if type(val) is float:
+            return int(val)
+        s = val.strip() if isinstance(val, str) else str(val).strip()
+        if s in _NULL_TOKENS:
+            return None
+        return int(float(s))
     except (ValueError, TypeError):
         return None
 
 
 def _safe_float(val: Any) -> float | None:
-    if val is None or str(val).strip() in ("", "None", "null"):
+    if val is None:
         return None
     try:
-        return float(str(val).strip())
+        if type(val) is float:
+            return val
+        if type(val) is int:
+            return float(val)
+        s = val.strip() if isinstance(val, str) else str(val).strip()
+        if s in _NULL_TOKENS:
+            return None
+        return float(s)
     except (ValueError, TypeError):
         return None
@@ -5,22 +5,166 @@ including speed, distance, touches, drives, and other movement metrics.
 Tracking data is available from the 2013-14 season onwards.
 """
 
+import asyncio
+import itertools
+import multiprocessing
+import operator
 import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Any
 
 import pydantic
 import structlog
 
-from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.base import BaseIngestor, pad_row
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.advanced_stats import PlayerGameTrackingCreate
+from nba_vault.schema.connection import deferred_indexes
 
 logger = structlog.get_logger(__name__)
 
+# (model field, API column) pairs for the numeric tracking metrics
+_FLOAT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("minutes_played", "MIN"),
+    ("distance_miles", "DIST_MILES"),
+    ("distance_miles_offensive", "DIST_MILES_OFF"),
+    ("distance_miles_defensive", "DIST_MILES_DEF"),
+    ("speed_mph_avg", "SPD"),
+    ("speed_mph_max", "MAX_SPEED"),
+)
+_INT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("touches", "TOUCHES"),
+    ("touches_catch_shoot", "EFC"),
+    ("touches_paint", "PAINT"),
+    ("touches_post_up", "POST"),
+    ("drives", "DRIVES"),
+    ("drives_pts", "DRIVES_PTS"),
+    ("pull_up_shots", "PULL_UP_FGA"),
+    ("pull_up_shots_made", "PULL_UP_FGM"),
+)
+
+# Model fields of the numeric columns, in _FLOAT_COLUMNS + _INT_COLUMNS order
+_STAT_FIELDS = tuple(field for field, _ in (*_FLOAT_COLUMNS, *_INT_COLUMNS))
+
+# Maximum number of per-player tracking requests in flight for a team fetch.
+# The shared rate limiter still governs the overall request rate.
+_ROSTER_FETCH_CONCURRENCY = 4
+
+# Rows written per transaction. Large enough to amortise the COMMIT, small
+# enough that one transaction's dirty pages stay within the page cache.
+_COMMIT_BATCH = 10_000
+
+# Upserts larger than this drop the table's secondary indexes for the load
+# and rebuild them afterwards (see deferred_indexes).
+_DEFER_INDEX_THRESHOLD = 5_000
+
+_TRACKING_ADAPTER = pydantic.TypeAdapter(list[PlayerGameTrackingCreate])
+
+# Validating more records than this fans out to a process pool,
+# _PARALLEL_VALIDATE_CHUNK records per task.
+_PARALLEL_VALIDATE_THRESHOLD = 5_000
+_PARALLEL_VALIDATE_CHUNK = 1_000
+
+# Column list generated once from the model, so the SQL text and the
+# attrgetter below cannot drift apart. Model fields map 1:1 onto columns.
+_TRACKING_COLS = tuple(PlayerGameTrackingCreate.model_fields)
+# The table's UNIQUE(game_id, player_id, team_id) key
+_TRACKING_KEY = ("game_id", "player_id", "team_id")
+
+_tracking_row = operator.attrgetter(*_TRACKING_COLS)
+
+# Position of season_id in a _tracking_row tuple
+_SEASON_ID_POS = _TRACKING_COLS.index("season_id")
+
+_TRACKING_VALUE_COLS = tuple(c for c in _TRACKING_COLS if c not in _TRACKING_KEY)
+
+# One statement per record: insert, or update in place on the unique key.
+# The WHERE guard skips conflicting rows whose values are unchanged, so
+# re-ingesting a season does not rewrite (and WAL-log) identical pages;
+# IS NOT treats NULLs as comparable values.
+_SQL_UPSERT_TRACKING = (
+    f"INSERT INTO player_game_tracking ({', '.join(_TRACKING_COLS)}) "  # noqa: S608
+    f"VALUES ({', '.join('?' * len(_TRACKING_COLS))}) "
+    f"ON CONFLICT({', '.join(_TRACKING_KEY)}) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _TRACKING_VALUE_COLS)
+    + f" WHERE ({', '.join(f'player_game_tracking.{c}' for c in _TRACKING_VALUE_COLS)})"
+    f" IS NOT ({', '.join(f'excluded.{c}' for c in _TRACKING_VALUE_COLS)})"
+)
+
+
+def _validate_chunk(records: list[dict[str, Any]]) -> list[tuple[Any, ...]] | None:
+    """
+    Process-pool worker: validate records and return upsert parameter tuples.
+
+    Tuples rather than models are sent back to keep pickling cheap. Returns
+    None on a validation failure so the parent can re-run the chunk in
+    process and log/raise with full row context.
+    """
+    try:
+        return list(map(_tracking_row, _TRACKING_ADAPTER.validate_python(records)))
+    except pydantic.ValidationError:
+        return None
+
+
+def _roster_player_ids(roster: dict[str, Any]) -> list[int]:
+    """Extract player IDs from a CommonTeamRoster response."""
+    dataset = roster.get("CommonTeamRoster", {})
+    headers: list[str] = dataset.get("headers", [])
+    if "PLAYER_ID" not in headers:
+        return []
+    i = headers.index("PLAYER_ID")
+    return [int(row[i]) for row in dataset.get("data", []) if row[i] is not None]
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop: run on a private loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _float_column(values: tuple[Any, ...]) -> list[float | None]:
+    """Coerce a whole column to floats.
+
+    Tracking numbers normally arrive already typed, so one comprehension
+    converts the column; any cell float() rejects ("", "N/A", ...) sends
+    the column down the per-cell _safe_float path instead.
+    """
+    try:
+        return [None if v is None else float(v) for v in values]
+    except (ValueError, TypeError):
+        return [PlayerTrackingIngestor._safe_float(v) for v in values]
+
+
+def _int_column(values: tuple[Any, ...]) -> list[int | None]:
+    """Coerce a whole column to ints; see _float_column."""
+    if all(v is None or type(v) is int for v in values):
+        return list(values)
+    return [PlayerTrackingIngestor._safe_int(v) for v in values]
+
+
+def _season_id(raw: dict[str, Any]) -> int:
+    """Season start year of a tracking payload (e.g. "2023-24" -> 2023)."""
+    season: str = raw.get("season") or "2023-24"
+    return int(season.split("-", maxsplit=1)[0])
+
+
+class _TrackingRows(list[tuple[Any, ...]]):
+    """Validated parameter tuples, tagged with the season they were fetched for."""
+
+    def __init__(self, rows: Iterable[tuple[Any, ...]], season_id: int) -> None:
+        super().__init__(rows)
+        self.season_id = season_id
+
 
-@register_ingestor
 class PlayerTrackingIngestor(BaseIngestor):
     """
     Ingestor for player tracking data from NBA.com Stats API.
@@ -47,7 +191,7 @@ class PlayerTrackingIngestor(BaseIngestor):
             rate_limiter: Rate limiter for API requests.
         """
         super().__init__(cache, rate_limiter)
-        self.nba_client = NBAStatsClient(cache, rate_limiter)
+        self.nba_client = get_nba_stats_client(cache, rate_limiter)
 
     def fetch(
         self,
@@ -84,9 +228,17 @@ class PlayerTrackingIngestor(BaseIngestor):
             # Fetch all players for a team
             team_id = int(entity_id.split(":")[1])
             self.logger.info("Fetching tracking data for team", team_id=team_id, season=season)
-            # Use team stats endpoint to get roster, then fetch tracking for each
-            # For now, return empty - this will be implemented with team endpoint
-            return {"team_id": team_id, "season": season, "players": []}
+            roster = self.nba_client.get_common_team_roster(team_id=team_id, season=season)
+            player_ids = _roster_player_ids(roster)
+            players = _run_coroutine(
+                self._gather_player_tracking(player_ids, season, season_type, **kwargs)
+            )
+            return {
+                "team_id": team_id,
+                "season": season,
+                "season_type": season_type,
+                "players": players,
+            }
         else:
             # Fetch single player
             player_id = int(entity_id)
@@ -108,6 +260,53 @@ class PlayerTrackingIngestor(BaseIngestor):
                 "data": data,
             }
 
+    async def _gather_player_tracking(
+        self,
+        player_ids: list[int],
+        season: str,
+        season_type: str,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch tracking data for every player on a roster concurrently.
+
+        At most ``_ROSTER_FETCH_CONCURRENCY`` requests are in flight at once.
+        Players whose request fails are logged and left out of the result.
+
+        Args:
+            player_ids: NBA player IDs from the team roster.
+            season: Season in format "YYYY-YY".
+            season_type: "Regular Season", "Playoffs", or "Pre Season".
+            **kwargs: Additional parameters for the API request.
+
+        Returns:
+            List of {"player_id", "data"} payloads, in roster order.
+        """
+        semaphore = asyncio.Semaphore(_ROSTER_FETCH_CONCURRENCY)
+
+        async def _one(player_id: int) -> dict[str, Any]:
+            async with semaphore:
+                data = await self.nba_client.get_player_tracking_async(
+                    player_id=player_id,
+                    season=season,
+                    season_type=season_type,
+                    **kwargs,
+                )
+            return {"player_id": player_id, "data": data}
+
+        results = await asyncio.gather(*(_one(pid) for pid in player_ids), return_exceptions=True)
+        players: list[dict[str, Any]] = []
+        for player_id, result in zip(player_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.warning(
+                    "Tracking fetch failed for roster player",
+                    player_id=player_id,
+                    error=str(result),
+                )
+                continue
+            players.append(result)
+        return players
+
     def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
         """
         Validate raw tracking data using Pydantic models.
@@ -121,224 +320,272 @@ class PlayerTrackingIngestor(BaseIngestor):
         Raises:
             pydantic.ValidationError: If validation fails.
         """
-        data = raw.get("data", {})
-        player_id: int | None = raw.get("player_id")
-        season: str = raw.get("season") or "2023-24"
+        validated_records: list[pydantic.BaseModel] = list(
+            self._validate_records(self._build_records(raw))
+        )
+        self.logger.info("Validated tracking records", count=len(validated_records))
+        return validated_records
 
-        validated_records: list[pydantic.BaseModel] = []
+    def _iter_validated_rows(self, raw: dict[str, Any]) -> Iterator[tuple[Any, ...]]:
+        """
+        Validate raw tracking data and yield upsert-ready parameter tuples.
 
-        # Extract season_id from season string (e.g., "2023-24" -> 2023)
-        season_year = int(season.split("-", maxsplit=1)[0])
-        season_id = season_year
+        Records are validated _COMMIT_BATCH at a time and converted straight
+        to _SQL_UPSERT_TRACKING tuples, so at most one batch of models is
+        alive at once. Payloads over _PARALLEL_VALIDATE_THRESHOLD records are
+        validated across a process pool instead.
 
-        # Process tracking stats data
-        # NBA.com returns multiple data sets, we want the overall stats
-        for _, dataset_data in data.items():
-            if not isinstance(dataset_data, dict):
-                continue
+        Args:
+            raw: Raw data dictionary from NBA.com API.
 
-            data_rows = dataset_data.get("data", [])
-            headers = dataset_data.get("headers", [])
+        Yields:
+            Parameter tuples in _SQL_UPSERT_TRACKING column order.
 
-            for row in data_rows:
-                try:
-                    # Map row data to field names using headers
-                    row_dict = dict(zip(headers, row, strict=False)) if headers else {}
-
-                    # Extract relevant tracking fields
-                    # player_id and team_id must be int for the model
-                    row_player_id = self._safe_int(row_dict.get("PLAYER_ID")) or player_id
-                    row_team_id = self._safe_int(row_dict.get("TEAM_ID"))
-                    if row_player_id is None or row_team_id is None:
-                        self.logger.warning(
-                            "Skipping tracking row: missing player_id or team_id",
-                            player_id=row_player_id,
-                            team_id=row_team_id,
-                        )
-                        continue
-                    game_id_val = row_dict.get("GAME_ID")
-                    game_id_str: str = (
-                        str(game_id_val) if game_id_val is not None else f"season_{season_id}"
-                    )
-
-                    validated_record = PlayerGameTrackingCreate(
-                        game_id=game_id_str,
-                        player_id=int(row_player_id),
-                        team_id=int(row_team_id),
-                        season_id=season_id,
-                        minutes_played=self._safe_float(row_dict.get("MIN")),
-                        distance_miles=self._safe_float(row_dict.get("DIST_MILES")),
-                        distance_miles_offensive=self._safe_float(row_dict.get("DIST_MILES_OFF")),
-                        distance_miles_defensive=self._safe_float(row_dict.get("DIST_MILES_DEF")),
-                        speed_mph_avg=self._safe_float(row_dict.get("SPD")),
-                        speed_mph_max=self._safe_float(row_dict.get("MAX_SPEED")),
-                        touches=self._safe_int(row_dict.get("TOUCHES")),
-                        touches_catch_shoot=self._safe_int(row_dict.get("EFC")),
-                        touches_paint=self._safe_int(row_dict.get("PAINT")),
-                        touches_post_up=self._safe_int(row_dict.get("POST")),
-                        drives=self._safe_int(row_dict.get("DRIVES")),
-                        drives_pts=self._safe_int(row_dict.get("DRIVES_PTS")),
-                        pull_up_shots=self._safe_int(row_dict.get("PULL_UP_FGA")),
-                        pull_up_shots_made=self._safe_int(row_dict.get("PULL_UP_FGM")),
-                    )
-                    validated_records.append(validated_record)
-
-                except pydantic.ValidationError as e:
-                    self.logger.error(
-                        "Tracking record validation failed",
-                        row_data=row_dict,
-                        errors=str(e),
-                    )
-                    raise
+        Raises:
+            pydantic.ValidationError: If validation fails.
+        """
+        records = self._build_records(raw)
+        if len(records) > _PARALLEL_VALIDATE_THRESHOLD:
+            yield from self._validate_parallel(records)
+            return
+        for batch in itertools.batched(records, _COMMIT_BATCH):
+            yield from map(_tracking_row, self._validate_records(list(batch)))
+
+    def _validate_parallel(self, records: list[dict[str, Any]]) -> Iterator[tuple[Any, ...]]:
+        """Validate records across a process pool, yielding tuples in input order."""
+        chunks = [list(c) for c in itertools.batched(records, _PARALLEL_VALIDATE_CHUNK)]
+        # forkserver: the ingest process runs rate-limiter / prefetch threads,
+        # which plain fork() cannot safely copy.
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver")) as pool:
+            for chunk, rows in zip(chunks, pool.map(_validate_chunk, chunks), strict=True):
+                if rows is not None:
+                    yield from rows
+                else:
+                    # Re-validate here to log the failing rows and raise
+                    yield from map(_tracking_row, self._validate_records(chunk))
 
-        self.logger.info("Validated tracking records", count=len(validated_records))
-        return validated_records
+    def _validate_records(self, records: list[dict[str, Any]]) -> list[PlayerGameTrackingCreate]:
+        """Validate record dicts, logging the rows that fail."""
+        try:
+            return _TRACKING_ADAPTER.validate_python(records)
+        except pydantic.ValidationError as e:
+            # Errors are located as (row index, field, ...)
+            failed_rows = sorted({int(err["loc"][0]) for err in e.errors()})
+            self.logger.error(
+                "Tracking record validation failed",
+                row_data=[records[i] for i in failed_rows],
+                errors=str(e),
+            )
+            raise
 
-    def upsert(self, model: list[pydantic.BaseModel], conn) -> int:
+    def _build_records(self, raw: dict[str, Any]) -> list[dict[str, Any]]:
         """
-        Insert or update validated tracking data in database.
+        Decode raw tracking result sets into model-shaped dicts.
 
         Args:
-            model: List of validated PlayerGameTrackingCreate models.
-            conn: SQLite database connection.
+            raw: Raw data dictionary from NBA.com API.
 
         Returns:
-            Number of rows affected.
+            One dict per usable row, keyed by PlayerGameTrackingCreate field.
         """
-        rows_affected = 0
+        season: str = raw.get("season") or "2023-24"
+        season_id = _season_id(raw)
+        # Team fetches carry one {"player_id", "data"} payload per roster player
+        payloads: list[dict[str, Any]] = raw.get("players") or [raw]
 
-        try:
-            conn.execute("BEGIN")
+        records: list[dict[str, Any]] = []
+        # Skip reasons are tallied and logged once; a per-row log call would
+        # run the structlog processor chain for every bad row.
+        skipped: Counter[str] = Counter()
 
-            for tracking_record in model:
-                if not isinstance(tracking_record, PlayerGameTrackingCreate):
-                    continue
+        # Process tracking stats data
+        # NBA.com returns multiple data sets, we want the overall stats
+        datasets = (
+            (payload.get("player_id"), dataset_data)
+            for payload in payloads
+            for dataset_data in (payload.get("data") or {}).values()
+        )
+        for player_id, dataset_data in datasets:
+            if not isinstance(dataset_data, dict):
+                continue
+
+            data_rows = dataset_data.get("data", [])
+            headers = dataset_data.get("headers", [])
 
-                # Check if record exists
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) FROM player_game_tracking
-                    WHERE game_id = ? AND player_id = ?
-                    """,
-                    (tracking_record.game_id, tracking_record.player_id),
+            # Resolve column positions once per result set instead of building
+            # a dict per row. Absent columns point at a trailing None pad slot.
+            width = len(headers)
+            pos = {h: i for i, h in enumerate(headers)}
+            i_player = pos.get("PLAYER_ID", width)
+            i_team = pos.get("TEAM_ID", width)
+            i_game = pos.get("GAME_ID", width)
+            float_cols = [(field, pos.get(col, width)) for field, col in _FLOAT_COLUMNS]
+            int_cols = [(field, pos.get(col, width)) for field, col in _INT_COLUMNS]
+
+            if not data_rows:
+                continue
+            # Column-major pass: pad ragged rows, transpose once, then coerce
+            # each numeric column with one comprehension instead of a helper
+            # call per cell.
+            columns = list(
+                zip(
+                    *(
+                        (*row, None) if len(row) == width else pad_row(row, width + 1)
+                        for row in data_rows
+                    ),
+                    strict=True,
                 )
-                exists = cursor.fetchone()[0] > 0
+            )
+            game_col = columns[i_game]
+            player_col = [v or player_id for v in _int_column(columns[i_player])]
+            team_col = _int_column(columns[i_team])
+            stat_cols: list[list[Any]] = [_float_column(columns[i]) for _, i in float_cols]
+            stat_cols += [_int_column(columns[i]) for _, i in int_cols]
+            # Release the transposed copy (including unused header columns)
+            # before the records for this result set are built.
+            del columns
+
+            for game_id_val, row_player_id, row_team_id, *stats in zip(
+                game_col, player_col, team_col, *stat_cols, strict=True
+            ):
+                # player_id and team_id must be int for the model
+                if row_player_id is None:
+                    skipped["missing_player_id"] += 1
+                    continue
+                if row_team_id is None:
+                    skipped["missing_team_id"] += 1
+                    continue
+                record: dict[str, Any] = dict(zip(_STAT_FIELDS, stats, strict=True))
+                record["game_id"] = (
+                    str(game_id_val) if game_id_val is not None else f"season_{season_id}"
+                )
+                record["player_id"] = int(row_player_id)
+                record["team_id"] = row_team_id
+                record["season_id"] = season_id
+                records.append(record)
 
-                if exists:
-                    # Update existing record
-                    self._update_tracking(tracking_record, conn)
-                    rows_affected += 1
-                else:
-                    # Insert new record
-                    self._insert_tracking(tracking_record, conn)
-                    rows_affected += 1
+        if skipped:
+            self.logger.warning("Skipped tracking rows", season=season, **skipped)
+        return records
 
-            upsert_audit(conn, self.entity_type, "all", "nba_stats_api", "SUCCESS", rows_affected)
-            conn.execute("COMMIT")
+    def validated_rows(self, raw: dict[str, Any]) -> list[Any]:
+        """
+        Validate every row up front, keeping parameter tuples instead of models.
 
-        except sqlite3.IntegrityError as exc:
-            conn.execute("ROLLBACK")
-            self.logger.warning(
-                "Integrity error during tracking upsert",
-                rows_before_error=rows_affected,
-                error=str(exc),
-            )
-            raise
-        except sqlite3.OperationalError as exc:
-            conn.execute("ROLLBACK")
-            self.logger.error(
-                "Operational error during tracking upsert",
-                rows_before_error=rows_affected,
-                error=str(exc),
-            )
-            raise
+        Nothing is written until the whole payload has validated, so a bad
+        row in a later batch cannot leave earlier chunks committed.
 
-        return rows_affected
+        Args:
+            raw: Raw data dictionary from NBA.com API.
+
+        Returns:
+            _SQL_UPSERT_TRACKING parameter tuples, tagged with the season.
 
-    def _insert_tracking(self, tracking: PlayerGameTrackingCreate, conn) -> None:
+        Raises:
+            pydantic.ValidationError: If validation fails.
         """
-        Insert a new tracking record into the database.
+        return _TrackingRows(self._iter_validated_rows(raw), _season_id(raw))
+
+    def upsert(self, model: Iterable[pydantic.BaseModel | tuple[Any, ...]], conn) -> int:
+        """
+        Insert or update validated tracking data in database.
 
         Args:
-            tracking: PlayerGameTrackingCreate model.
+            model: Validated PlayerGameTrackingCreate models (other types are
+                skipped), or parameter tuples from validated_rows(). One call
+                covers one season's fetch.
             conn: SQLite database connection.
+
+        Returns:
+            Number of rows inserted or changed; conflicting rows whose values
+            are unchanged are skipped and not counted.
         """
-        conn.execute(
-            """
-            INSERT INTO player_game_tracking (
-                game_id, player_id, team_id, season_id, minutes_played,
-                distance_miles, distance_miles_offensive, distance_miles_defensive,
-                speed_mph_avg, speed_mph_max, touches, touches_catch_shoot,
-                touches_paint, touches_post_up, drives, drives_pts,
-                pull_up_shots, pull_up_shots_made
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                tracking.game_id,
-                tracking.player_id,
-                tracking.team_id,
-                tracking.season_id,
-                tracking.minutes_played,
-                tracking.distance_miles,
-                tracking.distance_miles_offensive,
-                tracking.distance_miles_defensive,
-                tracking.speed_mph_avg,
-                tracking.speed_mph_max,
-                tracking.touches,
-                tracking.touches_catch_shoot,
-                tracking.touches_paint,
-                tracking.touches_post_up,
-                tracking.drives,
-                tracking.drives_pts,
-                tracking.pull_up_shots,
-                tracking.pull_up_shots_made,
-            ),
-        )
+        rows: list[tuple[Any, ...]]
+        if isinstance(model, _TrackingRows):
+            rows = model
+        else:
+            rows = [
+                _tracking_row(r) if isinstance(r, PlayerGameTrackingCreate) else r
+                for r in model
+                if isinstance(r, (PlayerGameTrackingCreate, tuple))
+            ]
+        # One aggregated audit row for the whole upsert, keyed by the fetched
+        # season (shared by every row) so ingesting one season does not
+        # overwrite another's record.
+        if isinstance(model, _TrackingRows):
+            audit_id = str(model.season_id)
+        else:
+            audit_id = str(rows[0][_SEASON_ID_POS]) if rows else "all"
+        if not rows:
+            conn.execute("BEGIN")
+            upsert_audit(conn, self.entity_type, audit_id, "nba_stats_api", "SUCCESS", 0)
+            conn.execute("COMMIT")
+            return 0
+
+        # Full-season loads rebuild the secondary indexes once at the end
+        # instead of maintaining them row by row.
+        defer = len(rows) > _DEFER_INDEX_THRESHOLD
+        with deferred_indexes(conn, "player_game_tracking") if defer else nullcontext():
+            return self._write_chunks(rows, audit_id, conn)
 
-    def _update_tracking(self, tracking: PlayerGameTrackingCreate, conn) -> None:
+    def _write_chunks(self, records: Iterable[tuple[Any, ...]], audit_id: str, conn) -> int:
         """
-        Update an existing tracking record in the database.
+        Upsert records in _COMMIT_BATCH-sized transactions.
 
         Args:
-            tracking: PlayerGameTrackingCreate model.
+            records: _SQL_UPSERT_TRACKING parameter tuples.
+            audit_id: ingestion_audit entity_id for this upsert.
             conn: SQLite database connection.
+
+        Returns:
+            Number of rows affected.
         """
-        conn.execute(
-            """
-            UPDATE player_game_tracking SET
-                team_id = ?, season_id = ?, minutes_played = ?,
-                distance_miles = ?, distance_miles_offensive = ?,
-                distance_miles_defensive = ?, speed_mph_avg = ?, speed_mph_max = ?,
-                touches = ?, touches_catch_shoot = ?, touches_paint = ?,
-                touches_post_up = ?, drives = ?, drives_pts = ?,
-                pull_up_shots = ?, pull_up_shots_made = ?
-            WHERE game_id = ? AND player_id = ?
-            """,
-            (
-                tracking.team_id,
-                tracking.season_id,
-                tracking.minutes_played,
-                tracking.distance_miles,
-                tracking.distance_miles_offensive,
-                tracking.distance_miles_defensive,
-                tracking.speed_mph_avg,
-                tracking.speed_mph_max,
-                tracking.touches,
-                tracking.touches_catch_shoot,
-                tracking.touches_paint,
-                tracking.touches_post_up,
-                tracking.drives,
-                tracking.drives_pts,
-                tracking.pull_up_shots,
-                tracking.pull_up_shots_made,
-                tracking.game_id,
-                tracking.player_id,
-            ),
-        )
+        rows_affected = 0
+        for chunk in itertools.batched(records, _COMMIT_BATCH):
+            conn.execute("BEGIN")
+            try:
+                # executemany's rowcount sums sqlite3_changes() per row: rows
+                # inserted or updated, excluding no-op conflicts and triggers.
+                chunk_changes = conn.executemany(_SQL_UPSERT_TRACKING, chunk).rowcount
+                # The audit row always reflects the rows committed so far
+                upsert_audit(
+                    conn,
+                    self.entity_type,
+                    audit_id,
+                    "nba_stats_api",
+                    "SUCCESS",
+                    rows_affected + chunk_changes,
+                )
+                conn.execute("COMMIT")
+            except sqlite3.IntegrityError as exc:
+                # Only the failing chunk is rolled back; earlier chunks stay committed
+                conn.execute("ROLLBACK")
+                self.logger.warning(
+                    "Integrity error during tracking upsert",
+                    rows_before_error=rows_affected,
+                    error=str(exc),
+                )
+                raise
+            except sqlite3.OperationalError as exc:
+                conn.execute("ROLLBACK")
+                self.logger.error(
+                    "Operational error during tracking upsert",
+                    rows_before_error=rows_affected,
+                    error=str(exc),
+                )
+                raise
+            rows_affected += chunk_changes
+        return rows_affected
 
     @staticmethod
     def _safe_float(value: Any) -> float | None:
         """Safely convert value to float, returning None for empty/invalid values."""
+        # Exact-type checks first: typed API numbers skip the == "" comparison
+        t = type(value)
+        if t is float:
+            return value
+        if t is int:
+            return float(value)
         if value is None or value == "":
             return None
         try:
@@ -349,9 +596,16 @@ class PlayerTrackingIngestor(BaseIngestor):
     @staticmethod
     def _safe_int(value: Any) -> int | None:
         """Safely convert value to int, returning None for empty/invalid values."""
+        t = type(value)
+        if t is int:
+            return value
         if value is None or value == "":
             return None
         try:
-            return int(float(value))  # Convert to float first to handle "1.0"
-        except (ValueError, TypeError):
+            # Floats and integer strings convert directly; only "1.0"-style
+            # strings need the float() hop.
+            if t is float or (t is str and value.isdigit()):
+                return int(value)
+            return int(float(value))
+        except (ValueError, TypeError, OverflowError):
             return None
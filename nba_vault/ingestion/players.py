@@ -1,5 +1,7 @@
 """Player data ingestor."""
 
+import itertools
+import operator
 import sqlite3
 from typing import Any, cast
 
@@ -8,14 +10,72 @@ import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
 from nba_vault.ingestion.basketball_reference import BasketballReferenceClient
-from nba_vault.ingestion.registry import register_ingestor
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.players import BasketballReferencePlayer, PlayerCreate
 
 logger = structlog.get_logger(__name__)
 
+_SQL_INSERT_PLAYER = """
+    INSERT INTO player (
+        player_id, first_name, last_name, full_name, display_name,
+        birthdate, birthplace_city, birthplace_state, birthplace_country,
+        height_inches, weight_lbs, position, primary_position,
+        jersey_number, college, country, draft_year, draft_round,
+        draft_number, is_active, from_year, to_year, bbref_id,
+        data_availability_flags
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_PLAYER = """
+    UPDATE player SET
+        first_name = ?, last_name = ?, full_name = ?, display_name = ?,
+        birthdate = ?, birthplace_city = ?, birthplace_state = ?, birthplace_country = ?,
+        height_inches = ?, weight_lbs = ?, position = ?, primary_position = ?,
+        jersey_number = ?, college = ?, country = ?, draft_year = ?,
+        draft_round = ?, draft_number = ?, is_active = ?,
+        from_year = ?, to_year = ?, bbref_id = ?,
+        data_availability_flags = ?
+    WHERE player_id = ?
+"""
+
+# is_active is a plain bool, which sqlite3 binds as 0/1.
+_PLAYER_VALUE_COLUMNS = (
+    "first_name",
+    "last_name",
+    "full_name",
+    "display_name",
+    "birthdate",
+    "birthplace_city",
+    "birthplace_state",
+    "birthplace_country",
+    "height_inches",
+    "weight_lbs",
+    "position",
+    "primary_position",
+    "jersey_number",
+    "college",
+    "country",
+    "draft_year",
+    "draft_round",
+    "draft_number",
+    "is_active",
+    "from_year",
+    "to_year",
+    "bbref_id",
+    "data_availability_flags",
+)
+_player_insert_row = operator.attrgetter("player_id", *_PLAYER_VALUE_COLUMNS)
+_player_update_row = operator.attrgetter(*_PLAYER_VALUE_COLUMNS, "player_id")
+
+# bbref_ids per lookup query; stays under SQLite's 999 host-parameter limit.
+_BBREF_LOOKUP_CHUNK = 900
+
+# Players written per transaction; see player_tracking._COMMIT_BATCH.
+_COMMIT_BATCH = 10_000
+
+_PLAYER_ADAPTER = pydantic.TypeAdapter(list[BasketballReferencePlayer])
+
 
-@register_ingestor
 class PlayersIngestor(BaseIngestor):
     """
     Ingestor for player data from Basketball Reference.
@@ -83,20 +143,21 @@ class PlayersIngestor(BaseIngestor):
         """
         players_data = raw.get("players", [])
 
-        validated_players = []
-        for player_data in players_data:
-            try:
-                # Validate individual player data
-                validated_player = BasketballReferencePlayer(**player_data)
-                validated_players.append(validated_player)
-            except pydantic.ValidationError as e:
-                self.logger.exception(
-                    "player_validation_failed",
-                    player_slug=player_data.get("slug", "<unknown>"),
-                    error_count=len(e.errors()),
-                    errors=e.errors(),
-                )
-                raise
+        try:
+            validated_players: list[pydantic.BaseModel] = list(
+                _PLAYER_ADAPTER.validate_python(players_data)
+            )
+        except pydantic.ValidationError as e:
+            # Errors are located as (row index, field, ...); report the first bad row
+            first_bad = e.errors()[0]["loc"][0]
+            player_data = players_data[first_bad] if isinstance(first_bad, int) else {}
+            self.logger.exception(
+                "player_validation_failed",
+                player_slug=player_data.get("slug", "<unknown>"),
+                error_count=len(e.errors()),
+                errors=e.errors(),
+            )
+            raise
 
         self.logger.info("Validated players", count=len(validated_players))
         return validated_players
@@ -114,152 +175,101 @@ class PlayersIngestor(BaseIngestor):
         """
         rows_affected = 0
 
-        try:
-            conn.execute("BEGIN")
-
-            for validated_player in model:
-                # Convert BasketballReferencePlayer to PlayerCreate
-                br_player = cast("BasketballReferencePlayer", validated_player)
-                player_create = PlayerCreate.from_basketball_reference(br_player)
+        # Next free id for players without an NBA.com person_id; read once and
+        # advanced locally instead of re-running MAX(player_id) per insert.
+        next_id = conn.execute("SELECT COALESCE(MAX(player_id), 0) FROM player").fetchone()[0] + 1
 
-                # Check if player exists by bbref_id
-                cursor = conn.execute(
-                    "SELECT player_id FROM player WHERE bbref_id = ?", (player_create.bbref_id,)
+        for chunk in itertools.batched(model, _COMMIT_BATCH):
+            conn.execute("BEGIN")
+            chunk_rows = 0
+            try:
+                players = [
+                    PlayerCreate.from_basketball_reference(
+                        cast("BasketballReferencePlayer", validated_player)
+                    )
+                    for validated_player in chunk
+                ]
+                existing = _player_ids_by_bbref(conn, [p.bbref_id for p in players])
+
+                inserts: list[tuple[Any, ...]] = []
+                updates: list[tuple[Any, ...]] = []
+                for player_create in players:
+                    player_id = existing.get(player_create.bbref_id)
+                    if player_id is not None:
+                        # Update existing player
+                        player_create.player_id = player_id
+                        updates.append(_player_update_row(player_create))
+                    else:
+                        # Insert new player
+                        # Use nba_person_id as player_id if available, else next free id
+                        if player_create.player_id is None:
+                            player_create.player_id = next_id
+                        next_id = max(next_id, player_create.player_id + 1)
+                        inserts.append(_player_insert_row(player_create))
+                        # A repeat of this bbref_id later in the chunk updates it;
+                        # updates run after inserts, as they would row-by-row
+                        if player_create.bbref_id is not None:
+                            existing[player_create.bbref_id] = player_create.player_id
+
+                conn.executemany(_SQL_INSERT_PLAYER, inserts)
+                conn.executemany(_SQL_UPDATE_PLAYER, updates)
+                chunk_rows = len(players)
+                upsert_audit(
+                    conn,
+                    self.entity_type,
+                    "all",
+                    "basketball_reference",
+                    "SUCCESS",
+                    rows_affected + chunk_rows,
                 )
-                existing = cursor.fetchone()
-
-                if existing:
-                    # Update existing player
-                    player_create.player_id = existing[0]
-                    self._update_player(player_create, conn)
-                    rows_affected += 1
-                else:
-                    # Insert new player
-                    # Use nba_person_id as player_id if available, else auto-increment
-                    if player_create.player_id is None:
-                        cursor = conn.execute("SELECT COALESCE(MAX(player_id), 0) FROM player")
-                        max_id = cursor.fetchone()[0]
-                        player_create.player_id = max_id + 1
-
-                    self._insert_player(player_create, conn)
-                    rows_affected += 1
-
-            upsert_audit(
-                conn, self.entity_type, "all", "basketball_reference", "SUCCESS", rows_affected
-            )
-            conn.execute("COMMIT")
+                conn.execute("COMMIT")
+
+            except sqlite3.IntegrityError as exc:
+                # Only the failing chunk is rolled back; earlier chunks stay committed
+                conn.execute("ROLLBACK")
+                self.logger.warning(
+                    "player_upsert_integrity_error",
+                    rows_before_error=rows_affected + chunk_rows,
+                    error=str(exc),
+                    exc_info=True,
+                )
+                raise
+            except sqlite3.OperationalError as exc:
+                conn.execute("ROLLBACK")
+                self.logger.exception(
+                    "player_upsert_operational_error",
+                    rows_before_error=rows_affected + chunk_rows,
+                    error=str(exc),
+                )
+                raise
+            rows_affected += chunk_rows
 
-        except sqlite3.IntegrityError as exc:
-            conn.execute("ROLLBACK")
-            self.logger.warning(
-                "player_upsert_integrity_error",
-                rows_before_error=rows_affected,
-                error=str(exc),
-                exc_info=True,
-            )
-            raise
-        except sqlite3.OperationalError as exc:
-            conn.execute("ROLLBACK")
-            self.logger.exception(
-                "player_upsert_operational_error",
-                rows_before_error=rows_affected,
-                error=str(exc),
-            )
-            raise
+        if not model:
+            conn.execute("BEGIN")
+            upsert_audit(conn, self.entity_type, "all", "basketball_reference", "SUCCESS", 0)
+            conn.execute("COMMIT")
 
         return rows_affected
 
-    def _insert_player(self, player: PlayerCreate, conn) -> None:
-        """
-        Insert a new player into the database.
 
-        Args:
-            player: PlayerCreate model.
-            conn: SQLite database connection.
-        """
-        conn.execute(
-            """
-            INSERT INTO player (
-                player_id, first_name, last_name, full_name, display_name,
-                birthdate, birthplace_city, birthplace_state, birthplace_country,
-                height_inches, weight_lbs, position, primary_position,
-                jersey_number, college, country, draft_year, draft_round,
-                draft_number, is_active, from_year, to_year, bbref_id,
-                data_availability_flags
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                player.player_id,
-                player.first_name,
-                player.last_name,
-                player.full_name,
-                player.display_name,
-                player.birthdate,
-                player.birthplace_city,
-                player.birthplace_state,
-                player.birthplace_country,
-                player.height_inches,
-                player.weight_lbs,
-                player.position,
-                player.primary_position,
-                player.jersey_number,
-                player.college,
-                player.country,
-                player.draft_year,
-                player.draft_round,
-                player.draft_number,
-                1 if player.is_active else 0,  # Convert bool to int
-                player.from_year,
-                player.to_year,
-                player.bbref_id,
-                player.data_availability_flags,
-            ),
-        )
+def _player_ids_by_bbref(conn, bbref_ids: list[str | None]) -> dict[str, int]:
+    """
+    Map bbref_id -> player_id for the given ids that already exist.
 
-    def _update_player(self, player: PlayerCreate, conn) -> None:
-        """
-        Update an existing player in the database.
+    Looks ids up with IN-queries of at most _BBREF_LOOKUP_CHUNK parameters
+    (under SQLite's default host-parameter limit) instead of one SELECT each.
 
-        Args:
-            player: PlayerCreate model.
-            conn: SQLite database connection.
-        """
-        conn.execute(
-            """
-            UPDATE player SET
-                first_name = ?, last_name = ?, full_name = ?, display_name = ?,
-                birthdate = ?, birthplace_city = ?, birthplace_state = ?, birthplace_country = ?,
-                height_inches = ?, weight_lbs = ?, position = ?, primary_position = ?,
-                jersey_number = ?, college = ?, country = ?, draft_year = ?,
-                draft_round = ?, draft_number = ?, is_active = ?,
-                from_year = ?, to_year = ?, bbref_id = ?,
-                data_availability_flags = ?
-            WHERE player_id = ?
-            """,
-            (
-                player.first_name,
-                player.last_name,
-                player.full_name,
-                player.display_name,
-                player.birthdate,
-                player.birthplace_city,
-                player.birthplace_state,
-                player.birthplace_country,
-                player.height_inches,
-                player.weight_lbs,
-                player.position,
-                player.primary_position,
-                player.jersey_number,
-                player.college,
-                player.country,
-                player.draft_year,
-                player.draft_round,
-                player.draft_number,
-                1 if player.is_active else 0,
-                player.from_year,
-                player.to_year,
-                player.bbref_id,
-                player.data_availability_flags,
-                player.player_id,
-            ),
+    Args:
+        conn: SQLite database connection.
+        bbref_ids: Basketball-Reference ids; None entries are ignored.
+    """
+    ids = list({i for i in bbref_ids if i is not None})
+    found: dict[str, int] = {}
+    for batch in itertools.batched(ids, _BBREF_LOOKUP_CHUNK):
+        placeholders = ",".join("?" * len(batch))
+        cursor = conn.execute(
+            f"SELECT bbref_id, player_id FROM player WHERE bbref_id IN ({placeholders})",  # noqa: S608
+            batch,
         )
+        found.update((row[0], row[1]) for row in cursor)
+    return found
@@ -10,7 +10,8 @@ NBA.com API cannot cover. For 1996+ seasons, the shufinskiy/nba_data ingestor
 where the game already has box score data to avoid duplicates.
 
 The Kaggle dataset requires a manual download because Kaggle requires
-authentication. The ingestor accepts a local file path to PlayerStatistics.csv.
+authentication. The ingestor accepts a local file path to PlayerStatistics.csv,
+optionally gzip- or zstd-compressed (detected from the file's leading bytes).
 
 Usage:
     # Download PlayerStatistics.csv from Kaggle first, then:
@@ -40,16 +41,24 @@ Column mapping (eoinamoore → player_game_log):
 
 from __future__ import annotations
 
-import csv
 import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
 from nba_vault.ingestion.validation import upsert_audit
+from nba_vault.schema.connection import deferred_indexes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 logger = structlog.get_logger(__name__)
 
@@ -57,8 +66,162 @@ logger = structlog.get_logger(__name__)
 # Set to None to load all seasons (useful for a full refresh)
 _PRE_MODERN_CUTOFF_SEASON = 1996
 
+# PlayerStatistics.csv box score columns, in _BOX_SCORE_COLUMNS order after
+# minutes_played. *Percentage columns are floats, the rest integers.
+_STAT_COLUMNS = (
+    "fieldGoalsMade",
+    "fieldGoalsAttempted",
+    "fieldGoalsPercentage",
+    "threePointersMade",
+    "threePointersAttempted",
+    "threePointersPercentage",
+    "freeThrowsMade",
+    "freeThrowsAttempted",
+    "freeThrowsPercentage",
+    "reboundsOffensive",
+    "reboundsDefensive",
+    "reboundsTotal",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "foulsPersonal",
+    "points",
+    "plusMinusPoints",
+)
+
+# Every column read from the CSV. seasonYear and season_year are alternate
+# spellings; the first non-zero value wins.
+_CSV_COLUMNS = (
+    "gameId",
+    "personId",
+    "teamId",
+    "seasonYear",
+    "season_year",
+    "minutes",
+    *_STAT_COLUMNS,
+)
+
+# Bytes of CSV tokenised per pyarrow block; each block is FK-checked and
+# written with one executemany() call (~10k rows per MB for this file).
+_CSV_BLOCK_BYTES = 1 << 20
+
+# Leading bytes of compressed inputs, mapped to the pyarrow codec that
+# decompresses them while streaming (PlayerStatistics.csv.gz / .csv.zst)
+_COMPRESSION_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+
+# Decoded blocks the reader thread may run ahead of the SQLite writer
+_READ_AHEAD_BLOCKS = 4
+
+# CSVs larger than this drop player_game_log's secondary indexes for the load
+# and rebuild them afterwards (see deferred_indexes); ~10k rows at ~100 bytes
+# per row, below which the rebuild costs more than it saves.
+_DEFER_INDEX_BYTES = 1 << 20
+
+# Cells treated as missing
+_NULL_TOKENS = frozenset(("", "None", "none", "null", "NULL", "NA"))
+
+# SQLite's csv loadable extension (ext/misc/csv.c) and the temp virtual table
+# the bulk path reads it through.
+_CSV_EXTENSION = "csv"
+_BULK_TABLE = "pre_modern_raw"
+
+# player_game_log columns written, in parameter order
+_BOX_SCORE_FIELDS = (
+    "game_id",
+    "player_id",
+    "team_id",
+    "season_id",
+    "minutes_played",
+    "fgm",
+    "fga",
+    "fg_pct",
+    "fg3m",
+    "fg3a",
+    "fg3_pct",
+    "ftm",
+    "fta",
+    "ft_pct",
+    "oreb",
+    "dreb",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "pf",
+    "pts",
+    "plus_minus",
+)
+_BOX_SCORE_COLUMNS = ", ".join(_BOX_SCORE_FIELDS)
+
+# Some seasons store percentages as 0-100 rather than 0-1; rescaled in SQL so
+# Python hands over the parsed value untouched.
+_SQL_PCT = "CASE WHEN {0} > 1.0 THEN {0} / 100.0 ELSE {0} END"
+
+_SQL_ON_CONFLICT = """
+    ON CONFLICT(game_id, player_id, team_id) DO UPDATE SET
+        minutes_played = excluded.minutes_played,
+        fgm            = excluded.fgm,
+        fga            = excluded.fga,
+        fg_pct         = excluded.fg_pct,
+        fg3m           = excluded.fg3m,
+        fg3a           = excluded.fg3a,
+        fg3_pct        = excluded.fg3_pct,
+        ftm            = excluded.ftm,
+        fta            = excluded.fta,
+        ft_pct         = excluded.ft_pct,
+        oreb           = excluded.oreb,
+        dreb           = excluded.dreb,
+        reb            = excluded.reb,
+        ast            = excluded.ast,
+        stl            = excluded.stl,
+        blk            = excluded.blk,
+        tov            = excluded.tov,
+        pf             = excluded.pf,
+        pts            = excluded.pts,
+        plus_minus     = excluded.plus_minus
+"""
+
+# Keeps rows whose game and player exist; the staged/selected rows are aliased b
+_SQL_FK_FILTER = """
+    WHERE EXISTS (SELECT 1 FROM game g WHERE g.game_id = b.game_id)
+      AND EXISTS (SELECT 1 FROM player p WHERE p.player_id = b.player_id)
+"""
+
+# Unconstrained temp table each CSV block is staged into before the FK join
+_STAGING_TABLE = "pre_modern_staging"
+
+# Same column types as player_game_log, none of its constraints or indexes
+_SQL_CREATE_STAGING = (
+    f"CREATE TEMP TABLE {_STAGING_TABLE} AS "  # noqa: S608
+    f"SELECT {_BOX_SCORE_COLUMNS} FROM player_game_log LIMIT 0"
+)
+
+_STAGING_PLACEHOLDERS = ", ".join("?" * len(_BOX_SCORE_FIELDS))
+_SQL_STAGE_BOX_SCORE = f"INSERT INTO temp.{_STAGING_TABLE} VALUES ({_STAGING_PLACEHOLDERS})"  # noqa: S608
+
+_STAGED_SELECT = ", ".join(
+    _SQL_PCT.format(f"b.{field}") if field.endswith("_pct") else f"b.{field}"
+    for field in _BOX_SCORE_FIELDS
+)
+_SQL_UPSERT_STAGED_BOX_SCORES = (
+    f"INSERT INTO player_game_log ({_BOX_SCORE_COLUMNS}) "  # noqa: S608
+    f"SELECT {_STAGED_SELECT} FROM temp.{_STAGING_TABLE} AS b "
+    f"{_SQL_FK_FILTER} {_SQL_ON_CONFLICT}"
+)
+
+# Rows with a game_id and player_id that the FK filter will drop, per reason
+_SQL_COUNT_STAGED_SKIPS = f"""
+    SELECT
+        SUM(NOT EXISTS (SELECT 1 FROM game g WHERE g.game_id = b.game_id)),
+        SUM(EXISTS (SELECT 1 FROM game g WHERE g.game_id = b.game_id)
+            AND NOT EXISTS (SELECT 1 FROM player p WHERE p.player_id = b.player_id))
+    FROM temp.{_STAGING_TABLE} AS b
+    WHERE b.game_id != '' AND b.player_id IS NOT NULL
+"""  # noqa: S608
+
 
-@register_ingestor
 class PreModernBoxScoreIngestor(BaseIngestor):
     """
     Bulk ingestor for pre-1996 NBA player box scores from eoinamoore Kaggle dataset.
@@ -74,6 +237,8 @@ class PreModernBoxScoreIngestor(BaseIngestor):
         result = ingestor.ingest("/path/to/PlayerStatistics.csv", conn)
         # Load all seasons (including 1996+):
         result = ingestor.ingest("/path/to/PlayerStatistics.csv", conn, all_seasons=True)
+        # Full refresh through SQLite's csv extension, when it can be loaded:
+        result = ingestor.ingest("/path/to/PlayerStatistics.csv", conn, bulk=True)
     """
 
     entity_type = "pre_modern_box_scores"
@@ -89,27 +254,18 @@ class PreModernBoxScoreIngestor(BaseIngestor):
             raise FileNotFoundError(msg)
 
         all_seasons: bool = kwargs.get("all_seasons", False)
+        bulk: bool = kwargs.get("bulk", False)
         cutoff = None if all_seasons else _PRE_MODERN_CUTOFF_SEASON
 
         self.logger.info(
             "Reading pre-modern box score CSV",
             path=str(csv_path),
             cutoff_season=cutoff,
+            bulk=bulk,
         )
 
-        rows: list[dict[str, str]] = []
-        with csv_path.open(encoding="utf-8", newline="") as fh:
-            reader = csv.DictReader(fh)
-            for row in reader:
-                # Filter by season if cutoff is set
-                if cutoff is not None:
-                    season_year = _extract_season_year(row)
-                    if season_year is not None and season_year >= cutoff:
-                        continue
-                rows.append(row)
-
-        self.logger.info("Read CSV rows", count=len(rows), cutoff=cutoff)
-        return {"rows": rows, "csv_path": str(csv_path)}
+        # Rows are streamed from disk in upsert() rather than held in memory
+        return {"csv_path": str(csv_path), "cutoff": cutoff, "bulk": bulk}
 
     def validate(self, raw: dict[str, Any]) -> list[Any]:
         # Row-level validation happens in upsert; return raw payload
@@ -119,106 +275,64 @@ class PreModernBoxScoreIngestor(BaseIngestor):
         if not model:
             return 0
         payload = model[0]
-        rows: list[dict[str, str]] = payload.get("rows", [])
         csv_path: str = payload.get("csv_path", "unknown")
+        cutoff: int | None = payload.get("cutoff", _PRE_MODERN_CUTOFF_SEASON)
+
+        # Full-file loads rebuild the secondary indexes once at the end
+        # instead of maintaining them row by row.
+        defer = Path(csv_path).stat().st_size > _DEFER_INDEX_BYTES
+        with deferred_indexes(conn, "player_game_log") if defer else nullcontext():
+            bulk = payload.get("bulk", False)
+            if bulk and _sniff_compression(Path(csv_path)):
+                # The csv extension only reads plain text
+                self.logger.info("Compressed CSV, streaming instead of bulk load")
+                bulk = False
+            if bulk and _attach_csv(conn, csv_path):
+                inserted = self._upsert_bulk(conn, cutoff)
+            else:
+                inserted = self._upsert_streamed(conn, Path(csv_path), cutoff)
 
-        # Build player_id lookup: bbref_id → player_id (for cross-referencing)
+        upsert_audit(
+            conn,
+            self.entity_type,
+            csv_path,
+            "kaggle_eoinamoore",
+            "SUCCESS",
+            inserted,
+        )
+        return inserted
+
+    def _upsert_streamed(self, conn: Any, csv_path: Path, cutoff: int | None) -> int:
+        """Load the CSV block by block through pyarrow and a temp staging table."""
         # eoinamoore uses NBA.com personId which maps directly to player.player_id
         inserted = 0
         skipped_no_game = 0
         skipped_no_player = 0
 
+        cur = conn.cursor()
+        conn.execute(f"DROP TABLE IF EXISTS temp.{_STAGING_TABLE}")
+        conn.execute(_SQL_CREATE_STAGING)
         conn.execute("BEGIN")
         try:
-            for row in rows:
-                game_id = _normalise_game_id(row.get("gameId", ""))
-                player_id = _safe_int(row.get("personId"))
-                team_id = _safe_int(row.get("teamId"))
-
-                if not game_id or player_id is None:
-                    continue
-
-                # Skip if game not in game table (FK constraint)
-                if not _game_exists(conn, game_id):
-                    skipped_no_game += 1
-                    continue
-
-                # Skip if player not in player table
-                if not _player_exists(conn, player_id):
-                    skipped_no_player += 1
-                    continue
-
-                minutes_played = _parse_minutes(row.get("minutes", ""))
-                fg_pct = _safe_float(row.get("fieldGoalsPercentage"))
-                fg3_pct = _safe_float(row.get("threePointersPercentage"))
-                ft_pct = _safe_float(row.get("freeThrowsPercentage"))
-
-                conn.execute(
-                    """
-                    INSERT INTO player_game_log
-                        (game_id, player_id, team_id, season_id,
-                         minutes_played,
-                         fgm, fga, fg_pct,
-                         fg3m, fg3a, fg3_pct,
-                         ftm, fta, ft_pct,
-                         oreb, dreb, reb,
-                         ast, stl, blk, tov, pf, pts,
-                         plus_minus)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT(game_id, player_id, team_id) DO UPDATE SET
-                        minutes_played = excluded.minutes_played,
-                        fgm            = excluded.fgm,
-                        fga            = excluded.fga,
-                        fg_pct         = excluded.fg_pct,
-                        fg3m           = excluded.fg3m,
-                        fg3a           = excluded.fg3a,
-                        fg3_pct        = excluded.fg3_pct,
-                        ftm            = excluded.ftm,
-                        fta            = excluded.fta,
-                        ft_pct         = excluded.ft_pct,
-                        oreb           = excluded.oreb,
-                        dreb           = excluded.dreb,
-                        reb            = excluded.reb,
-                        ast            = excluded.ast,
-                        stl            = excluded.stl,
-                        blk            = excluded.blk,
-                        tov            = excluded.tov,
-                        pf             = excluded.pf,
-                        pts            = excluded.pts,
-                        plus_minus     = excluded.plus_minus
-                    """,
-                    (
-                        game_id,
-                        player_id,
-                        team_id,
-                        _extract_season_year(row),
-                        minutes_played,
-                        _safe_int(row.get("fieldGoalsMade")),
-                        _safe_int(row.get("fieldGoalsAttempted")),
-                        fg_pct / 100.0 if fg_pct and fg_pct > 1.0 else fg_pct,
-                        _safe_int(row.get("threePointersMade")),
-                        _safe_int(row.get("threePointersAttempted")),
-                        fg3_pct / 100.0 if fg3_pct and fg3_pct > 1.0 else fg3_pct,
-                        _safe_int(row.get("freeThrowsMade")),
-                        _safe_int(row.get("freeThrowsAttempted")),
-                        ft_pct / 100.0 if ft_pct and ft_pct > 1.0 else ft_pct,
-                        _safe_int(row.get("reboundsOffensive")),
-                        _safe_int(row.get("reboundsDefensive")),
-                        _safe_int(row.get("reboundsTotal")),
-                        _safe_int(row.get("assists")),
-                        _safe_int(row.get("steals")),
-                        _safe_int(row.get("blocks")),
-                        _safe_int(row.get("turnovers")),
-                        _safe_int(row.get("foulsPersonal")),
-                        _safe_int(row.get("points")),
-                        _safe_int(row.get("plusMinusPoints")),
-                    ),
-                )
-                inserted += 1
+            # Blocks are read and decoded on a background thread while this
+            # thread, the connection's only user, writes the previous ones.
+            # Peak memory is _READ_AHEAD_BLOCKS blocks, not the whole file.
+            for rows in _read_ahead(_iter_batches(csv_path, cutoff), _READ_AHEAD_BLOCKS):
+                # Stage the block unfiltered, then let SQLite apply the game /
+                # player FK checks as it copies, instead of a hash probe per
+                # row in Python
+                cur.executemany(_SQL_STAGE_BOX_SCORE, rows)
+                missing_game, missing_player = cur.execute(_SQL_COUNT_STAGED_SKIPS).fetchone()
+                skipped_no_game += missing_game or 0
+                skipped_no_player += missing_player or 0
+                inserted += cur.execute(_SQL_UPSERT_STAGED_BOX_SCORES).rowcount
+                cur.execute(f"DELETE FROM temp.{_STAGING_TABLE}")  # noqa: S608
             conn.execute("COMMIT")
         except sqlite3.Error:
             conn.execute("ROLLBACK")
             raise
+        finally:
+            conn.execute(f"DROP TABLE IF EXISTS temp.{_STAGING_TABLE}")
 
         self.logger.info(
             "Pre-modern box scores upserted",
@@ -226,14 +340,23 @@ class PreModernBoxScoreIngestor(BaseIngestor):
             skipped_no_game=skipped_no_game,
             skipped_no_player=skipped_no_player,
         )
-        upsert_audit(
-            conn,
-            self.entity_type,
-            csv_path,
-            "kaggle_eoinamoore",
-            "SUCCESS",
-            inserted,
-        )
+        return inserted
+
+    def _upsert_bulk(self, conn: Any, cutoff: int | None) -> int:
+        """Load the attached csv virtual table with a single INSERT ... SELECT."""
+        try:
+            present = {r[1] for r in conn.execute(f"PRAGMA temp.table_info({_BULK_TABLE})")}
+            conn.execute("BEGIN")
+            try:
+                inserted = conn.execute(_bulk_upsert_sql(present), (cutoff, cutoff)).rowcount
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.execute(f"DROP TABLE IF EXISTS temp.{_BULK_TABLE}")
+
+        self.logger.info("Pre-modern box scores bulk loaded", inserted=inserted)
         return inserted
 
 
@@ -242,6 +365,275 @@ class PreModernBoxScoreIngestor(BaseIngestor):
 # ---------------------------------------------------------------------------
 
 
+def _attach_csv(conn: Any, csv_path: str) -> bool:
+    """
+    Expose csv_path as a temp virtual table through SQLite's csv extension.
+
+    Returns False when the extension cannot be loaded (Python built without
+    extension support, or csv.so not on the library path); the caller then
+    takes the streamed pyarrow path instead.
+    """
+    filename = csv_path.replace("'", "''")
+    try:
+        conn.enable_load_extension(True)
+        try:
+            conn.load_extension(_CSV_EXTENSION)
+        finally:
+            conn.enable_load_extension(False)
+        conn.execute(f"DROP TABLE IF EXISTS temp.{_BULK_TABLE}")
+        # The csv module takes its arguments as literals, not bound parameters
+        conn.execute(
+            f"CREATE VIRTUAL TABLE temp.{_BULK_TABLE} USING csv(filename='{filename}', header=YES)"
+        )
+    except (AttributeError, sqlite3.Error) as exc:
+        logger.warning("SQLite csv extension unavailable, streaming instead", error=str(exc))
+        return False
+    return True
+
+
+def _bulk_upsert_sql(present: set[str]) -> str:
+    """
+    Build the INSERT ... SELECT that loads the attached CSV in one statement.
+
+    Mirrors _decode_batch in SQL: null tokens, gameId padding, the season
+    fallback, "MM:SS" minutes and 0-100 percentages are all handled inline,
+    and the game/player FK checks and season cutoff are WHERE clauses, so
+    SQLite parses and inserts every row without a round trip to Python.
+    Columns missing from the CSV header read as NULL. Binds (cutoff, cutoff).
+    """
+    null_tokens = ", ".join(f"'{t}'" for t in sorted(_NULL_TOKENS))
+
+    def text(name: str) -> str:
+        if name not in present:
+            return "NULL"
+        cell = f'trim("{name}")'
+        return f"CASE WHEN {cell} IN ({null_tokens}) THEN NULL ELSE {cell} END"
+
+    def number(name: str) -> str:
+        # CAST alone turns non-numeric text into 0; keep it NULL like _safe_float
+        cell = text(name)
+        return (
+            f"CASE WHEN {cell} GLOB '*[0-9]*' AND NOT {cell} GLOB '*[^0-9.eE+-]*' "
+            f"THEN CAST({cell} AS REAL) END"
+        )
+
+    def integer(name: str) -> str:
+        return f"CAST({number(name)} AS INTEGER)"
+
+    def stat(name: str) -> str:
+        if not name.endswith("Percentage"):
+            return integer(name)
+        return _SQL_PCT.format(number(name))
+
+    stats = [f"{stat(name)} AS s{i}" for i, name in enumerate(_STAT_COLUMNS)]
+    stat_refs = ", ".join(f"s{i}" for i in range(len(_STAT_COLUMNS)))
+    minutes = text("minutes")
+    yy = "substr(game_id, 4, 2)"
+    select = f"""
+        INSERT INTO player_game_log ({_BOX_SCORE_COLUMNS})
+        SELECT game_id, player_id, team_id, season_id, minutes, {stat_refs}
+        FROM (
+            SELECT *, COALESCE(
+                CASE WHEN season_end > 1946 THEN season_end - 1 ELSE season_end END,
+                CASE WHEN length(game_raw) >= 5 AND {yy} GLOB '[0-9][0-9]'
+                     THEN CAST({yy} AS INTEGER)
+                          + CASE WHEN CAST({yy} AS INTEGER) < 50 THEN 1999 ELSE 1899 END
+                END
+            ) AS season_id
+            FROM (
+                SELECT *,
+                    CASE WHEN game_raw GLOB '*[^0-9.]*'
+                         THEN CASE WHEN length(game_raw) = 10 THEN game_raw END
+                         ELSE printf('%010d', CAST(CAST(game_raw AS REAL) AS INTEGER))
+                    END AS game_id
+                FROM (
+                    SELECT
+                        {text("gameId")} AS game_raw,
+                        {integer("personId")} AS player_id,
+                        {integer("teamId")} AS team_id,
+                        COALESCE(
+                            NULLIF({integer("seasonYear")}, 0),
+                            NULLIF({integer("season_year")}, 0)
+                        ) AS season_end,
+                        CASE WHEN instr({minutes}, ':') > 0
+                             THEN CAST(substr({minutes}, 1, instr({minutes}, ':') - 1) AS REAL)
+                                  + CAST(substr({minutes}, instr({minutes}, ':') + 1) AS REAL)
+                                  / 60.0
+                             ELSE CAST({minutes} AS REAL)
+                        END AS minutes,
+                        {", ".join(stats)}
+                    FROM temp.{_BULK_TABLE}
+                )
+            )
+        ) AS b
+        {_SQL_FK_FILTER}
+          AND (? IS NULL OR b.season_id IS NULL OR b.season_id < ?)
+    """  # noqa: S608
+    return select + _SQL_ON_CONFLICT
+
+
+def _read_ahead[T](items: Iterator[T], depth: int) -> Iterator[T]:
+    """
+    Yield from items while a worker thread computes up to depth more.
+
+    Each next() call runs on a single background thread, so the source
+    iterator is still advanced strictly in order; exceptions it raises
+    surface at the matching position here. Items must not be None.
+    """
+
+    def _next() -> T | None:
+        return next(items, None)
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pre-modern-read")
+    try:
+        pending = deque(pool.submit(_next) for _ in range(depth))
+        while (item := pending.popleft().result()) is not None:
+            pending.append(pool.submit(_next))
+            yield item
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_batches(csv_path: Path, cutoff: int | None) -> Iterator[list[tuple[Any, ...]]]:
+    """
+    Stream the CSV as _BOX_SCORE_COLUMNS tuples, one list per block.
+
+    pyarrow's multithreaded reader tokenises _CSV_BLOCK_BYTES at a time and
+    numeric coercion runs as Arrow compute kernels over whole columns; only
+    the gameId season fallback runs per row. gzip / zstd files are
+    decompressed as they stream. Rows for seasons at or after cutoff are
+    dropped. game_id is "" and player_id None for rows missing either.
+    """
+    with pa.input_stream(str(csv_path), compression=_sniff_compression(csv_path)) as source:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_BYTES),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=list(_CSV_COLUMNS),
+                include_missing_columns=True,
+                # Everything is read as text and coerced below, so one bad cell
+                # falls back to per-cell parsing instead of failing the read.
+                column_types=dict.fromkeys(_CSV_COLUMNS, pa.string()),
+                null_values=sorted(_NULL_TOKENS),
+                strings_can_be_null=True,
+            ),
+        )
+        for record_batch in reader:
+            rows = _decode_batch(record_batch, cutoff)
+            if rows:
+                yield rows
+
+
+def _sniff_compression(csv_path: Path) -> str | None:
+    """Return the pyarrow codec for a gzip / zstd file, or None for plain text."""
+    with csv_path.open("rb") as fh:
+        head = fh.read(4)
+    for magic, codec in _COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def _decode_batch(record_batch: pa.RecordBatch, cutoff: int | None) -> list[tuple[Any, ...]]:
+    """Coerce one CSV block column-at-a-time into parameter tuples."""
+    # seasonYear / season_year: first non-zero wins; eoinamoore stores the
+    # end year (1997 for 1996-97), converted to the start year.
+    season_end = _int_array(record_batch.column("seasonYear"))
+    alt = _int_array(record_batch.column("season_year"))
+    season_end = pc.if_else(pc.fill_null(pc.not_equal(season_end, 0), False), season_end, alt)
+    season_end = pc.if_else(pc.not_equal(season_end, 0), season_end, None)
+    season_arr = pc.if_else(pc.greater(season_end, 1946), pc.subtract(season_end, 1), season_end)
+    if cutoff is not None:
+        # Drop rows at or past the cutoff before any other column is coerced;
+        # rows without a season are kept for the gameId fallback below.
+        keep = pc.fill_null(pc.less(season_arr, cutoff), True)
+        record_batch = record_batch.filter(keep)
+        season_arr = season_arr.filter(keep)
+
+    col = record_batch.column
+    game_ids = _game_id_list(col("gameId"))
+    seasons = season_arr.to_pylist()
+    # Rows without a season fall back to the gameId, reusing the id already
+    # padded above instead of re-parsing the raw cell.
+    fell_back = None in seasons
+    if fell_back:
+        game_raw = col("gameId").to_pylist()
+        for i, season in enumerate(seasons):
+            if season is None and len(game_raw[i] or "") >= 5:
+                seasons[i] = _season_from_game_id(game_ids[i])
+
+    columns = [
+        game_ids,
+        _int_array(col("personId")).to_pylist(),
+        _int_array(col("teamId")).to_pylist(),
+        seasons,
+        _minutes_array(col("minutes")).to_pylist(),
+    ]
+    for name in _STAT_COLUMNS:
+        if name.endswith("Percentage"):
+            # Rescaled from 0-100 by _SQL_PCT as the staged rows are copied
+            columns.append(_float_array(col(name)).to_pylist())
+        else:
+            columns.append(_int_array(col(name)).to_pylist())
+
+    rows = zip(*columns, strict=True)
+    if cutoff is None or not fell_back:
+        return list(rows)
+    # Only seasons recovered from the gameId still need the cutoff check
+    return [r for r in rows if r[3] is None or r[3] < cutoff]
+
+
+def _game_id_list(values: pa.Array) -> list[str]:
+    """
+    Zero-pad a gameId column to 10-character strings.
+
+    Numeric ids (the whole file, in practice) are cast and padded by Arrow
+    kernels; a block holding anything else goes through _normalise_game_id
+    cell by cell. Missing ids become "".
+    """
+    try:
+        numeric = pc.cast(pc.utf8_trim_whitespace(values), pa.float64())
+    except pa.ArrowInvalid:
+        numeric = None
+    # Negative or non-finite ids would not round-trip through zfill(); leave
+    # them to the per-cell path.
+    if (
+        numeric is None
+        or not pc.all(pc.and_(pc.is_finite(numeric), pc.greater_equal(numeric, 0))).as_py()
+    ):
+        return [_normalise_game_id(g) if g is not None else "" for g in values.to_pylist()]
+    ids = pc.cast(numeric, options=pc.CastOptions(pa.int64(), allow_float_truncate=True))
+    padded = pc.utf8_lpad(pc.cast(ids, pa.string()), width=10, padding="0")
+    return pc.fill_null(padded, "").to_pylist()
+
+
+def _float_array(values: pa.Array) -> pa.Array:
+    """Coerce a text column to float64 in one cast, per cell if any cell is malformed."""
+    try:
+        return pc.cast(pc.utf8_trim_whitespace(values), pa.float64())
+    except pa.ArrowInvalid:
+        return pa.array([_safe_float(v) for v in values.to_pylist()], pa.float64())
+
+
+def _int_array(values: pa.Array) -> pa.Array:
+    """Coerce a text column to int64, truncating decimals like int(float(s))."""
+    floats = _float_array(values)
+    # NaN / inf have no integer value; null them before the truncating cast
+    floats = pc.if_else(pc.is_finite(floats), floats, None)
+    try:
+        return pc.cast(floats, options=pc.CastOptions(pa.int64(), allow_float_truncate=True))
+    except pa.ArrowInvalid:
+        return pa.array([_safe_int(v) for v in values.to_pylist()], pa.int64())
+
+
+def _minutes_array(values: pa.Array) -> pa.Array:
+    """Coerce minutes; "MM:SS" cells take the per-cell _parse_minutes path."""
+    try:
+        return pc.cast(pc.utf8_trim_whitespace(values), pa.float64())
+    except pa.ArrowInvalid:
+        return pa.array([_parse_minutes(v or "") for v in values.to_pylist()], pa.float64())
+
+
 def _normalise_game_id(raw: str) -> str:
     """Ensure game_id is a 10-character zero-padded string."""
     raw = str(raw).strip()
@@ -254,24 +646,14 @@ def _normalise_game_id(raw: str) -> str:
         return raw if len(raw) == 10 else ""
 
 
-def _extract_season_year(row: dict[str, str]) -> int | None:
-    """Extract season start year from a row. Tries seasonYear and gameId."""
-    season_raw = row.get("seasonYear", "") or row.get("season_year", "")
-    if season_raw:
-        val = _safe_int(season_raw)
-        if val:
-            # eoinamoore uses end year (e.g. 1997 for 1996-97); convert to start year
-            return val - 1 if val > 1946 else val
-    # Fall back to parsing game_id: first 3 digits encode season
-    game_id = row.get("gameId", "")
-    if game_id and len(str(game_id)) >= 5:
-        try:
-            yy = int(str(int(float(game_id))).zfill(10)[3:5])
-            # yy is last 2 digits of season end year; approximate
-            return (2000 + yy - 1) if yy < 50 else (1900 + yy - 1)
-        except (ValueError, IndexError):
-            pass
-    return None
+def _season_from_game_id(game_id: str) -> int | None:
+    """Approximate season start year from a normalised 10-character game_id."""
+    # Digits 4-5 are the last two digits of the season end year
+    yy = game_id[3:5]
+    if not yy.isdigit():
+        return None
+    year = int(yy)
+    return (2000 + year - 1) if year < 50 else (1900 + year - 1)
 
 
 def _parse_minutes(minutes_str: str) -> float | None:
@@ -291,37 +673,26 @@ def _parse_minutes(minutes_str: str) -> float | None:
         return None
 
 
-def _game_exists(conn: Any, game_id: str) -> bool:
-    try:
-        row = conn.execute("SELECT 1 FROM game WHERE game_id=? LIMIT 1", (game_id,)).fetchone()
-        return row is not None
-    except sqlite3.Error:
-        return False
-
-
-def _player_exists(conn: Any, player_id: int) -> bool:
-    try:
-        row = conn.execute(
-            "SELECT 1 FROM player WHERE player_id=? LIMIT 1", (player_id,)
-        ).fetchone()
-        return row is not None
-    except sqlite3.Error:
-        return False
-
-
 def _safe_int(val: Any) -> int | None:
-    if val is None or str(val).strip() in ("", "None", "null", "NA"):
+    if val is None:
+        return None
+    s = (val if isinstance(val, str) else str(val)).strip()
+    if s in _NULL_TOKENS:
         return None
     try:
-        return int(float(str(val).strip()))
-    except (ValueError, TypeError):
+        # Whole-number cells, the common case, skip the float() round trip
+        return int(s) if s.lstrip("-").isdigit() else int(float(s))
+    except (ValueError, OverflowError):
         return None
 
 
 def _safe_float(val: Any) -> float | None:
-    if val is None or str(val).strip() in ("", "None", "null", "NA"):
+    if val is None:
+        return None
+    s = (val if isinstance(val, str) else str(val)).strip()
+    if s in _NULL_TOKENS:
         return None
     try:
-        return float(str(val).strip())
-    except (ValueError, TypeError):
+        return float(s)
+    except ValueError:
         return None
@@ -0,0 +1,96 @@
+"""Sequence prefetching for chained NBA.com Stats API ingests.
+
+The player pipeline runs PlayerBioIngestor then PlayerSeasonStatsIngestor for
+the same player_id. Once the bio fetch returns, the career-stats request is
+started on a background thread so its network latency overlaps the bio
+validate/upsert. The next ingestor claims the in-flight result by cache key.
+
+Pending results are held in a small bounded LRU. Callers write each result to
+the response cache as it arrives, so one evicted before it is claimed is still
+served from the cache rather than fetched again.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound on unclaimed prefetches kept in memory.
+_PREFETCH_MAX_PENDING = 32
+_PREFETCH_WORKERS = 2
+
+_executor: ThreadPoolExecutor | None = None
+_pending: OrderedDict[str, Future[Any]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_PREFETCH_WORKERS, thread_name_prefix="nba-prefetch"
+        )
+    return _executor
+
+
+def schedule(key: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> None:
+    """
+    Start fn(*args, **kwargs) in the background and park its future under key.
+
+    A key that is already pending is left alone. When the LRU is full, the
+    oldest unclaimed prefetch is evicted.
+
+    Args:
+        key: Cache key the consuming ingestor will look up.
+        fn: Callable performing the request.
+        *args: Positional arguments for fn.
+        **kwargs: Keyword arguments for fn.
+    """
+    with _lock:
+        if key in _pending:
+            _pending.move_to_end(key)
+            return
+        _pending[key] = _get_executor().submit(fn, *args, **kwargs)
+        while len(_pending) > _PREFETCH_MAX_PENDING:
+            evicted, future = _pending.popitem(last=False)
+            future.cancel()
+            logger.debug("Prefetch evicted", key=evicted)
+
+
+def take(key: str) -> Any | None:
+    """
+    Claim a prefetched result, waiting for it if still in flight.
+
+    Args:
+        key: Cache key passed to schedule().
+
+    Returns:
+        The prefetched response, or None if nothing was scheduled under key
+        or the background request failed.
+    """
+    with _lock:
+        future = _pending.pop(key, None)
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as exc:
+        logger.debug("Prefetch failed, fetching directly", key=key, error=str(exc))
+        return None
+
+
+def clear() -> None:
+    """Drop all pending prefetches."""
+    with _lock:
+        for future in _pending.values():
+            future.cancel()
+        _pending.clear()
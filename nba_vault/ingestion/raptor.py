@@ -21,28 +21,113 @@ Usage:
 from __future__ import annotations
 
 import csv
+import functools
 import io
+import operator
 import sqlite3
 import urllib.request
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import pydantic
 import structlog
 
-from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.base import BaseIngestor, pad_row, result_set
 from nba_vault.ingestion.validation import upsert_audit
-from nba_vault.models.entities import PlayerRaptorCreate
+
+if TYPE_CHECKING:
+    import pydantic
+
+    from nba_vault.models.entities import PlayerRaptorCreate
 
 logger = structlog.get_logger(__name__)
 
+# nba-data-historical.csv columns read by validate(), in unpacking order
+_CSV_COLUMNS = (
+    "year_id",
+    "type",
+    "player_id",
+    "team_id",
+    "Min",
+    "Raptor O",
+    "Raptor D",
+    "Raptor+/-",
+    "Raptor WAR",
+)
+
+# Cells treated as missing
+_NULL_TOKENS = frozenset(("", "None", "none", "null", "NULL", "NA"))
+
 _HISTORICAL_URL = (
     "https://raw.githubusercontent.com/fivethirtyeight/nba-player-advanced-metrics"
     "/master/nba-data-historical.csv"
 )
 
 
-@register_ingestor
+# player_id is resolved in SQL from bbref_id through player's UNIQUE(bbref_id)
+# index, so no bbref -> player_id dict is built in Python. bbref_id is bound
+# twice per row: once for the lookup, once as the column value.
+_SQL_UPSERT_RAPTOR = """
+    INSERT INTO player_raptor
+        (player_id, bbref_id, season_id, season_type, bbref_team_id,
+         poss, mp,
+         raptor_box_offense, raptor_box_defense, raptor_box_total,
+         raptor_onoff_offense, raptor_onoff_defense, raptor_onoff_total,
+         raptor_offense, raptor_defense, raptor_total,
+         war_total, war_reg_season, war_playoffs,
+         predator_offense, predator_defense, predator_total,
+         pace_impact, raptor_version)
+    VALUES ((SELECT player_id FROM player WHERE bbref_id = ?),
+            ?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(bbref_id, season_id, season_type, bbref_team_id) DO UPDATE SET
+        player_id            = excluded.player_id,
+        poss                 = excluded.poss,
+        mp                   = excluded.mp,
+        raptor_box_offense   = excluded.raptor_box_offense,
+        raptor_box_defense   = excluded.raptor_box_defense,
+        raptor_box_total     = excluded.raptor_box_total,
+        raptor_onoff_offense = excluded.raptor_onoff_offense,
+        raptor_onoff_defense = excluded.raptor_onoff_defense,
+        raptor_onoff_total   = excluded.raptor_onoff_total,
+        raptor_offense       = excluded.raptor_offense,
+        raptor_defense       = excluded.raptor_defense,
+        raptor_total         = excluded.raptor_total,
+        war_total            = excluded.war_total,
+        war_reg_season       = excluded.war_reg_season,
+        war_playoffs         = excluded.war_playoffs,
+        predator_offense     = excluded.predator_offense,
+        predator_defense     = excluded.predator_defense,
+        predator_total       = excluded.predator_total,
+        pace_impact          = excluded.pace_impact,
+        raptor_version       = excluded.raptor_version
+"""
+
+_raptor_to_row = operator.attrgetter(
+    "bbref_id",
+    "bbref_id",
+    "season_id",
+    "season_type",
+    "bbref_team_id",
+    "poss",
+    "mp",
+    "raptor_box_offense",
+    "raptor_box_defense",
+    "raptor_box_total",
+    "raptor_onoff_offense",
+    "raptor_onoff_defense",
+    "raptor_onoff_total",
+    "raptor_offense",
+    "raptor_defense",
+    "raptor_total",
+    "war_total",
+    "war_reg_season",
+    "war_playoffs",
+    "predator_offense",
+    "predator_defense",
+    "predator_total",
+    "pace_impact",
+    "raptor_version",
+)
+
+
 class RaptorIngestor(BaseIngestor):
     """
     Ingestor for FiveThirtyEight RAPTOR player ratings (1976-present).
@@ -69,13 +154,16 @@ class RaptorIngestor(BaseIngestor):
 
         self.logger.info("Downloading historical RAPTOR CSV", url=_HISTORICAL_URL)
         with urllib.request.urlopen(_HISTORICAL_URL, timeout=120) as resp:  # noqa: S310
-            content = resp.read().decode("utf-8")
-
-        reader = csv.DictReader(io.StringIO(content))
-        rows = list(reader)
-        self.logger.info("Downloaded RAPTOR rows", count=len(rows))
-
-        payload: dict[str, Any] = {"rows": rows}
+            # Decoded and tokenised as it streams off the socket, so neither
+            # the raw bytes nor the decoded text is held in full.
+            # Kept as headers + row lists; validate() indexes columns by
+            # position instead of building a DictReader dict per row.
+            reader = csv.reader(io.TextIOWrapper(resp, encoding="utf-8", newline=""))
+            headers = next(reader, [])
+            data = list(reader)
+        self.logger.info("Downloaded RAPTOR rows", count=len(data))
+
+        payload: dict[str, Any] = {"headers": headers, "data": data}
         self.cache.set(cache_key, payload)
         return payload
 
@@ -85,24 +173,46 @@ class RaptorIngestor(BaseIngestor):
         # team_id → bbref_team_id, Min → mp, G → games,
         # "Raptor O" → raptor_offense, "Raptor D" → raptor_defense,
         # "Raptor+/-" → raptor_total, "Raptor WAR" → war_total
-        validated: list[pydantic.BaseModel] = []
-        for row in raw.get("rows", []):
+        # Imported here so loading this module does not build the model schema
+        import pydantic  # noqa: PLC0415
+
+        from nba_vault.models.entities import PlayerRaptorCreate  # noqa: PLC0415
+
+        headers, data = result_set(raw, "rows")
+        width = len(headers)
+        pos = {h: i for i, h in enumerate(headers)}
+        # Absent columns point at the trailing None pad slot
+        pick = operator.itemgetter(*(pos.get(col, width) for col in _CSV_COLUMNS))
+
+        rows: list[dict[str, Any]] = []
+        for cells in data:
             try:
+                (
+                    year_raw,
+                    type_raw,
+                    player_raw,
+                    team_raw,
+                    minutes,
+                    raptor_o,
+                    raptor_d,
+                    raptor_total,
+                    raptor_war,
+                ) = pick((*cells, None) if len(cells) == width else pad_row(cells, width + 1))
                 # year_id is the season end year (e.g. 2020 for 2019-20)
-                year_id = _safe_int(row.get("year_id"))
+                year_id = _safe_int(year_raw)
                 if year_id is None:
                     continue
                 season_id = year_id - 1  # convert to start year
 
-                season_type = str(row.get("type", "RS")).strip().upper()
+                season_type = str(type_raw or "RS").strip().upper()
                 if season_type not in ("RS", "PO"):
                     season_type = "RS"
 
-                bbref_id = str(row.get("player_id", "")).strip() or None
+                bbref_id = str(player_raw or "").strip() or None
                 if not bbref_id:
                     continue
 
-                bbref_team_id = str(row.get("team_id", "")).strip() or None
+                bbref_team_id = str(team_raw or "").strip() or None
 
                 # Determine RAPTOR version by era
                 if year_id >= 2014:
@@ -112,35 +222,40 @@ class RaptorIngestor(BaseIngestor):
                 else:
                     raptor_version = "box"
 
-                model = PlayerRaptorCreate(
-                    bbref_id=bbref_id,
-                    season_id=season_id,
-                    season_type=season_type,
-                    bbref_team_id=bbref_team_id,
-                    mp=_safe_int(row.get("Min")),
-                    # Combined RAPTOR (no box/on-off split in this file)
-                    raptor_offense=_safe_float(row.get("Raptor O")),
-                    raptor_defense=_safe_float(row.get("Raptor D")),
-                    raptor_total=_safe_float(row.get("Raptor+/-")),
-                    war_total=_safe_float(row.get("Raptor WAR")),
-                    raptor_version=raptor_version,
+                rows.append(
+                    {
+                        "bbref_id": bbref_id,
+                        "season_id": season_id,
+                        "season_type": season_type,
+                        "bbref_team_id": bbref_team_id,
+                        "mp": _safe_int(minutes),
+                        # Combined RAPTOR (no box/on-off split in this file)
+                        "raptor_offense": _safe_float(raptor_o),
+                        "raptor_defense": _safe_float(raptor_d),
+                        "raptor_total": _safe_float(raptor_total),
+                        "war_total": _safe_float(raptor_war),
+                        "raptor_version": raptor_version,
+                    }
                 )
-                validated.append(model)
-            except (pydantic.ValidationError, ValueError, KeyError) as exc:
+            except (ValueError, KeyError) as exc:
                 self.logger.debug("RAPTOR row validation error", error=str(exc))
+
+        validated: list[pydantic.BaseModel]
+        try:
+            validated = list(_raptor_adapter().validate_python(rows))
+        except pydantic.ValidationError:
+            # Fall back to per-row validation so one out-of-range row is
+            # skipped rather than discarding the whole file.
+            validated = []
+            for row in rows:
+                try:
+                    validated.append(PlayerRaptorCreate.model_validate(row))
+                except pydantic.ValidationError as exc:
+                    self.logger.debug("RAPTOR row validation error", error=str(exc))
         self.logger.info("Validated RAPTOR rows", count=len(validated))
         return validated
 
     def upsert(self, model: list[pydantic.BaseModel], conn: Any) -> int:
-        # Build bbref_id → player_id lookup once for the whole batch
-        bbref_lookup: dict[str, int] = {}
-        try:
-            cur = conn.execute("SELECT bbref_id, player_id FROM player WHERE bbref_id IS NOT NULL")
-            for row in cur.fetchall():
-                bbref_lookup[row[0]] = row[1]
-        except sqlite3.Error as e:
-            self.logger.warning("Failed to build bbref lookup", error=str(e))
-
         # Build set of valid season_ids to avoid FK constraint failures when
         # seasons table is not yet populated (Stage 0 runs before Stage 1).
         try:
@@ -150,83 +265,19 @@ class RaptorIngestor(BaseIngestor):
         except sqlite3.Error:
             valid_seasons = set()
 
-        skipped_no_season = 0
-        rows_affected = 0
+        raptors = [cast("PlayerRaptorCreate", m) for m in model]
+        # Skip rows where season_id is not in the season table (NOT NULL FK)
+        rows = [_raptor_to_row(r) for r in raptors if r.season_id in valid_seasons]
+        skipped_no_season = len(raptors) - len(rows)
+
         conn.execute("BEGIN")
         try:
-            for item in model:
-                r = cast("PlayerRaptorCreate", item)
-                # Skip rows where season_id is not in the season table (NOT NULL FK)
-                if r.season_id not in valid_seasons:
-                    skipped_no_season += 1
-                    continue
-                player_id = bbref_lookup.get(r.bbref_id) if r.bbref_id else None
-                conn.execute(
-                    """
-                    INSERT INTO player_raptor
-                        (player_id, bbref_id, season_id, season_type, bbref_team_id,
-                         poss, mp,
-                         raptor_box_offense, raptor_box_defense, raptor_box_total,
-                         raptor_onoff_offense, raptor_onoff_defense, raptor_onoff_total,
-                         raptor_offense, raptor_defense, raptor_total,
-                         war_total, war_reg_season, war_playoffs,
-                         predator_offense, predator_defense, predator_total,
-                         pace_impact, raptor_version)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT(bbref_id, season_id, season_type, bbref_team_id) DO UPDATE SET
-                        player_id            = excluded.player_id,
-                        poss                 = excluded.poss,
-                        mp                   = excluded.mp,
-                        raptor_box_offense   = excluded.raptor_box_offense,
-                        raptor_box_defense   = excluded.raptor_box_defense,
-                        raptor_box_total     = excluded.raptor_box_total,
-                        raptor_onoff_offense = excluded.raptor_onoff_offense,
-                        raptor_onoff_defense = excluded.raptor_onoff_defense,
-                        raptor_onoff_total   = excluded.raptor_onoff_total,
-                        raptor_offense       = excluded.raptor_offense,
-                        raptor_defense       = excluded.raptor_defense,
-                        raptor_total         = excluded.raptor_total,
-                        war_total            = excluded.war_total,
-                        war_reg_season       = excluded.war_reg_season,
-                        war_playoffs         = excluded.war_playoffs,
-                        predator_offense     = excluded.predator_offense,
-                        predator_defense     = excluded.predator_defense,
-                        predator_total       = excluded.predator_total,
-                        pace_impact          = excluded.pace_impact,
-                        raptor_version       = excluded.raptor_version
-                    """,
-                    (
-                        player_id,
-                        r.bbref_id,
-                        r.season_id,
-                        r.season_type,
-                        r.bbref_team_id,
-                        r.poss,
-                        r.mp,
-                        r.raptor_box_offense,
-                        r.raptor_box_defense,
-                        r.raptor_box_total,
-                        r.raptor_onoff_offense,
-                        r.raptor_onoff_defense,
-                        r.raptor_onoff_total,
-                        r.raptor_offense,
-                        r.raptor_defense,
-                        r.raptor_total,
-                        r.war_total,
-                        r.war_reg_season,
-                        r.war_playoffs,
-                        r.predator_offense,
-                        r.predator_defense,
-                        r.predator_total,
-                        r.pace_impact,
-                        r.raptor_version,
-                    ),
-                )
-                rows_affected += 1
+            conn.executemany(_SQL_UPSERT_RAPTOR, rows)
             conn.execute("COMMIT")
         except sqlite3.Error:
             conn.execute("ROLLBACK")
             raise
+        rows_affected = len(rows)
 
         upsert_audit(
             conn, self.entity_type, "all", "fivethirtyeight_raptor", "SUCCESS", rows_affected
@@ -239,19 +290,36 @@ class RaptorIngestor(BaseIngestor):
         return rows_affected
 
 
-def _safe_float(val: Any) -> float | None:
-    if val is None or str(val).strip() in ("", "None", "null", "NA"):
+@functools.cache
+def _raptor_adapter() -> pydantic.TypeAdapter[list[PlayerRaptorCreate]]:
+    """Build the whole-file PlayerRaptorCreate validator on first use."""
+    import pydantic  # noqa: PLC0415
+
+    from nba_vault.models.entities import PlayerRaptorCreate  # noqa: PLC0415
+
+    return pydantic.TypeAdapter(list[PlayerRaptorCreate])
+
+
+def _safe_int(val: Any) -> int | None:
+    if val is None:
+        return None
+    s = (val if isinstance(val, str) else str(val)).strip()
+    if s in _NULL_TOKENS:
         return None
     try:
-        return float(str(val).strip())
-    except (ValueError, TypeError):
+        # Whole-number cells, the common case, skip the float() round trip
+        return int(s) if s.lstrip("-").isdigit() else int(float(s))
+    except (ValueError, OverflowError):
         return None
 
 
-def _safe_int(val: Any) -> int | None:
-    if val is None or str(val).strip() in ("", "None", "null", "NA"):
+def _safe_float(val: Any) -> float | None:
+    if val is None:
+        return None
+    s = (val if isinstance(val, str) else str(val)).strip()
+    if s in _NULL_TOKENS:
         return None
     try:
-        return int(float(str(val).strip()))
-    except (ValueError, TypeError):
+        return float(s)
+    except ValueError:
         return None
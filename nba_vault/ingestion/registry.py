@@ -1,16 +1,20 @@
-"""Registry for data ingestors."""
+"""Registry for data ingestors.
 
-from nba_vault.ingestion.base import BaseIngestor
+Ingestors register themselves: BaseIngestor.__init_subclass__ records every
+subclass that declares an entity_type, so defining the class is enough.
+"""
 
-# Registry of ingestor classes
-_INGESTOR_REGISTRY: dict[str, type[BaseIngestor]] = {}
+import warnings
+
+from nba_vault.ingestion.base import _INGESTOR_REGISTRY, BaseIngestor
 
 
 def register_ingestor(cls: type[BaseIngestor]) -> type[BaseIngestor]:
     """
     Register an ingestor class.
 
-    This is intended to be used as a decorator.
+    Deprecated: subclassing BaseIngestor with an entity_type registers the
+    class automatically. Kept as a pass-through decorator for existing code.
 
     Args:
         cls: Ingestor class to register.
@@ -18,12 +22,14 @@ def register_ingestor(cls: type[BaseIngestor]) -> type[BaseIngestor]:
     Returns:
         The same class (for decorator chaining).
 
-    Example:
-        @register_ingestor
-        class PlayerIngestor(BaseIngestor):
-            entity_type = "player"
-            ...
+    Raises:
+        ValueError: If the class has no entity_type.
     """
+    warnings.warn(
+        "register_ingestor is deprecated; BaseIngestor subclasses register automatically",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if not hasattr(cls, "entity_type"):
         raise ValueError(f"Ingestor class {cls.__name__} must define 'entity_type'")
 
@@ -4,6 +4,8 @@ This module provides specialized scrapers for fetching injury data from
 different websites. Each scraper handles the unique HTML structure and
 data format of its source.
 
+Pages are parsed with lxml (libxml2); elements are located with XPath.
+
 Common functionality is provided by BaseInjuryScraper:
 - HTML parsing utilities
 - Date parsing (scraped dates vary by source)
@@ -11,15 +13,176 @@ Common functionality is provided by BaseInjuryScraper:
 - Team name normalization
 """
 
+import functools
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any
 
 import structlog
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 logger = structlog.get_logger(__name__)
 
+# Bytes read from the socket per parser feed when streaming a page
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Seconds a fetched page is reused before the source is requested again. The
+# injury pages change a few times a day, so every scope ingested in one run
+# ("team:LAL", "team:BOS", ...) can share a single request.
+_PAGE_TTL_SECONDS = 900.0
+
+
+# Keywords parse_injury_description looks for, in priority order: when a
+# description mentions several, the earliest entry here wins.
+_BODY_PARTS = (
+    "acl",
+    "mcl",
+    "pcl",
+    "lcl",
+    "knee",
+    "ankle",
+    "foot",
+    "heel",
+    "toe",
+    "hip",
+    "groin",
+    "thigh",
+    "hamstring",
+    "quad",
+    "calf",
+    "shin",
+    "achilles",
+    "back",
+    "spine",
+    "shoulder",
+    "elbow",
+    "wrist",
+    "hand",
+    "finger",
+    "thumb",
+    "head",
+    "neck",
+    "face",
+    "eye",
+    "nose",
+    "concussion",
+    "chest",
+    "rib",
+)
+_INJURY_TYPES = (
+    "strain",
+    "sprain",
+    "fracture",
+    "break",
+    "tear",
+    "rupture",
+    "contusion",
+    "bruise",
+    "soreness",
+    "inflammation",
+    "tendinitis",
+    "bursitis",
+    "dislocation",
+    "subluxation",
+    "concussion",
+    "illness",
+    "infection",
+)
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile keywords into one pattern reporting every keyword occurrence.
+
+    The zero-width lookahead lets matches overlap, so a keyword inside or
+    across another match is still reported; at any position the
+    alternatives are tried in priority order.
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
+_BODY_PART_PATTERN = _keyword_pattern(_BODY_PARTS)
+_BODY_PART_RANK = {keyword: rank for rank, keyword in enumerate(_BODY_PARTS)}
+_INJURY_TYPE_PATTERN = _keyword_pattern(_INJURY_TYPES)
+_INJURY_TYPE_RANK = {keyword: rank for rank, keyword in enumerate(_INJURY_TYPES)}
+
+
+def _first_keyword(pattern: re.Pattern[str], rank: dict[str, int], text: str) -> str | None:
+    """Return the highest-priority keyword occurring in text, or None."""
+    # One C-level scan of text instead of one substring search per keyword
+    found = pattern.findall(text)
+    return min(found, key=rank.__getitem__) if found else None
+
+
+# Date formats accepted by parse_date. Any string matching two of them ("May")
+# parses to the same date under both, so the order they are tried is free.
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+)
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath step matching tag elements whose class list contains class_name."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Element lookups, compiled once and evaluated by libxml2 rather than by
+# walking a Python tree
+_LINEUP_XPATH = etree.XPath("//" + _class_xpath("div", "lineup"))
+_TEAM_NAME_XPATH = etree.XPath(".//" + _class_xpath("span", "team-name"))
+_PLAYER_XPATH = etree.XPath(".//" + _class_xpath("div", "player"))
+_PLAYER_NAME_XPATH = etree.XPath(".//" + _class_xpath("a", "player-name"))
+_STATUS_XPATH = etree.XPath(".//" + _class_xpath("span", "status"))
+_NEWS_XPATH = etree.XPath(".//" + _class_xpath("div", "news"))
+
+
+def _parse_stream(chunks: Iterable[bytes]) -> Any:
+    """
+    Parse a page chunk by chunk as it downloads.
+
+    The body is never joined into one bytes object; libxml2 tokenizes each
+    chunk as it arrives. An empty or whitespace-only body yields an empty
+    document.
+    """
+    # A feed parser holds per-document state, so each page gets its own.
+    # Both sites serve UTF-8, which libxml2 would otherwise only pick up
+    # from a <meta charset> tag.
+    parser = lxml_html.HTMLParser(encoding="utf-8")
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:  # nothing was fed
+        root = None
+    return root if root is not None else lxml_html.document_fromstring("<html></html>")
+
+
+def _first(element: Any, xpath: etree.XPath) -> Any | None:
+    """Return the first node matching xpath under element, or None."""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _text(element: Any | None) -> str:
+    """Whitespace-stripped text of element and its descendants ("" for None)."""
+    if element is None:
+        return ""
+    # Most cells are a single text node; read it directly rather than
+    # serializing the subtree with text_content().
+    if len(element) == 0:
+        return (element.text or "").strip()
+    return element.text_content().strip()
+
 
 class BaseInjuryScraper(ABC):
     """
@@ -40,6 +203,10 @@ class BaseInjuryScraper(ABC):
         self.rate_limiter = rate_limiter
         self.session = session
         self.logger = logger.bind(scraper=self.__class__.__name__)
+        # Index into _DATE_FORMATS of the format parse_date last matched
+        self._date_format_index = 0
+        # url -> (expires_at monotonic seconds, parsed page root)
+        self._page_cache: dict[str, tuple[float, Any]] = {}
 
     @abstractmethod
     def fetch(self) -> list[dict[str, Any]]:
@@ -61,6 +228,39 @@ class BaseInjuryScraper(ABC):
         """
         pass
 
+    def get_document(self, url: str) -> Any:
+        """
+        Return the parsed page at url, reusing one fetched within _PAGE_TTL_SECONDS.
+
+        Only requests that actually reach the network wait on the rate
+        limiter; a cached page is returned immediately. The response is
+        streamed straight into the parser rather than buffered first.
+
+        Args:
+            url: Page URL.
+
+        Returns:
+            Root element of the parsed page.
+
+        Raises:
+            requests.HTTPError: If the source returns an error status.
+        """
+        now = time.monotonic()
+        cached = self._page_cache.get(url)
+        if cached is not None and cached[0] > now:
+            self.logger.debug("Page cache hit", url=url)
+            return cached[1]
+
+        self.rate_limiter.acquire()
+        response = self.session.get(url, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            root = _parse_stream(response.iter_content(chunk_size=_STREAM_CHUNK_BYTES))
+        finally:
+            response.close()
+        self._page_cache[url] = (now + _PAGE_TTL_SECONDS, root)
+        return root
+
     def parse_injury_description(self, desc: str | None) -> tuple[str | None, str | None]:
         """
         Parse injury description to extract injury type and body part.
@@ -71,81 +271,13 @@ class BaseInjuryScraper(ABC):
         Returns:
             Tuple of (injury_type, body_part).
         """
-        if not desc:
+        # Blank cells are common; skip the keyword scans for them outright
+        if not desc or desc.isspace():
             return None, None
 
         desc_lower = desc.lower()
-
-        # Common body parts
-        body_parts = [
-            "acl",
-            "mcl",
-            "pcl",
-            "lcl",
-            "knee",
-            "ankle",
-            "foot",
-            "heel",
-            "toe",
-            "hip",
-            "groin",
-            "thigh",
-            "hamstring",
-            "quad",
-            "calf",
-            "shin",
-            "achilles",
-            "back",
-            "spine",
-            "shoulder",
-            "elbow",
-            "wrist",
-            "hand",
-            "finger",
-            "thumb",
-            "head",
-            "neck",
-            "face",
-            "eye",
-            "nose",
-            "concussion",
-            "chest",
-            "rib",
-        ]
-
-        # Common injury types
-        injury_types = [
-            "strain",
-            "sprain",
-            "fracture",
-            "break",
-            "tear",
-            "rupture",
-            "contusion",
-            "bruise",
-            "soreness",
-            "inflammation",
-            "tendinitis",
-            "bursitis",
-            "dislocation",
-            "subluxation",
-            "concussion",
-            "illness",
-            "infection",
-        ]
-
-        body_part = None
-        for bp in body_parts:
-            if bp in desc_lower:
-                body_part = bp
-                break
-
-        injury_type = None
-        for it in injury_types:
-            if it in desc_lower:
-                injury_type = it
-                break
-
+        injury_type = _first_keyword(_INJURY_TYPE_PATTERN, _INJURY_TYPE_RANK, desc_lower)
+        body_part = _first_keyword(_BODY_PART_PATTERN, _BODY_PART_RANK, desc_lower)
         return injury_type, body_part
 
     def parse_date(self, date_str: str | None) -> date | None:
@@ -163,29 +295,38 @@ class BaseInjuryScraper(ABC):
         if not date_str:
             return None
 
-        # Try common date formats
-        formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%m/%d/%y",
-            "%B %d, %Y",
-            "%b %d, %Y",
-        ]
+        # ISO dates skip strptime, which re-reads its format string every call
+        if len(date_str) == 10 and date_str[4] == "-":
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
 
-        for fmt in formats:
+        # A source uses one format throughout, so start from the last one that
+        # matched instead of failing through the earlier ones on every row.
+        start = self._date_format_index
+        for offset in range(len(_DATE_FORMATS)):
+            index = (start + offset) % len(_DATE_FORMATS)
             try:
-                return datetime.strptime(date_str, fmt).date()
+                parsed = datetime.strptime(date_str, _DATE_FORMATS[index]).date()
             except ValueError:
                 continue
+            self._date_format_index = index
+            return parsed
 
         self.logger.debug("Failed to parse date", date_str=date_str)
         return None
 
-    def normalize_team_name(self, team: str | None) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def normalize_team_name(team: str | None) -> str:
         """
         Normalize team name to standard format.
 
-        Removes extra whitespace and standardizes abbreviations.
+        Removes extra whitespace and standardizes abbreviations. The same
+        few dozen team strings repeat on every row, so results are cached
+        and interned: each distinct team is normalized once and every row
+        shares one string object.
 
         Args:
             team: Raw team name or abbreviation.
@@ -197,7 +338,7 @@ class BaseInjuryScraper(ABC):
             return ""
 
         # Remove extra whitespace
-        normalized = " ".join(team.split())
+        normalized = sys.intern(" ".join(team.split()))
 
         # Common team name mappings (if needed)
         # This can be expanded based on actual data
@@ -227,47 +368,35 @@ class ESPNInjuryScraper(BaseInjuryScraper):
         """
         url = self.BASE_URL
 
-        self.rate_limiter.acquire()
-
         try:
             self.logger.info("Fetching injuries from ESPN", url=url)
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            root = self.get_document(url)
             injuries = []
 
             # ESPN injury page structure varies, but typically has tables
-            # Look for injury tables
-            tables = soup.find_all("table")
-            for table in tables:
-                rows = table.find_all("tr")
-                for row in rows[1:]:  # Skip header row
-                    cols = row.find_all("td")
+            for table in root.iter("table"):
+                rows = table.iter("tr")
+                next(rows, None)  # Skip header row
+                for row in rows:
+                    cols = list(row.iter("td"))
                     if len(cols) >= 3:
                         # Extract player info
-                        player_cell = cols[0]
-                        player_name = player_cell.get_text(strip=True)
+                        player_name = _text(cols[0])
 
                         # Extract team
-                        team_cell = cols[1] if len(cols) > 1 else None
-                        team = team_cell.get_text(strip=True) if team_cell else ""
-                        team = self.normalize_team_name(team)
+                        team = self.normalize_team_name(_text(cols[1]))
 
                         # Extract status
-                        status_cell = cols[2] if len(cols) > 2 else None
-                        status = status_cell.get_text(strip=True) if status_cell else ""
+                        status = _text(cols[2])
 
                         # Extract injury description
-                        desc_cell = cols[3] if len(cols) > 3 else None
-                        injury_desc = desc_cell.get_text(strip=True) if desc_cell else ""
+                        injury_desc = _text(cols[3]) if len(cols) > 3 else ""
 
                         # Parse injury description for type and body part
                         injury_type, body_part = self.parse_injury_description(injury_desc)
 
                         # Extract date (if available)
-                        date_cell = cols[4] if len(cols) > 4 else None
-                        injury_date_str = date_cell.get_text(strip=True) if date_cell else ""
+                        injury_date_str = _text(cols[4]) if len(cols) > 4 else ""
                         injury_date = self.parse_date(injury_date_str)
 
                         injuries.append(
@@ -312,43 +441,35 @@ class RotowireInjuryScraper(BaseInjuryScraper):
         """
         url = self.BASE_URL
 
-        self.rate_limiter.acquire()
-
         try:
             self.logger.info("Fetching injuries from Rotowire", url=url)
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            root = self.get_document(url)
             injuries = []
+            # Rotowire doesn't always show a date; stamp every row of this
+            # fetch with the same day.
+            today = date.today()
 
-            # Rotowire injury page structure
-            # Look for injury listings
-            injury_divs = soup.find_all("div", class_="lineup")
-            for div in injury_divs:
+            # Rotowire injury page structure: one lineup div per team
+            for div in _LINEUP_XPATH(root):
                 # Extract team
-                team_header = div.find("span", class_="team-name")
-                if not team_header:
+                team_header = _first(div, _TEAM_NAME_XPATH)
+                if team_header is None:
                     continue
-                team = team_header.get_text(strip=True)
-                team = self.normalize_team_name(team)
+                team = self.normalize_team_name(_text(team_header))
 
                 # Extract player rows
-                player_rows = div.find_all("div", class_="player")
-                for row in player_rows:
+                for row in _PLAYER_XPATH(div):
                     # Extract player name
-                    player_link = row.find("a", class_="player-name")
-                    if not player_link:
+                    player_link = _first(row, _PLAYER_NAME_XPATH)
+                    if player_link is None:
                         continue
-                    player_name = player_link.get_text(strip=True)
+                    player_name = _text(player_link)
 
                     # Extract status
-                    status_span = row.find("span", class_="status")
-                    status = status_span.get_text(strip=True) if status_span else ""
+                    status = _text(_first(row, _STATUS_XPATH))
 
                     # Extract injury description
-                    desc_div = row.find("div", class_="news")
-                    injury_desc = desc_div.get_text(strip=True) if desc_div else ""
+                    injury_desc = _text(_first(row, _NEWS_XPATH))
 
                     # Parse injury description
                     injury_type, body_part = self.parse_injury_description(injury_desc)
@@ -360,7 +481,7 @@ class RotowireInjuryScraper(BaseInjuryScraper):
                             "status": status,
                             "injury_type": injury_type,
                             "body_part": body_part,
-                            "injury_date": date.today(),  # Rotowire doesn't always show date
+                            "injury_date": today,
                             "notes": injury_desc,
                         }
                     )
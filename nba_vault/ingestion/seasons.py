@@ -8,25 +8,30 @@ Sources:
 
 from __future__ import annotations
 
-import sqlite3
+import operator
 from typing import Any, cast
 
 import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.entities import FranchiseCreate, SeasonCreate
+from nba_vault.schema.connection import transaction
 
 logger = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
-# Static season seed — all 78 NBA/ABA/BAA seasons.
+# Static season seed — one row per BAA/NBA season.
 # Used as fallback and to populate seasons that predate digital API coverage.
 # Format: (season_id, league_id, season_label, games_per_team)  # noqa: ERA001
+#
+# season_id (the start year) is the season table's primary key and every
+# other table's FK target, so a year holds exactly one row. The ABA seasons
+# (1967-68 to 1975-76) share their years with NBA seasons and are not seeded:
+# listing them here only overwrote the NBA rows for those years.
 # ---------------------------------------------------------------------------
-_SEASON_SEED: list[tuple[int, str, str, int | None]] = [
+_SEASON_SEED: tuple[tuple[int, str, str, int | None], ...] = (
     # BAA era
     (1946, "BAA", "1946-47", 60),
     (1947, "BAA", "1947-48", 48),
@@ -108,25 +113,76 @@ _SEASON_SEED: list[tuple[int, str, str, int | None]] = [
     (2022, "NBA", "2022-23", 82),
     (2023, "NBA", "2023-24", 82),
     (2024, "NBA", "2024-25", 82),
-    # ABA seasons (1967-76)
-    (1967, "ABA", "1967-68", 78),
-    (1968, "ABA", "1968-69", 78),
-    (1969, "ABA", "1969-70", 84),
-    (1970, "ABA", "1970-71", 84),
-    (1971, "ABA", "1971-72", 84),
-    (1972, "ABA", "1972-73", 84),
-    (1973, "ABA", "1973-74", 84),
-    (1974, "ABA", "1974-75", 84),
-    (1975, "ABA", "1975-76", 84),
-]
-
-
-@register_ingestor
+)
+
+_SEASON_UPSERT = """
+    INSERT INTO season
+        (season_id, league_id, season_label, games_per_team)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(season_id) DO UPDATE SET
+        league_id      = excluded.league_id,
+        season_label   = excluded.season_label,
+        games_per_team = excluded.games_per_team
+"""
+
+_season_to_row = operator.attrgetter("season_id", "league_id", "season_label", "games_per_team")
+
+_FRANCHISE_UPSERT = """
+    INSERT INTO franchise
+        (franchise_id, nba_franchise_id, current_team_name, current_city,
+         abbreviation, conference, division, founded_year, league_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(franchise_id) DO UPDATE SET
+        nba_franchise_id  = excluded.nba_franchise_id,
+        current_team_name = excluded.current_team_name,
+        current_city      = excluded.current_city,
+        abbreviation      = excluded.abbreviation,
+        conference        = excluded.conference,
+        division          = excluded.division,
+        founded_year      = excluded.founded_year,
+        league_id         = excluded.league_id
+"""
+
+_franchise_to_row = operator.attrgetter(
+    "franchise_id",
+    "nba_franchise_id",
+    "current_team_name",
+    "current_city",
+    "abbreviation",
+    "conference",
+    "division",
+    "founded_year",
+    "league_id",
+)
+
+# NBA.com league codes -> canonical league_id strings
+_LEAGUE_CODES = {"00": "NBA", "01": "ABA", "02": "BAA"}
+
+_FRANCHISE_ADAPTER = pydantic.TypeAdapter(list[FranchiseCreate])
+
+
+def _franchise_fields(row: dict[str, Any]) -> dict[str, Any]:
+    """Map one FranchiseHistory row onto FranchiseCreate fields."""
+    # API field names vary; normalise common variants
+    franchise_id = row.get("TEAM_ID") or row.get("FRANCHISE_ID") or 0
+    return {
+        "franchise_id": franchise_id,
+        "nba_franchise_id": franchise_id,
+        "current_team_name": row.get("TEAM_NAME", "Unknown"),
+        "current_city": row.get("TEAM_CITY", ""),
+        "abbreviation": row.get("TEAM_ABBREVIATION", "UNK"),
+        "conference": row.get("CONFERENCE"),
+        "division": row.get("DIVISION"),
+        "founded_year": row.get("START_YEAR"),
+        "league_id": _LEAGUE_CODES.get(str(row.get("LEAGUE_ID", "00")), "NBA"),
+    }
+
+
 class SeasonIngestor(BaseIngestor):
     """
     Ingestor for NBA/ABA/BAA season metadata.
 
-    Primary source: static seed list (covers all 78+ seasons including ABA era).
+    Primary source: static seed tuple (every BAA/NBA season since 1946-47).
     The season table is a prerequisite for virtually all other ingestors because
     almost every other table has a season_id FK.
 
@@ -143,8 +199,24 @@ class SeasonIngestor(BaseIngestor):
         return {"seasons": _SEASON_SEED}
 
     def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
+        seasons = raw.get("seasons", [])
+        if seasons is _SEASON_SEED:
+            # The seed is a literal in this module and is covered by the test
+            # suite, so build the models without re-running the validators.
+            validated: list[pydantic.BaseModel] = [
+                SeasonCreate.model_construct(
+                    season_id=season_id,
+                    league_id=league_id,
+                    season_label=season_label,
+                    games_per_team=games_per_team,
+                )
+                for season_id, league_id, season_label, games_per_team in seasons
+            ]
+            self.logger.info("Validated seasons", count=len(validated))
+            return validated
+
         validated = []
-        for row in raw.get("seasons", []):
+        for row in seasons:
             season_id, league_id, season_label, games_per_team = row
             try:
                 model = SeasonCreate(
@@ -164,35 +236,16 @@ class SeasonIngestor(BaseIngestor):
         return validated
 
     def upsert(self, model: list[pydantic.BaseModel], conn: Any) -> int:
-        rows_affected = 0
-        conn.execute("BEGIN")
-        try:
-            for season in model:
-                s = cast("SeasonCreate", season)
-                conn.execute(
-                    """
-                    INSERT INTO season
-                        (season_id, league_id, season_label, games_per_team)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(season_id) DO UPDATE SET
-                        league_id      = excluded.league_id,
-                        season_label   = excluded.season_label,
-                        games_per_team = excluded.games_per_team
-                    """,
-                    (s.season_id, s.league_id, s.season_label, s.games_per_team),
-                )
-                rows_affected += 1
-            conn.execute("COMMIT")
-        except sqlite3.Error:
-            conn.execute("ROLLBACK")
-            raise
+        rows = [_season_to_row(cast("SeasonCreate", m)) for m in model]
+        with transaction(conn):
+            conn.executemany(_SEASON_UPSERT, rows)
+        rows_affected = len(rows)
 
         upsert_audit(conn, self.entity_type, "all", "static_seed", "SUCCESS", rows_affected)
         self.logger.info("Upserted seasons", rows_affected=rows_affected)
         return rows_affected
 
 
-@register_ingestor
 class FranchiseIngestor(BaseIngestor):
     """
     Ingestor for NBA franchise history from the nba_api FranchiseHistory endpoint.
@@ -240,76 +293,33 @@ class FranchiseIngestor(BaseIngestor):
             raise
 
     def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
-        validated = []
-        for row in raw.get("franchises", []):
-            try:
-                # API field names vary; normalise common variants
-                franchise_id = row.get("TEAM_ID") or row.get("FRANCHISE_ID") or 0
-                league_id_raw = row.get("LEAGUE_ID", "00")
-                # Map NBA.com league codes to our canonical strings
-                league_map = {"00": "NBA", "01": "ABA", "02": "BAA"}
-                league_id = league_map.get(str(league_id_raw), "NBA")
-
-                model = FranchiseCreate(
-                    franchise_id=int(franchise_id),
-                    nba_franchise_id=int(franchise_id),
-                    current_team_name=row.get("TEAM_NAME", "Unknown"),
-                    current_city=row.get("TEAM_CITY", ""),
-                    abbreviation=row.get("TEAM_ABBREVIATION", "UNK"),
-                    conference=row.get("CONFERENCE"),
-                    division=row.get("DIVISION"),
-                    founded_year=row.get("START_YEAR"),
-                    league_id=league_id,
-                )
-                validated.append(model)
-            except pydantic.ValidationError as e:
-                self.logger.warning(
-                    "Franchise validation failed",
-                    row=row,
-                    error=str(e),
-                )
+        source_rows = raw.get("franchises", [])
+        rows = [_franchise_fields(row) for row in source_rows]
+
+        validated: list[pydantic.BaseModel]
+        try:
+            validated = list(_FRANCHISE_ADAPTER.validate_python(rows))
+        except pydantic.ValidationError:
+            # Fall back to per-row validation so one bad franchise is skipped
+            # rather than discarding the whole history.
+            validated = []
+            for source_row, row in zip(source_rows, rows, strict=True):
+                try:
+                    validated.append(FranchiseCreate.model_validate(row))
+                except pydantic.ValidationError as e:
+                    self.logger.warning(
+                        "Franchise validation failed",
+                        row=source_row,
+                        error=str(e),
+                    )
         self.logger.info("Validated franchises", count=len(validated))
         return validated
 
     def upsert(self, model: list[pydantic.BaseModel], conn: Any) -> int:
-        rows_affected = 0
-        conn.execute("BEGIN")
-        try:
-            for franchise in model:
-                f = cast("FranchiseCreate", franchise)
-                conn.execute(
-                    """
-                    INSERT INTO franchise
-                        (franchise_id, nba_franchise_id, current_team_name, current_city,
-                         abbreviation, conference, division, founded_year, league_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(franchise_id) DO UPDATE SET
-                        nba_franchise_id  = excluded.nba_franchise_id,
-                        current_team_name = excluded.current_team_name,
-                        current_city      = excluded.current_city,
-                        abbreviation      = excluded.abbreviation,
-                        conference        = excluded.conference,
-                        division          = excluded.division,
-                        founded_year      = excluded.founded_year,
-                        league_id         = excluded.league_id
-                    """,
-                    (
-                        f.franchise_id,
-                        f.nba_franchise_id,
-                        f.current_team_name,
-                        f.current_city,
-                        f.abbreviation,
-                        f.conference,
-                        f.division,
-                        f.founded_year,
-                        f.league_id,
-                    ),
-                )
-                rows_affected += 1
-            conn.execute("COMMIT")
-        except sqlite3.Error:
-            conn.execute("ROLLBACK")
-            raise
+        rows = [_franchise_to_row(cast("FranchiseCreate", m)) for m in model]
+        with transaction(conn):
+            conn.executemany(_FRANCHISE_UPSERT, rows)
+        rows_affected = len(rows)
 
         upsert_audit(conn, self.entity_type, "all", "nba_api", "SUCCESS", rows_affected)
         self.logger.info("Upserted franchises", rows_affected=rows_affected)
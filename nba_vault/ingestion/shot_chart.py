@@ -7,21 +7,22 @@ Era gate: available from 1996-97 season onwards.
 
 from __future__ import annotations
 
+import operator
 import sqlite3
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import (
     check_data_availability,
+    existing_fk_values,
     quarantine_row,
-    require_fk,
     set_game_availability_flag,
+    unseen_shots,
     upsert_audit,
 )
 from nba_vault.models.entities import ShotChartRowCreate
@@ -30,8 +31,67 @@ logger = structlog.get_logger(__name__)
 
 _SHOT_CHART_DATASET = "Shot_Chart_Detail"
 
+_SHOT_CHART_INSERT = """
+    INSERT INTO shot_chart
+        (game_id, player_id, team_id, period,
+         minutes_remaining, seconds_remaining,
+         action_type, shot_type,
+         shot_zone_basic, shot_zone_area, shot_zone_range,
+         shot_distance, loc_x, loc_y, shot_made_flag,
+         htm, vtm)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+# shot_chart columns in _SHOT_CHART_INSERT parameter order
+_SHOT_CHART_COLS = (
+    "game_id",
+    "player_id",
+    "team_id",
+    "period",
+    "minutes_remaining",
+    "seconds_remaining",
+    "action_type",
+    "shot_type",
+    "shot_zone_basic",
+    "shot_zone_area",
+    "shot_zone_range",
+    "shot_distance",
+    "loc_x",
+    "loc_y",
+    "shot_made_flag",
+    "htm",
+    "vtm",
+)
+
+_shot_to_row = operator.attrgetter(*_SHOT_CHART_COLS)
+
+_SHOT_CHART_ADAPTER = pydantic.TypeAdapter(list[ShotChartRowCreate])
+
+
+def _shot_fields(row: dict[str, Any], game_id: str) -> dict[str, Any]:
+    """Map one Shot_Chart_Detail row onto ShotChartRowCreate fields."""
+    get = row.get
+    return {
+        "game_id": str(get("GAME_ID", game_id) or game_id).zfill(10),
+        "player_id": int(get("PLAYER_ID", 0) or 0),
+        "team_id": int(get("TEAM_ID", 0) or 0),
+        "period": int(get("PERIOD", 1) or 1),
+        "minutes_remaining": _safe_int(get("MINUTES_REMAINING")),
+        "seconds_remaining": _safe_int(get("SECONDS_REMAINING")),
+        "action_type": str(get("ACTION_TYPE") or "") or None,
+        "shot_type": str(get("SHOT_TYPE") or "") or None,
+        "shot_zone_basic": str(get("SHOT_ZONE_BASIC") or "") or None,
+        "shot_zone_area": str(get("SHOT_ZONE_AREA") or "") or None,
+        "shot_zone_range": str(get("SHOT_ZONE_RANGE") or "") or None,
+        "shot_distance": _safe_int(get("SHOT_DISTANCE")),
+        "loc_x": _safe_int(get("LOC_X")),
+        "loc_y": _safe_int(get("LOC_Y")),
+        "shot_made_flag": int(get("SHOT_MADE_FLAG", 0) or 0),
+        "htm": str(get("HTM") or "") or None,
+        "vtm": str(get("VTM") or "") or None,
+    }
+
 
-@register_ingestor
 class ShotChartIngestor(BaseIngestor):
     """
     Ingestor for shot chart data (1996-97+).
@@ -54,7 +114,7 @@ class ShotChartIngestor(BaseIngestor):
 
     def __init__(self, cache: Any = None, rate_limiter: Any = None) -> None:
         super().__init__(cache, rate_limiter)
-        self._client = NBAStatsClient(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
+        self._client = get_nba_stats_client(cache=self.cache, rate_limiter=self.rate_limiter)  # type: ignore[arg-type]
 
     def fetch(self, entity_id: str, **kwargs: Any) -> dict[str, Any]:
         game_id = entity_id
@@ -98,92 +158,84 @@ class ShotChartIngestor(BaseIngestor):
         self.logger.info("Fetched shots", game_id=game_id, count=len(shots))
         return payload
 
-    def validate(self, raw: dict[str, Any]) -> list[pydantic.BaseModel]:
+    def validate(self, raw: dict[str, Any]) -> list[Any]:
+        """
+        Validate raw shots and return them as _SHOT_CHART_INSERT parameter tuples.
+
+        Rows are checked against ShotChartRowCreate and flattened once here,
+        so upsert() can bind them without reading model attributes back.
+        Invalid rows are quarantined.
+        """
         game_id = raw.get("game_id", "")
-        validated: list[pydantic.BaseModel] = []
+        source_rows: list[dict[str, Any]] = []
+        rows: list[dict[str, Any]] = []
         for row in raw.get("shots", []):
             try:
-                shot_gid = str(row.get("GAME_ID", game_id) or game_id).zfill(10)
-                model = ShotChartRowCreate(
-                    game_id=shot_gid,
-                    player_id=int(row.get("PLAYER_ID", 0) or 0),
-                    team_id=int(row.get("TEAM_ID", 0) or 0),
-                    period=int(row.get("PERIOD", 1) or 1),
-                    minutes_remaining=_safe_int(row.get("MINUTES_REMAINING")),
-                    seconds_remaining=_safe_int(row.get("SECONDS_REMAINING")),
-                    action_type=str(row.get("ACTION_TYPE", "") or "") or None,
-                    shot_type=str(row.get("SHOT_TYPE", "") or "") or None,
-                    shot_zone_basic=str(row.get("SHOT_ZONE_BASIC", "") or "") or None,
-                    shot_zone_area=str(row.get("SHOT_ZONE_AREA", "") or "") or None,
-                    shot_zone_range=str(row.get("SHOT_ZONE_RANGE", "") or "") or None,
-                    shot_distance=_safe_int(row.get("SHOT_DISTANCE")),
-                    loc_x=_safe_int(row.get("LOC_X")),
-                    loc_y=_safe_int(row.get("LOC_Y")),
-                    shot_made_flag=int(row.get("SHOT_MADE_FLAG", 0) or 0),
-                    htm=str(row.get("HTM", "") or "") or None,
-                    vtm=str(row.get("VTM", "") or "") or None,
-                )
-                validated.append(model)
-            except (pydantic.ValidationError, ValueError) as exc:
-                quarantine_row(
-                    Path("data/quarantine"),
-                    self.entity_type,
-                    game_id,
-                    row,
-                    f"validation_error: {exc}",
-                )
+                rows.append(_shot_fields(row, game_id))
+            except ValueError as exc:
+                self._quarantine_shot(game_id, row, exc)
+                continue
+            source_rows.append(row)
+
+        models: list[ShotChartRowCreate]
+        try:
+            models = _SHOT_CHART_ADAPTER.validate_python(rows)
+        except pydantic.ValidationError:
+            # Fall back to per-row validation so one bad shot is quarantined
+            # rather than discarding the whole game.
+            models = []
+            for source_row, row in zip(source_rows, rows, strict=True):
+                try:
+                    models.append(ShotChartRowCreate.model_validate(row))
+                except pydantic.ValidationError as exc:
+                    self._quarantine_shot(game_id, source_row, exc)
+        validated = list(map(_shot_to_row, models))
         self.logger.info("Validated shots", count=len(validated))
         return validated
 
-    def upsert(self, model: list[pydantic.BaseModel], conn: Any) -> int:
-        game_id: str = ""
-        rows_affected = 0
+    def _quarantine_shot(self, game_id: str, row: dict[str, Any], exc: Exception) -> None:
+        quarantine_row(
+            Path("data/quarantine"),
+            self.entity_type,
+            game_id,
+            row,
+            f"validation_error: {exc}",
+        )
+
+    def upsert(self, model: list[Any], conn: Any) -> int:
+        """
+        Insert validated shots for games present in the game table.
+
+        Shots already stored for the game are skipped, so re-ingesting a
+        game does not duplicate it.
+
+        Args:
+            model: Parameter tuples from validate(), or ShotChartRowCreate
+                models, which are flattened here.
+            conn: SQLite database connection.
+
+        Returns:
+            Number of new shots written.
+        """
+        shots: list[tuple[Any, ...]]
+        if all(type(s) is tuple for s in model):
+            shots = model
+        else:
+            shots = [_shot_to_row(s) if isinstance(s, ShotChartRowCreate) else s for s in model]
+        game_id: str = shots[0][0] if shots else ""
+        known_games = existing_fk_values(conn, "game", "game_id", (s[0] for s in shots))
+        rows = [s for s in shots if s[0] in known_games]
         conn.execute("BEGIN")
         try:
-            for item in model:
-                s = cast("ShotChartRowCreate", item)
-                game_id = game_id or s.game_id
-                if not require_fk(conn, "game", "game_id", s.game_id):
-                    continue
-                conn.execute(
-                    """
-                    INSERT INTO shot_chart
-                        (game_id, player_id, team_id, period,
-                         minutes_remaining, seconds_remaining,
-                         action_type, shot_type,
-                         shot_zone_basic, shot_zone_area, shot_zone_range,
-                         shot_distance, loc_x, loc_y, shot_made_flag,
-                         htm, vtm)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT(game_id, player_id, period, loc_x, loc_y) DO NOTHING
-                    """,
-                    (
-                        s.game_id,
-                        s.player_id,
-                        s.team_id,
-                        s.period,
-                        s.minutes_remaining,
-                        s.seconds_remaining,
-                        s.action_type,
-                        s.shot_type,
-                        s.shot_zone_basic,
-                        s.shot_zone_area,
-                        s.shot_zone_range,
-                        s.shot_distance,
-                        s.loc_x,
-                        s.loc_y,
-                        s.shot_made_flag,
-                        s.htm,
-                        s.vtm,
-                    ),
-                )
-                rows_affected += 1
+            rows = unseen_shots(conn, rows)
+            conn.executemany(_SHOT_CHART_INSERT, rows)
             conn.execute("COMMIT")
             if game_id:
                 set_game_availability_flag(conn, game_id, "shot_chart")
         except sqlite3.Error:
             conn.execute("ROLLBACK")
             raise
+        rows_affected = len(rows)
 
         upsert_audit(conn, self.entity_type, game_id or "all", "nba_api", "SUCCESS", rows_affected)
         self.logger.info("Upserted shots", rows_affected=rows_affected)
@@ -17,7 +17,9 @@ available seasons. pbpstats data is loaded into the possession table.
 Column mapping is derived from description_fields.md in the source repo.
 
 Each season/type combination is tracked in ingestion_audit so the ingestor
-is fully resumable — already-completed seasons are skipped.
+is fully resumable — already-completed seasons are skipped. Up to four
+seasons download and parse at once; rows are written on the caller's
+connection one season at a time.
 
 Usage:
     ingestor = ShufinskiyPBPIngestor()
@@ -31,18 +33,28 @@ Usage:
 
 from __future__ import annotations
 
-import csv
-import io
+import re
 import sqlite3
 import tarfile
+import urllib.error
 import urllib.request
-from typing import Any
-
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.registry import register_ingestor
-from nba_vault.ingestion.validation import upsert_audit
+from nba_vault.ingestion.validation import unseen_shots, upsert_audit
+from nba_vault.schema.connection import deferred_indexes, transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Future
 
 logger = structlog.get_logger(__name__)
 
@@ -57,12 +69,165 @@ _PBPSTATS_START = 2000
 # Current season (update annually)
 _CURRENT_SEASON = 2024
 
+# Seasons downloaded and parsed concurrently; writes stay on one connection
+_DOWNLOAD_WORKERS = 4
+
+# Runs loading at least this many seasons drop the target tables' secondary
+# indexes for the load and rebuild them afterwards (see deferred_indexes);
+# below it, re-indexing the whole table costs more than the inserts save.
+_DEFER_INDEX_SEASONS = 4
+
+# Bytes of CSV tokenised per pyarrow block; each block is coerced column by
+# column with Arrow compute kernels before its rows are queued for insert.
+_CSV_BLOCK_BYTES = 1 << 20
+
+# Cells treated as missing
+_NULL_TOKENS = ("", "None", "null", "NA")
+# _safe_int also treats a literal zero float as missing
+_SAFE_INT_NULLS = frozenset((*_NULL_TOKENS, "0.0"))
+
+# CSV columns read for each source; any missing from a file come back null
+_NBASTATS_COLUMNS = (
+    "GAME_ID",
+    "EVENTNUM",
+    "PERIOD",
+    "PCTIMESTRING",
+    "WCTIMESTRING",
+    "EVENTMSGTYPE",
+    "EVENTMSGACTIONTYPE",
+    "HOMEDESCRIPTION",
+    "VISITORDESCRIPTION",
+    "SCORE",
+    "SCOREMARGIN",
+    "PLAYER1_ID",
+    "PLAYER1_TEAM_ID",
+    "PLAYER2_ID",
+    "PLAYER2_TEAM_ID",
+    "PLAYER3_ID",
+    "PLAYER3_TEAM_ID",
+    "VIDEO_AVAILABLE_FLAG",
+)
+_SHOTDETAIL_COLUMNS = (
+    "GAME_ID",
+    "PLAYER_ID",
+    "TEAM_ID",
+    "PERIOD",
+    "MINUTES_REMAINING",
+    "SECONDS_REMAINING",
+    "ACTION_TYPE",
+    "SHOT_TYPE",
+    "SHOT_ZONE_BASIC",
+    "SHOT_ZONE_AREA",
+    "SHOT_ZONE_RANGE",
+    "SHOT_DISTANCE",
+    "LOC_X",
+    "LOC_Y",
+    "SHOT_MADE_FLAG",
+    "HTM",
+    "VTM",
+)
+_PBPSTATS_COLUMNS = (
+    "GAMEID",
+    "PERIOD",
+    "STARTTIME",
+    "ENDTIME",
+    "FG2M",
+    "FG3M",
+    "STARTTYPE",
+    "TURNOVERS",
+)
+
+# RE2 patterns (pyarrow.compute.extract_regex) for the "MM:SS" period clock
+# and "HHH - VVV" score cells; anything else parses to null.
+_PC_TIME_PATTERN = r"^\s*(?P<min>-?\d+)\s*:\s*(?P<sec>-?\d+)\s*$"
+_SCORE_PATTERN = r"^\s*(?P<home>\d+)\s*-\s*(?P<visitor>\d+)\s*$"
+# The same patterns for the per-cell fallbacks, so both paths agree
+_PC_TIME_RE = re.compile(_PC_TIME_PATTERN)
+_SCORE_RE = re.compile(_SCORE_PATTERN)
+
+_PBP_UPSERT = """
+    INSERT INTO play_by_play
+        (game_id, event_num, period, pc_time, wc_time,
+         event_type, event_action_type,
+         description_home, description_visitor,
+         score_home, score_visitor, score_margin,
+         player1_id, player1_team_id,
+         player2_id, player2_team_id,
+         player3_id, player3_team_id,
+         video_available)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(game_id, event_num) DO UPDATE SET
+        period             = excluded.period,
+        pc_time            = excluded.pc_time,
+        wc_time            = excluded.wc_time,
+        event_type         = excluded.event_type,
+        event_action_type  = excluded.event_action_type,
+        description_home   = excluded.description_home,
+        description_visitor = excluded.description_visitor,
+        score_home         = excluded.score_home,
+        score_visitor      = excluded.score_visitor,
+        score_margin       = excluded.score_margin,
+        player1_id         = excluded.player1_id,
+        player1_team_id    = excluded.player1_team_id,
+        player2_id         = excluded.player2_id,
+        player2_team_id    = excluded.player2_team_id,
+        player3_id         = excluded.player3_id,
+        player3_team_id    = excluded.player3_team_id,
+        video_available    = excluded.video_available
+"""
+
+_SHOT_INSERT = """
+    INSERT INTO shot_chart
+        (game_id, player_id, team_id, period,
+         minutes_remaining, seconds_remaining,
+         action_type, shot_type,
+         shot_zone_basic, shot_zone_area, shot_zone_range,
+         shot_distance, loc_x, loc_y,
+         shot_made_flag, htm, vtm)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+# possession columns loaded from pbpstats, in parameter-tuple order; the
+# upsert below is generated from this list and keyed on _POSSESSION_KEY.
+_POSSESSION_FIELDS = (
+    "game_id",
+    "possession_number",
+    "period",
+    "start_time",
+    "end_time",
+    "points_scored",
+    "play_type",
+    "outcome_type",
+)
+_POSSESSION_KEY = ("game_id", "possession_number")
+
+_POSSESSION_UPSERT = (
+    f"INSERT INTO possession ({', '.join(_POSSESSION_FIELDS)}) "  # noqa: S608
+    f"VALUES ({', '.join('?' * len(_POSSESSION_FIELDS))}) "
+    f"ON CONFLICT({', '.join(_POSSESSION_KEY)}) DO UPDATE SET "
+    + ", ".join(f"{f} = excluded.{f}" for f in _POSSESSION_FIELDS if f not in _POSSESSION_KEY)
+)
+
+
+# (season, season_type, parameter tuples per archive source)
+# (season, season_type, rows per source); a source whose download failed maps to None
+type _ParsedSeason = tuple[int, str, dict[str, list[tuple[Any, ...]] | None]]
+
+# Tables the archive sources load into
+_SOURCE_TABLES = ("play_by_play", "shot_chart", "possession")
+
+# Statement each archive source's rows are written with
+_SOURCE_SQL = {
+    "nbastats": _PBP_UPSERT,
+    "shotdetail": _SHOT_INSERT,
+    "pbpstats": _POSSESSION_UPSERT,
+}
+
 
 def _available_seasons(start: int) -> list[int]:
     return list(range(start, _CURRENT_SEASON + 1))
 
 
-@register_ingestor
 class ShufinskiyPBPIngestor(BaseIngestor):
     """
     Bulk ingestor for pre-assembled NBA PBP + shot chart data (1996-present).
@@ -87,27 +252,44 @@ class ShufinskiyPBPIngestor(BaseIngestor):
         Fetch the list_data.txt manifest from the repo to resolve download URLs,
         then return the manifest. Actual CSV downloads happen in upsert() to
         avoid holding all data in memory simultaneously.
+
+        A cached manifest is revalidated with If-None-Match against the ETag
+        it was stored with: a 304 reuses the cached parse, and if the request
+        fails outright the cached copy is used as is.
         """
         cache_key = "shufinskiy_manifest"
-        cached = self.cache.get(cache_key)
-        if cached:
-            return cached  # type: ignore[return-value]
+        cached: dict[str, Any] | None = self.cache.get(cache_key)
+        request = urllib.request.Request(_LIST_URL)
+        if cached and cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
 
         self.logger.info("Fetching shufinskiy manifest", url=_LIST_URL)
-        with urllib.request.urlopen(_LIST_URL, timeout=60) as resp:  # noqa: S310
-            content = resp.read().decode("utf-8")
+        try:
+            with urllib.request.urlopen(request, timeout=60) as resp:  # noqa: S310
+                content = resp.read().decode("utf-8")
+                etag = resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not cached:
+                raise
+            self.logger.info("Manifest unchanged", entries=len(cached["manifest"]))
+            return {**cached, "entity_id": entity_id}
+        except urllib.error.URLError as e:
+            if not cached:
+                raise
+            self.logger.warning("Manifest refresh failed, using cached copy", error=str(e))
+            return {**cached, "entity_id": entity_id}
 
         # Parse "key=url" lines into a dict
         manifest: dict[str, str] = {}
         for raw_line in content.splitlines():
-            line = raw_line.strip()
-            if "=" in line:
-                key, url = line.split("=", 1)
+            key, sep, url = raw_line.partition("=")
+            if sep:
                 manifest[key.strip()] = url.strip()
 
         payload: dict[str, Any] = {
             "manifest": manifest,
             "entity_id": entity_id,
+            "etag": etag,
         }
         self.cache.set(cache_key, payload)
         self.logger.info("Manifest loaded", entries=len(manifest))
@@ -124,284 +306,272 @@ class ShufinskiyPBPIngestor(BaseIngestor):
         manifest: dict[str, str] = payload.get("manifest", {})
         entity_id: str = payload.get("entity_id", "all")
 
-        # Determine which (season, season_type) pairs to process
-        targets = _resolve_targets(entity_id)
-
+        todo: list[tuple[int, str]] = []
+        for season, season_type in _resolve_targets(entity_id):
+            audit_id = _audit_id(season, season_type)
+            if _already_done(conn, self.entity_type, audit_id):
+                self.logger.debug("Season already ingested, skipping", season=audit_id)
+            else:
+                todo.append((season, season_type))
+        # One lookup set for every CSV row in the run instead of a SELECT per row
+        known = pa.array(list(_known_game_ids(conn)), pa.string())
+
+        # Archives download and parse on worker threads; every write stays on
+        # this thread's connection, in target order. At most _DOWNLOAD_WORKERS
+        # parsed seasons wait in memory for the writer.
         total_rows = 0
-        for season, season_type in targets:
-            total_rows += self._ingest_season(conn, manifest, season, season_type)
+        with ExitStack() as deferred:
+            # Multi-season loads rebuild the target tables' secondary indexes
+            # once at the end instead of maintaining them row by row.
+            if len(todo) >= _DEFER_INDEX_SEASONS:
+                for table in _SOURCE_TABLES:
+                    deferred.enter_context(deferred_indexes(conn, table))
+            pool = ThreadPoolExecutor(
+                max_workers=_DOWNLOAD_WORKERS, thread_name_prefix="shufinskiy"
+            )
+            try:
+                pending: deque[Future[_ParsedSeason]] = deque()
+                for season, season_type in todo:
+                    pending.append(
+                        pool.submit(self._download_season, manifest, known, season, season_type)
+                    )
+                    if len(pending) >= _DOWNLOAD_WORKERS:
+                        total_rows += self._write_season(conn, *pending.popleft().result())
+                while pending:
+                    total_rows += self._write_season(conn, *pending.popleft().result())
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
 
         upsert_audit(conn, self.entity_type, entity_id, "shufinskiy_github", "SUCCESS", total_rows)
         return total_rows
 
-    def _ingest_season(
+    def _download_season(
         self,
-        conn: Any,
         manifest: dict[str, str],
+        known: pa.Array,
         season: int,
         season_type: str,
-    ) -> int:
-        """Ingest one season's PBP + shot chart data. Returns rows inserted."""
+    ) -> _ParsedSeason:
+        """
+        Download and parse one season's archives without touching the database.
+
+        Returns:
+            (season, season_type, rows) where rows maps each source present in
+            the manifest to its parameter tuples for _SOURCE_SQL, or to None
+            if its archive could not be downloaded or parsed.
+        """
         suffix = "_po" if season_type == "po" else ""
-        audit_id = f"{season}{suffix}"
-        rows_total = 0
+        self.logger.info("Ingesting shufinskiy season", season=_audit_id(season, season_type))
+        rows: dict[str, list[tuple[Any, ...]] | None] = {}
+        for source, start, parse in (
+            ("nbastats", _NBASTATS_START, self._parse_nbastats),
+            ("shotdetail", _SHOTDETAIL_START, self._parse_shotdetail),
+            ("pbpstats", _PBPSTATS_START, self._parse_pbpstats),
+        ):
+            key = f"{source}{suffix}_{season}"
+            if key in manifest and season >= start:
+                rows[source] = parse(manifest[key], known)
+        return season, season_type, rows
+
+    def _write_season(
+        self,
+        conn: Any,
+        season: int,
+        season_type: str,
+        rows: dict[str, list[tuple[Any, ...]] | None],
+    ) -> int:
+        """
+        Write one season's parsed rows and mark it done. Returns rows inserted.
 
-        # Check if already done
-        if _already_done(conn, self.entity_type, audit_id):
-            self.logger.debug("Season already ingested, skipping", season=audit_id)
+        Every source and the season's audit row commit in one transaction, so
+        a season is stored whole or not at all and is only marked done once
+        all of its rows are in. A season with a failed download writes no
+        rows and a FAILED audit row, so the next run retries it.
+        """
+        audit_id = _audit_id(season, season_type)
+        loaded = {source: parsed for source, parsed in rows.items() if parsed is not None}
+        failed = [source for source in rows if source not in loaded]
+        if failed:
+            with transaction(conn):
+                upsert_audit(
+                    conn,
+                    self.entity_type,
+                    audit_id,
+                    "shufinskiy_github",
+                    "FAILED",
+                    error_message=f"download failed: {', '.join(failed)}",
+                )
+            self.logger.warning("Season not ingested", season=audit_id, failed=failed)
             return 0
 
-        self.logger.info("Ingesting shufinskiy season", season=audit_id)
-
-        # --- nbastats (play_by_play) ---
-        nbastats_key = f"nbastats{suffix}_{season}"
-        if nbastats_key in manifest and season >= _NBASTATS_START:
-            rows_total += self._load_nbastats(conn, manifest[nbastats_key], season, season_type)
-
-        # --- shotdetail (shot_chart) ---
-        shot_key = f"shotdetail{suffix}_{season}"
-        if shot_key in manifest and season >= _SHOTDETAIL_START:
-            rows_total += self._load_shotdetail(conn, manifest[shot_key], season, season_type)
-
-        # --- pbpstats (possession) ---
-        pbp_key = f"pbpstats{suffix}_{season}"
-        if pbp_key in manifest and season >= _PBPSTATS_START:
-            rows_total += self._load_pbpstats(conn, manifest[pbp_key], season, season_type)
-
-        upsert_audit(conn, self.entity_type, audit_id, "shufinskiy_github", "SUCCESS", rows_total)
+        rows_total = 0
+        with transaction(conn):
+            for source, parsed in loaded.items():
+                params = unseen_shots(conn, parsed) if source == "shotdetail" else parsed
+                conn.executemany(_SOURCE_SQL[source], params)
+                rows_total += len(params)
+                self.logger.debug(
+                    "Loaded archive rows",
+                    source=source,
+                    season=season,
+                    type=season_type,
+                    rows=len(params),
+                )
+            upsert_audit(
+                conn, self.entity_type, audit_id, "shufinskiy_github", "SUCCESS", rows_total
+            )
         self.logger.info("Season ingested", season=audit_id, rows=rows_total)
         return rows_total
 
-    def _download_csv(self, url: str) -> list[dict[str, str]]:
-        """Download a tar.xz archive and extract the single CSV inside."""
-        self.logger.debug("Downloading archive", url=url)
-        with urllib.request.urlopen(url, timeout=300) as resp:  # noqa: S310
-            data = resp.read()
-
-        with tarfile.open(fileobj=io.BytesIO(data), mode="r:xz") as tar:
-            csv_members = [m for m in tar.getmembers() if m.name.endswith(".csv")]
-            if not csv_members:
-                self.logger.warning("No CSV found in archive", url=url)
-                return []
-            f = tar.extractfile(csv_members[0])
-            if f is None:
-                return []
-            content = f.read().decode("utf-8")
-
-        reader = csv.DictReader(io.StringIO(content))
-        return list(reader)
-
-    def _load_nbastats(self, conn: Any, url: str, season: int, season_type: str) -> int:
-        """Load nbastats CSV rows into play_by_play table."""
-        try:
-            rows = self._download_csv(url)
-        except Exception as e:
-            self.logger.warning("Failed to download nbastats", url=url, error=str(e))
-            return 0
-
-        inserted = 0
-        conn.execute("BEGIN")
-        try:
-            for row in rows:
-                game_id = row.get("GAME_ID", "").strip()
-                event_num = _safe_int(row.get("EVENTNUM"))
-                period = _safe_int(row.get("PERIOD"))
-                if not game_id or event_num is None or period is None:
-                    continue
+    def _download_batches(self, url: str, columns: tuple[str, ...]) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the first CSV inside a tar.xz archive as text RecordBatches.
 
-                # Only insert if the game exists in the game table
-                if not _game_exists(conn, game_id):
+        The archive is decompressed and parsed as it downloads ("r|xz" reads
+        the tar sequentially without seeking) and pyarrow tokenises the member
+        _CSV_BLOCK_BYTES at a time, so neither the archive nor the CSV text is
+        ever held in memory whole. Every requested column is read as text
+        (null when absent from the file) and coerced by the loaders.
+        """
+        self.rate_limiter.acquire()
+        self.logger.debug("Downloading archive", url=url)
+        with (
+            urllib.request.urlopen(url, timeout=300) as resp,  # noqa: S310
+            tarfile.open(fileobj=resp, mode="r|xz") as tar,
+        ):
+            for member in tar:
+                if not member.name.endswith(".csv"):
                     continue
-
-                pc_time_str = row.get("PCTIMESTRING", "").strip()
-                pc_time = _parse_pc_time(pc_time_str)
-
-                conn.execute(
-                    """
-                    INSERT INTO play_by_play
-                        (game_id, event_num, period, pc_time, wc_time,
-                         event_type, event_action_type,
-                         description_home, description_visitor,
-                         score_home, score_visitor, score_margin,
-                         player1_id, player1_team_id,
-                         player2_id, player2_team_id,
-                         player3_id, player3_team_id,
-                         video_available)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT(game_id, event_num) DO UPDATE SET
-                        period             = excluded.period,
-                        pc_time            = excluded.pc_time,
-                        wc_time            = excluded.wc_time,
-                        event_type         = excluded.event_type,
-                        event_action_type  = excluded.event_action_type,
-                        description_home   = excluded.description_home,
-                        description_visitor = excluded.description_visitor,
-                        score_home         = excluded.score_home,
-                        score_visitor      = excluded.score_visitor,
-                        score_margin       = excluded.score_margin,
-                        player1_id         = excluded.player1_id,
-                        player1_team_id    = excluded.player1_team_id,
-                        player2_id         = excluded.player2_id,
-                        player2_team_id    = excluded.player2_team_id,
-                        player3_id         = excluded.player3_id,
-                        player3_team_id    = excluded.player3_team_id,
-                        video_available    = excluded.video_available
-                    """,
-                    (
-                        game_id,
-                        event_num,
-                        period,
-                        pc_time,
-                        row.get("WCTIMESTRING", "").strip() or None,
-                        _safe_int(row.get("EVENTMSGTYPE")),
-                        _safe_int(row.get("EVENTMSGACTIONTYPE")),
-                        row.get("HOMEDESCRIPTION", "").strip() or None,
-                        row.get("VISITORDESCRIPTION", "").strip() or None,
-                        _parse_score(row.get("SCORE", ""), "home"),
-                        _parse_score(row.get("SCORE", ""), "visitor"),
-                        _safe_int(row.get("SCOREMARGIN")),
-                        _safe_int(row.get("PLAYER1_ID")),
-                        _safe_int(row.get("PLAYER1_TEAM_ID")),
-                        _safe_int(row.get("PLAYER2_ID")),
-                        _safe_int(row.get("PLAYER2_TEAM_ID")),
-                        _safe_int(row.get("PLAYER3_ID")),
-                        _safe_int(row.get("PLAYER3_TEAM_ID")),
-                        1 if row.get("VIDEO_AVAILABLE_FLAG", "0") == "1" else 0,
+                f = tar.extractfile(member)
+                if f is None:
+                    return
+                yield from pa_csv.open_csv(
+                    f,
+                    read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_BYTES),
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=list(columns),
+                        include_missing_columns=True,
+                        column_types=dict.fromkeys(columns, pa.string()),
+                        null_values=list(_NULL_TOKENS),
+                        strings_can_be_null=True,
                     ),
                 )
-                inserted += 1
-            conn.execute("COMMIT")
-        except sqlite3.Error:
-            conn.execute("ROLLBACK")
-            raise
+                return
+        self.logger.warning("No CSV found in archive", url=url)
 
-        self.logger.debug("Loaded nbastats rows", season=season, type=season_type, rows=inserted)
-        return inserted
+    def _parse_nbastats(self, url: str, known: pa.Array) -> list[tuple[Any, ...]] | None:
+        """Parse nbastats CSV rows into play_by_play parameter tuples (None on failure)."""
+        params: list[tuple[Any, ...]] = []
+        try:
+            for batch in self._download_batches(url, _NBASTATS_COLUMNS):
+                game_ids = _text_array(batch.column("GAME_ID"))
+                event_nums = _int_array(batch.column("EVENTNUM"))
+                periods = _int_array(batch.column("PERIOD"))
+                # Only rows for games already in the game table are kept
+                keep = _keep_mask(game_ids, known, event_nums, periods)
+                col = batch.filter(keep).column
+                score_home, score_visitor = _score_arrays(col("SCORE"))
+                columns = [
+                    game_ids.filter(keep),
+                    event_nums.filter(keep),
+                    periods.filter(keep),
+                    _pc_time_array(col("PCTIMESTRING")),
+                    _text_array(col("WCTIMESTRING")),
+                    _int_array(col("EVENTMSGTYPE")),
+                    _int_array(col("EVENTMSGACTIONTYPE")),
+                    _text_array(col("HOMEDESCRIPTION")),
+                    _text_array(col("VISITORDESCRIPTION")),
+                    score_home,
+                    score_visitor,
+                    _int_array(col("SCOREMARGIN")),
+                    _int_array(col("PLAYER1_ID")),
+                    _int_array(col("PLAYER1_TEAM_ID")),
+                    _int_array(col("PLAYER2_ID")),
+                    _int_array(col("PLAYER2_TEAM_ID")),
+                    _int_array(col("PLAYER3_ID")),
+                    _int_array(col("PLAYER3_TEAM_ID")),
+                    _flag_array(col("VIDEO_AVAILABLE_FLAG")),
+                ]
+                params.extend(zip(*(c.to_pylist() for c in columns), strict=True))
+        except Exception as e:
+            self.logger.warning("Failed to download nbastats", url=url, error=str(e))
+            return None
+        return params
 
-    def _load_shotdetail(self, conn: Any, url: str, season: int, season_type: str) -> int:
-        """Load shotdetail CSV rows into shot_chart table."""
+    def _parse_shotdetail(self, url: str, known: pa.Array) -> list[tuple[Any, ...]] | None:
+        """Parse shotdetail CSV rows into shot_chart parameter tuples (None on failure)."""
+        params: list[tuple[Any, ...]] = []
         try:
-            rows = self._download_csv(url)
+            for batch in self._download_batches(url, _SHOTDETAIL_COLUMNS):
+                game_ids = _text_array(batch.column("GAME_ID"))
+                player_ids = _int_array(batch.column("PLAYER_ID"))
+                periods = _int_array(batch.column("PERIOD"))
+                keep = _keep_mask(game_ids, known, player_ids, periods)
+                col = batch.filter(keep).column
+                columns = [
+                    game_ids.filter(keep),
+                    player_ids.filter(keep),
+                    _int_array(col("TEAM_ID")),
+                    periods.filter(keep),
+                    _int_array(col("MINUTES_REMAINING")),
+                    _int_array(col("SECONDS_REMAINING")),
+                    _text_array(col("ACTION_TYPE")),
+                    _text_array(col("SHOT_TYPE")),
+                    _text_array(col("SHOT_ZONE_BASIC")),
+                    _text_array(col("SHOT_ZONE_AREA")),
+                    _text_array(col("SHOT_ZONE_RANGE")),
+                    _int_array(col("SHOT_DISTANCE")),
+                    _int_array(col("LOC_X")),
+                    _int_array(col("LOC_Y")),
+                    _flag_array(col("SHOT_MADE_FLAG")),
+                    _text_array(col("HTM")),
+                    _text_array(col("VTM")),
+                ]
+                params.extend(zip(*(c.to_pylist() for c in columns), strict=True))
         except Exception as e:
             self.logger.warning("Failed to download shotdetail", url=url, error=str(e))
-            return 0
+            return None
+        return params
 
-        inserted = 0
-        conn.execute("BEGIN")
+    def _parse_pbpstats(self, url: str, known: pa.Array) -> list[tuple[Any, ...]] | None:
+        """Parse pbpstats CSV rows into possession parameter tuples (None on failure)."""
+        params: list[tuple[Any, ...]] = []
+        offset = 0
         try:
-            for row in rows:
-                game_id = row.get("GAME_ID", "").strip()
-                player_id = _safe_int(row.get("PLAYER_ID"))
-                team_id = _safe_int(row.get("TEAM_ID"))
-                period = _safe_int(row.get("PERIOD"))
-                if not game_id or player_id is None or period is None:
-                    continue
-
-                if not _game_exists(conn, game_id):
-                    continue
-
-                conn.execute(
-                    """
-                    INSERT INTO shot_chart
-                        (game_id, player_id, team_id, period,
-                         minutes_remaining, seconds_remaining,
-                         action_type, shot_type,
-                         shot_zone_basic, shot_zone_area, shot_zone_range,
-                         shot_distance, loc_x, loc_y,
-                         shot_made_flag, htm, vtm)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT DO NOTHING
-                    """,
-                    (
-                        game_id,
-                        player_id,
-                        team_id,
-                        period,
-                        _safe_int(row.get("MINUTES_REMAINING")),
-                        _safe_int(row.get("SECONDS_REMAINING")),
-                        row.get("ACTION_TYPE", "").strip() or None,
-                        row.get("SHOT_TYPE", "").strip() or None,
-                        row.get("SHOT_ZONE_BASIC", "").strip() or None,
-                        row.get("SHOT_ZONE_AREA", "").strip() or None,
-                        row.get("SHOT_ZONE_RANGE", "").strip() or None,
-                        _safe_int(row.get("SHOT_DISTANCE")),
-                        _safe_int(row.get("LOC_X")),
-                        _safe_int(row.get("LOC_Y")),
-                        1 if row.get("SHOT_MADE_FLAG", "0") == "1" else 0,
-                        row.get("HTM", "").strip() or None,
-                        row.get("VTM", "").strip() or None,
+            for batch in self._download_batches(url, _PBPSTATS_COLUMNS):
+                # possession_number is the 1-based row number within the whole
+                # CSV (an approximation), counted before any row is skipped
+                numbers = pa.array(range(offset + 1, offset + batch.num_rows + 1), pa.int64())
+                offset += batch.num_rows
+
+                game_ids = _text_array(batch.column("GAMEID"))
+                periods = _int_array(batch.column("PERIOD"))
+                start_times = _time_array(batch.column("STARTTIME"))
+                keep = _keep_mask(game_ids, known, periods, start_times)
+                col = batch.filter(keep).column
+                fg2m = pc.fill_null(_int_array(col("FG2M")), 0)
+                fg3m = pc.fill_null(_int_array(col("FG3M")), 0)
+                turnovers = pc.fill_null(_int_array(col("TURNOVERS")), 0)
+                columns = {
+                    "game_id": game_ids.filter(keep),
+                    "possession_number": numbers.filter(keep),
+                    "period": periods.filter(keep),
+                    "start_time": start_times.filter(keep),
+                    "end_time": _time_array(col("ENDTIME")),
+                    "points_scored": pc.add(pc.multiply(fg2m, 2), pc.multiply(fg3m, 3)),
+                    "play_type": _text_array(col("STARTTYPE")),
+                    "outcome_type": pc.if_else(
+                        pc.greater(turnovers, 0),
+                        pa.scalar("turnover"),
+                        pa.scalar(None, pa.string()),
                     ),
-                )
-                inserted += 1
-            conn.execute("COMMIT")
-        except sqlite3.Error:
-            conn.execute("ROLLBACK")
-            raise
-
-        self.logger.debug("Loaded shotdetail rows", season=season, type=season_type, rows=inserted)
-        return inserted
-
-    def _load_pbpstats(self, conn: Any, url: str, season: int, season_type: str) -> int:
-        """Load pbpstats CSV rows into possession table."""
-        try:
-            rows = self._download_csv(url)
+                }
+                values = (columns[f].to_pylist() for f in _POSSESSION_FIELDS)
+                params.extend(zip(*values, strict=True))
         except Exception as e:
             self.logger.warning("Failed to download pbpstats", url=url, error=str(e))
-            return 0
-
-        inserted = 0
-        conn.execute("BEGIN")
-        try:
-            for i, row in enumerate(rows):
-                game_id = row.get("GAMEID", "").strip()
-                period = _safe_int(row.get("PERIOD"))
-                if not game_id or period is None:
-                    continue
-
-                if not _game_exists(conn, game_id):
-                    continue
-
-                start_time = _parse_time_str(row.get("STARTTIME", ""))
-                end_time = _parse_time_str(row.get("ENDTIME", ""))
-                if start_time is None:
-                    continue
-
-                # possession_number within game derived from row order per game
-                conn.execute(
-                    """
-                    INSERT INTO possession
-                        (game_id, possession_number, period,
-                         start_time, end_time,
-                         points_scored, play_type, outcome_type)
-                    VALUES (?,?,?,?,?,?,?,?)
-                    ON CONFLICT(game_id, possession_number) DO UPDATE SET
-                        period        = excluded.period,
-                        start_time    = excluded.start_time,
-                        end_time      = excluded.end_time,
-                        points_scored = excluded.points_scored,
-                        play_type     = excluded.play_type,
-                        outcome_type  = excluded.outcome_type
-                    """,
-                    (
-                        game_id,
-                        i + 1,  # approximate possession number within the CSV slice
-                        period,
-                        start_time,
-                        end_time,
-                        (_safe_int(row.get("FG2M", "0")) or 0) * 2
-                        + (_safe_int(row.get("FG3M", "0")) or 0) * 3,
-                        row.get("STARTTYPE", "").strip() or None,
-                        "turnover" if (_safe_int(row.get("TURNOVERS", "0")) or 0) > 0 else None,
-                    ),
-                )
-                inserted += 1
-            conn.execute("COMMIT")
-        except sqlite3.Error:
-            conn.execute("ROLLBACK")
-            raise
-
-        self.logger.debug("Loaded pbpstats rows", season=season, type=season_type, rows=inserted)
-        return inserted
+            return None
+        return params
 
 
 # ---------------------------------------------------------------------------
@@ -424,6 +594,11 @@ def _resolve_targets(entity_id: str) -> list[tuple[int, str]]:
     return [(season, "rg")] if season else []
 
 
+def _audit_id(season: int, season_type: str) -> str:
+    """ingestion_audit entity_id for one season/type ("2023" or "2023_po")."""
+    return f"{season}_po" if season_type == "po" else str(season)
+
+
 def _already_done(conn: Any, entity_type: str, entity_id: str) -> bool:
     try:
         row = conn.execute(
@@ -436,25 +611,91 @@ def _already_done(conn: Any, entity_type: str, entity_id: str) -> bool:
         return False
 
 
-def _game_exists(conn: Any, game_id: str) -> bool:
+def _known_game_ids(conn: Any) -> frozenset[str]:
+    """Return every game_id in the game table (empty if the lookup fails)."""
     try:
-        row = conn.execute("SELECT 1 FROM game WHERE game_id=? LIMIT 1", (game_id,)).fetchone()
-        return row is not None
+        return frozenset(r[0] for r in conn.execute("SELECT game_id FROM game"))
     except sqlite3.Error:
-        return False
+        return frozenset()
+
+
+def _keep_mask(game_ids: pa.Array, known: pa.Array, *required: pa.Array) -> pa.Array:
+    """Mask rows whose game_id is in known and whose required columns are all set."""
+    mask = pc.is_in(game_ids, value_set=known)
+    for values in required:
+        mask = pc.and_(mask, pc.is_valid(values))
+    return mask
+
+
+def _text_array(values: pa.Array) -> pa.Array:
+    """Strip a text column, with blank cells as null."""
+    trimmed = pc.utf8_trim_whitespace(values)
+    return pc.if_else(pc.equal(trimmed, ""), pa.scalar(None, pa.string()), trimmed)
+
+
+def _flag_array(values: pa.Array) -> pa.Array:
+    """Map a 0/1 flag column to int64, 1 only for cells that are exactly "1"."""
+    return pc.cast(pc.fill_null(pc.equal(values, "1"), False), pa.int64())
+
+
+def _int_array(values: pa.Array) -> pa.Array:
+    """
+    Coerce a text column to int64 with _safe_int semantics.
+
+    Decimals are truncated like int(float(s)) and zero becomes null. A block
+    with a cell Arrow cannot cast goes through _safe_int cell by cell.
+    """
+    try:
+        floats = pc.cast(pc.utf8_trim_whitespace(values), pa.float64())
+        # NaN / inf have no integer value; null them before the truncating cast
+        floats = pc.if_else(pc.is_finite(floats), floats, None)
+        ints = pc.cast(floats, options=pc.CastOptions(pa.int64(), allow_float_truncate=True))
+    except pa.ArrowInvalid:
+        return pa.array([_safe_int(v) for v in values.to_pylist()], pa.int64())
+    return pc.if_else(pc.equal(ints, 0), pa.scalar(None, pa.int64()), ints)
+
+
+def _time_array(values: pa.Array) -> pa.Array:
+    """Coerce decimal seconds in one cast; blocks with "MM:SS" cells go per cell."""
+    try:
+        return pc.cast(pc.utf8_trim_whitespace(values), pa.float64())
+    except pa.ArrowInvalid:
+        return pa.array([_parse_time_str(v or "") for v in values.to_pylist()], pa.float64())
+
+
+def _pc_time_array(values: pa.Array) -> pa.Array:
+    """Vectorised _parse_pc_time: seconds remaining from "MM:SS" cells."""
+    parts = pc.extract_regex(values, _PC_TIME_PATTERN)
+    try:
+        minutes = pc.cast(pc.struct_field(parts, "min"), pa.int64())
+        seconds = pc.cast(pc.struct_field(parts, "sec"), pa.int64())
+    except pa.ArrowInvalid:
+        return pa.array([_parse_pc_time(v or "") for v in values.to_pylist()], pa.int64())
+    return pc.add(pc.multiply(minutes, 60), seconds)
+
+
+def _score_arrays(values: pa.Array) -> tuple[pa.Array, pa.Array]:
+    """Vectorised _parse_score: (home, visitor) columns from "HHH - VVV" cells."""
+    parts = pc.extract_regex(values, _SCORE_PATTERN)
+    try:
+        return (
+            pc.cast(pc.struct_field(parts, "home"), pa.int64()),
+            pc.cast(pc.struct_field(parts, "visitor"), pa.int64()),
+        )
+    except pa.ArrowInvalid:
+        cells = [v or "" for v in values.to_pylist()]
+        return (
+            pa.array([_parse_score(v, "home") for v in cells], pa.int64()),
+            pa.array([_parse_score(v, "visitor") for v in cells], pa.int64()),
+        )
 
 
 def _parse_pc_time(time_str: str) -> int | None:
     """Convert 'MM:SS' period clock string to total seconds remaining."""
-    if not time_str:
+    m = _PC_TIME_RE.match(time_str)
+    if m is None:
         return None
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        try:
-            return int(parts[0]) * 60 + int(parts[1])
-        except ValueError:
-            return None
-    return None
+    return int(m["min"]) * 60 + int(m["sec"])
 
 
 def _parse_time_str(time_str: str) -> float | None:
@@ -476,24 +717,27 @@ def _parse_time_str(time_str: str) -> float | None:
 
 def _parse_score(score_str: str, side: str) -> int | None:
     """Parse 'HHH - VVV' score string."""
-    if not score_str or "-" not in score_str:
-        return None
-    parts = score_str.split("-")
-    if len(parts) != 2:
-        return None
-    try:
-        if side == "home":
-            return int(parts[0].strip())
-        return int(parts[1].strip())
-    except ValueError:
+    m = _SCORE_RE.match(score_str)
+    if m is None:
         return None
+    return int(m[side])
 
 
 def _safe_int(val: Any) -> int | None:
-    if val is None or str(val).strip() in ("", "None", "null", "NA", "0.0"):
+    # Numbers skip the text round-trip; bool is excluded by the exact type check
+    if type(val) is int:
+        return val or None
+    if type(val) is float:
+        try:
+            return int(val) or None
+        except (ValueError, OverflowError):
+            return None
+    if val is None:
+        return None
+    text = (val if type(val) is str else str(val)).strip()
+    if text in _SAFE_INT_NULLS:
         return None
     try:
-        result = int(float(str(val).strip()))
-        return result if result != 0 else None
-    except (ValueError, TypeError):
+        return int(float(text)) or None
+    except (ValueError, OverflowError):
         return None
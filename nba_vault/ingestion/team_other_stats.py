@@ -11,15 +11,13 @@ import pydantic
 import structlog
 
 from nba_vault.ingestion.base import BaseIngestor
-from nba_vault.ingestion.nba_stats_client import NBAStatsClient
-from nba_vault.ingestion.registry import register_ingestor
+from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
 from nba_vault.ingestion.validation import upsert_audit
 from nba_vault.models.advanced_stats import TeamGameOtherStatsCreate
 
 logger = structlog.get_logger(__name__)
 
 
-@register_ingestor
 class TeamOtherStatsIngestor(BaseIngestor):
     """
     Ingestor for team game "other stats" from NBA.com Stats API.
@@ -49,7 +47,7 @@ class TeamOtherStatsIngestor(BaseIngestor):
             rate_limiter: Rate limiter for API requests.
         """
         super().__init__(cache, rate_limiter)
-        self.nba_client = NBAStatsClient(cache, rate_limiter)
+        self.nba_client = get_nba_stats_client(cache, rate_limiter)
 
     def fetch(
         self,
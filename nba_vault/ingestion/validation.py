@@ -136,6 +136,98 @@ def require_fk(
         return False
 
 
+# Bound on bind parameters per IN (...) query; well under SQLite's limit.
+_FK_LOOKUP_CHUNK = 500
+
+
+def existing_fk_values(
+    conn: sqlite3.Connection,
+    table: str,
+    col: str,
+    values: Any,
+) -> set[Any]:
+    """
+    Return the subset of ``values`` present in table.col, in bulk.
+
+    Batch counterpart to require_fk(): one IN (...) query per 500 distinct
+    values instead of one SELECT per row. Callers test membership in the
+    returned set inside their upsert loop.
+
+    Args:
+        conn: Open SQLite connection.
+        table: Name of the referenced table (e.g. "player").
+        col: Name of the referenced column (e.g. "player_id").
+        values: Iterable of candidate values; duplicates and None are ignored.
+
+    Returns:
+        Set of values that exist. Empty if the lookup query fails.
+
+    Example:
+        present = existing_fk_values(conn, "player", "player_id", (m.player_id for m in models))
+        for m in models:
+            if m.player_id not in present:
+                continue
+    """
+    distinct = list({v for v in values if v is not None})
+    found: set[Any] = set()
+    try:
+        for start in range(0, len(distinct), _FK_LOOKUP_CHUNK):
+            chunk = distinct[start : start + _FK_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cur = conn.execute(
+                f"SELECT {col} FROM {table} WHERE {col} IN ({placeholders})",  # noqa: S608
+                chunk,
+            )
+            found.update(row[0] for row in cur)
+    except sqlite3.Error as e:
+        logger.warning(
+            "Bulk FK check query failed",
+            table=table,
+            col=col,
+            count=len(distinct),
+            error=str(e),
+        )
+        return set()
+    return found
+
+
+def unseen_shots(conn: sqlite3.Connection, params: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    """
+    Drop shot_chart insert tuples already stored for the same games.
+
+    shot_chart has no UNIQUE key for ON CONFLICT to hit, so a re-ingested
+    game would otherwise be inserted twice. Shots are matched on
+    (game_id, player_id, period, loc_x, loc_y); repeats within params
+    itself are kept.
+
+    Args:
+        conn: Open SQLite connection.
+        params: shot_chart parameter tuples in (game_id, player_id, team_id,
+            period, ..., loc_x, loc_y, ...) column order.
+
+    Returns:
+        The tuples of params whose key is not yet in shot_chart.
+    """
+    game_ids = list({p[0] for p in params})
+    stored: set[tuple[Any, ...]] = set()
+    for start in range(0, len(game_ids), _FK_LOOKUP_CHUNK):
+        chunk = game_ids[start : start + _FK_LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        stored.update(
+            map(
+                tuple,
+                conn.execute(
+                    "SELECT game_id, player_id, period, loc_x, loc_y FROM shot_chart "  # noqa: S608
+                    f"WHERE game_id IN ({placeholders})",
+                    chunk,
+                ),
+            )
+        )
+    if not stored:
+        return params
+    return [p for p in params if (p[0], p[1], p[3], p[12], p[13]) not in stored]
+
+
 # ---------------------------------------------------------------------------
 # data_availability_flags helpers
 # ---------------------------------------------------------------------------
@@ -1,5 +1,19 @@
 """Database schema and migrations."""
 
-from nba_vault.schema.connection import get_db_connection, init_database
+from nba_vault.schema.connection import (
+    deferred_indexes,
+    get_db_connection,
+    init_database,
+    restore_deferred_indexes,
+    transaction,
+    tune_for_ingest,
+)
 
-__all__ = ["get_db_connection", "init_database"]
+__all__ = [
+    "deferred_indexes",
+    "get_db_connection",
+    "init_database",
+    "restore_deferred_indexes",
+    "transaction",
+    "tune_for_ingest",
+]
@@ -1,6 +1,8 @@
 """Database connection management."""
 
+import contextlib
 import sqlite3
+from collections.abc import Generator
 from pathlib import Path
 
 import structlog
@@ -9,6 +11,11 @@ from nba_vault.utils.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Prepared statements kept per connection (sqlite3 default is 128). Ingest
+# runs cycle through many distinct upsert statements; a larger cache keeps
+# them compiled across ingestors sharing one connection.
+_STATEMENT_CACHE_SIZE = 512
+
 
 def get_db_connection(db_path: Path | None = None) -> sqlite3.Connection:
     """
@@ -38,7 +45,9 @@ def get_db_connection(db_path: Path | None = None) -> sqlite3.Connection:
         # so autocommit mode is correct and avoids "cannot start a transaction
         # within a transaction" errors when ingestors call conn.execute("BEGIN")
         # after upsert_audit() has implicitly opened a transaction.
-        conn = sqlite3.connect(str(db_path), isolation_level=None)
+        conn = sqlite3.connect(
+            str(db_path), isolation_level=None, cached_statements=_STATEMENT_CACHE_SIZE
+        )
     except sqlite3.OperationalError as e:
         raise RuntimeError(f"Cannot open database at '{db_path}': {e}") from e
 
@@ -59,6 +68,168 @@ def get_db_connection(db_path: Path | None = None) -> sqlite3.Connection:
     return conn
 
 
+# Minimum page cache for ingest connections (bytes); matches PRAGMA cache_size=-65536.
+_INGEST_CACHE_BYTES = 64 * 1024 * 1024
+# Minimum memory-mapped I/O window for ingest connections (bytes).
+_INGEST_MMAP_BYTES = 256 * 1024 * 1024
+
+
+def tune_for_ingest(conn: sqlite3.Connection) -> None:
+    """
+    Apply write-path PRAGMAs to a connection before a bulk upsert.
+
+    Connections from get_db_connection() already carry these settings; this
+    covers connections opened elsewhere (scripts, tests, ad-hoc sqlite3.connect)
+    so every ingest runs with WAL + synchronous=NORMAL instead of a full fsync
+    per commit. Safe to call repeatedly: the PRAGMAs are no-ops once applied,
+    and an existing larger page cache or mmap window is never shrunk.
+
+    WAL checkpointing is left to SQLite's default auto-checkpoint
+    (every 1000 pages), which keeps the -wal file bounded between ingests.
+
+    Args:
+        conn: Open SQLite connection. Ignored if a transaction is already open,
+            since journal_mode cannot be changed inside one.
+    """
+    if not isinstance(conn, sqlite3.Connection) or conn.in_transaction:
+        return
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        cache_bytes = cache_size * page_size if cache_size > 0 else -cache_size * 1024
+        if cache_bytes < _INGEST_CACHE_BYTES:
+            conn.execute(f"PRAGMA cache_size = -{_INGEST_CACHE_BYTES // 1024}")
+        mmap_row = conn.execute("PRAGMA mmap_size").fetchone()
+        # mmap_size returns no row when SQLite is built without mmap support
+        if mmap_row is not None and mmap_row[0] < _INGEST_MMAP_BYTES:
+            conn.execute(f"PRAGMA mmap_size = {_INGEST_MMAP_BYTES}")
+    except sqlite3.Error as e:
+        logger.debug("Could not apply ingest PRAGMAs", error=str(e))
+
+
+@contextlib.contextmanager
+def deferred_indexes(conn: sqlite3.Connection, table: str) -> Generator[None]:
+    """
+    Drop a table's secondary indexes for a bulk load and rebuild them after.
+
+    Building each index once over the loaded rows is cheaper than updating
+    every B-tree on every insert. Only explicitly created indexes are
+    dropped; the automatic indexes backing PRIMARY KEY/UNIQUE constraints
+    (which ON CONFLICT upserts rely on) stay in place. Indexes are recreated
+    from their stored definitions even if the body raises. A transaction the
+    body leaves open is rolled back if it raised and committed otherwise
+    (e.g. a trailing upsert_audit() on a legacy-isolation connection).
+
+    The dropped definitions are also recorded in _deferred_index, in
+    the same transaction as the DROPs. If the process is killed mid-load,
+    init_database() recreates them via restore_deferred_indexes().
+
+    Args:
+        conn: Open SQLite connection, not inside a transaction.
+        table: Table whose secondary indexes should be deferred.
+    """
+    indexes = conn.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    if indexes:
+        conn.execute("BEGIN")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS _deferred_index "
+            "(name TEXT PRIMARY KEY, tbl_name TEXT NOT NULL, sql TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO _deferred_index VALUES (?, ?, ?)",
+            [(name, table, sql) for name, sql in indexes],
+        )
+        for name, _ in indexes:
+            conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+        conn.execute("COMMIT")
+        logger.debug("Deferred indexes for bulk load", table=table, count=len(indexes))
+    try:
+        yield
+    except BaseException:
+        if indexes and conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        if indexes:
+            if conn.in_transaction:
+                conn.commit()
+            conn.execute("BEGIN")
+            _create_missing_indexes(conn, indexes)
+            conn.execute("DELETE FROM _deferred_index WHERE tbl_name = ?", (table,))
+            if conn.execute("SELECT 1 FROM _deferred_index LIMIT 1").fetchone() is None:
+                conn.execute("DROP TABLE _deferred_index")
+            conn.execute("COMMIT")
+
+
+def restore_deferred_indexes(conn: sqlite3.Connection) -> int:
+    """
+    Recreate indexes a killed deferred_indexes() load left dropped.
+
+    Args:
+        conn: Open SQLite connection, not inside a transaction.
+
+    Returns:
+        Number of indexes recreated.
+    """
+    if (
+        conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            ("_deferred_index",),
+        ).fetchone()
+        is None
+    ):
+        return 0
+    conn.execute("BEGIN")
+    recorded = conn.execute("SELECT name, sql FROM _deferred_index").fetchall()
+    created = _create_missing_indexes(conn, recorded)
+    conn.execute("DROP TABLE _deferred_index")
+    conn.execute("COMMIT")
+    if created:
+        logger.warning("Recreated indexes left dropped by an interrupted load", count=created)
+    return created
+
+
+def _create_missing_indexes(conn: sqlite3.Connection, indexes: list[tuple[str, str]]) -> int:
+    """Run the stored CREATE INDEX statements for indexes that do not exist."""
+    present = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    missing = [sql for name, sql in indexes if name not in present]
+    for sql in missing:
+        conn.execute(sql)
+    return len(missing)
+
+
+@contextlib.contextmanager
+def transaction(conn: sqlite3.Connection) -> Generator[None]:
+    """
+    Run the body inside one explicit BEGIN ... COMMIT.
+
+    Rolls back and re-raises if the body raises. Connections from
+    get_db_connection() are in autocommit mode, where `with conn:` opens no
+    transaction and every statement would commit on its own. A transaction
+    a legacy-isolation connection opened implicitly (e.g. by upsert_audit())
+    is committed first so BEGIN does not fail.
+
+    Args:
+        conn: Open SQLite connection.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
 def init_database(db_path: Path | None = None) -> None:
     """
     Initialize the database schema.
@@ -77,6 +248,11 @@ def init_database(db_path: Path | None = None) -> None:
     conn.close()
     try:
         run_migrations(db_path)
+        conn = get_db_connection(db_path)
+        try:
+            restore_deferred_indexes(conn)
+        finally:
+            conn.close()
         logger.info("Database initialized successfully")
     except Exception as e:
         raise RuntimeError(f"Failed to initialize database: {e}") from e
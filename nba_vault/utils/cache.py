@@ -1,5 +1,6 @@
 """Content-addressable cache for API responses."""
 
+import gzip
 import hashlib
 import json
 from pathlib import Path
@@ -15,16 +16,20 @@ logger = structlog.get_logger(__name__)
 class ContentCache:
     """Content-addressable cache for API responses."""
 
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(self, cache_dir: Path | None = None, compress: bool | None = None):
         """
         Initialize cache.
 
         Args:
             cache_dir: Directory for cache storage. If None, uses settings.
+            compress: Gzip-compress entries on write. If None, uses settings.
+                NBA Stats payloads are highly repetitive JSON and typically
+                shrink by 80-90%. Entries in either format are always readable.
         """
         settings = get_settings()
         self.cache_dir = Path(cache_dir or settings.cache_dir)
         self.enabled = settings.cache_enabled
+        self.compress = settings.cache_compress if compress is None else compress
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_hash(self, key: str) -> str:
@@ -39,12 +44,13 @@ class ContentCache:
         """
         return hashlib.sha256(key.encode()).hexdigest()
 
-    def _get_cache_path(self, key: str) -> Path:
+    def _get_cache_path(self, key: str, compressed: bool = False) -> Path:
         """
         Get cache file path for a key.
 
         Args:
             key: Cache key.
+            compressed: Return the path of the gzip-compressed entry.
 
         Returns:
             Path to cache file.
@@ -52,7 +58,12 @@ class ContentCache:
         hash_str = self._get_hash(key)
         # Use first 2 chars as subdirectory for better filesystem performance
         subdir = hash_str[:2]
-        return self.cache_dir / subdir / f"{hash_str[2:]}.json"
+        suffix = ".json.gz" if compressed else ".json"
+        return self.cache_dir / subdir / f"{hash_str[2:]}{suffix}"
+
+    def _entry_files(self) -> list[Path]:
+        """List every cache entry file, compressed or not."""
+        return [*self.cache_dir.rglob("*.json"), *self.cache_dir.rglob("*.json.gz")]
 
     def get(self, key: str) -> Any | None:
         """
@@ -67,20 +78,43 @@ class ContentCache:
         if not self.enabled:
             return None
 
-        cache_path = self._get_cache_path(key)
-
-        if not cache_path.exists():
+        # Look in the preferred format first, then fall back to the other one
+        # so toggling compression does not orphan existing entries.
+        for compressed in (self.compress, not self.compress):
+            cache_path = self._get_cache_path(key, compressed)
+            if cache_path.exists():
+                break
+        else:
             return None
 
         try:
-            with cache_path.open(encoding="utf-8") as f:
-                data = json.load(f)
+            raw = cache_path.read_bytes()
+            if compressed:
+                raw = gzip.decompress(raw)
+            data = json.loads(raw)
             logger.debug("Cache hit", key=key)
             return data
-        except (json.JSONDecodeError, OSError) as e:
+        except (json.JSONDecodeError, OSError, EOFError) as e:
             logger.warning("Cache file corrupted", key=key, error=str(e))
             return None
 
+    def contains(self, key: str) -> bool:
+        """
+        Check whether a cache entry exists without reading it.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            True if an entry exists in either format.
+        """
+        if not self.enabled:
+            return False
+        return any(
+            self._get_cache_path(key, compressed).exists()
+            for compressed in (self.compress, not self.compress)
+        )
+
     def set(self, key: str, value: Any) -> None:
         """
         Store response in cache.
@@ -92,12 +126,16 @@ class ContentCache:
         if not self.enabled:
             return
 
-        cache_path = self._get_cache_path(key)
+        cache_path = self._get_cache_path(key, self.compress)
         cache_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with cache_path.open("w", encoding="utf-8") as f:
-                json.dump(value, f)
+            payload = json.dumps(value).encode("utf-8")
+            if self.compress:
+                payload = gzip.compress(payload, compresslevel=6)
+            cache_path.write_bytes(payload)
+            # Drop a stale copy in the other format so get() cannot return it.
+            self._get_cache_path(key, not self.compress).unlink(missing_ok=True)
             logger.debug("Cached response", key=key)
         except (TypeError, OSError) as e:
             logger.warning("Failed to cache response", key=key, error=str(e))
@@ -107,7 +145,7 @@ class ContentCache:
         if not self.cache_dir.exists():
             return
 
-        for path in self.cache_dir.rglob("*.json"):
+        for path in self._entry_files():
             path.unlink()
 
         logger.info("Cache cleared")
@@ -123,7 +161,7 @@ class ContentCache:
         total_size = 0
 
         if self.cache_dir.exists():
-            for path in self.cache_dir.rglob("*.json"):
+            for path in self._entry_files():
                 total_files += 1
                 total_size += path.stat().st_size
 
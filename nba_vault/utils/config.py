@@ -22,10 +22,14 @@ class Settings(BaseSettings):
     nba_api_rate_limit: int = Field(default=8, description="Requests per minute to NBA API")
     nba_api_retry_attempts: int = Field(default=5, description="Number of retry attempts")
     nba_api_retry_delay: int = Field(default=30, description="Initial retry delay in seconds")
+    nba_api_prefetch: bool = Field(
+        default=False, description="Prefetch the next chained endpoint in the background"
+    )
 
     # Cache Configuration
     cache_dir: str = Field(default="cache", description="Directory for cached responses")
     cache_enabled: bool = Field(default=True, description="Enable response caching")
+    cache_compress: bool = Field(default=True, description="Gzip-compress cached responses")
 
     # Quarantine Configuration
     quarantine_dir: str = Field(
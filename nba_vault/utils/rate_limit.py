@@ -2,6 +2,7 @@
 
 import asyncio
 import random
+import threading
 import time
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
@@ -29,17 +30,26 @@ class RateLimiter:
         self.per = per
         self.allowance = rate
         self.last_check = time.time()
+        # Ingestors may fan requests out over worker threads sharing one limiter
+        self._lock = threading.Lock()
 
     def acquire(self, block: bool = True) -> bool:
         """
         Acquire permission to make a request.
 
+        Thread-safe: concurrent callers are admitted one at a time.
+
         Args:
             block: If True, block until request is allowed.
 
         Returns:
             True if request is allowed, False otherwise.
         """
+        with self._lock:
+            return self._acquire(block)
+
+    def _acquire(self, block: bool) -> bool:
+        """Token bucket update; caller must hold ``self._lock``."""
         current = time.time()
         time_passed = current - self.last_check
         self.last_check = current
@@ -588,7 +588,8 @@ def stage4_per_player(conn: Any, dry_run: bool) -> None:
         pid = str(player_id)
 
         for ing, kwargs in [
-            (bio_ing, {}),
+            # PerGame career stats follow, so start that request early
+            (bio_ing, {"prefetch_career_stats": True}),
             (stats_ing, {"per_mode": "Totals"}),
             (stats_ing, {"per_mode": "PerGame"}),
             (awards_ing, {}),
@@ -317,3 +317,61 @@ class TestAdapterInterface:
         headers = result["PlayerTracking"]["headers"]
         data = result["PlayerTracking"]["data"]
         assert len(headers) == len(data[0])
+
+    def test_call_endpoint_reads_raw_result_sets(self):
+        """Test that tabular payloads are used directly without normalization."""
+
+        class _Response:
+            def __init__(self, **params):
+                self.params = params
+
+            def get_dict(self):
+                return {
+                    "resultSets": [
+                        {
+                            "name": "CommonPlayerInfo",
+                            "headers": ["PERSON_ID", "HEIGHT"],
+                            "rowSet": [[2544, "6-9"]],
+                        },
+                        {"name": "AvailableSeasons", "headers": ["SEASON_ID"], "rowSet": []},
+                    ]
+                }
+
+            def get_normalized_dict(self):
+                raise AssertionError("normalized path should not be used")
+
+        try:
+            adapter = NbaApiAdapter(timeout=30)
+        except ImportError:
+            return
+        adapter.endpoints["commonplayerinfo"] = _Response
+
+        result = adapter._call_endpoint("commonplayerinfo", player_id=2544)
+
+        assert result == {
+            "CommonPlayerInfo": {"headers": ["PERSON_ID", "HEIGHT"], "data": [[2544, "6-9"]]},
+            "AvailableSeasons": {"headers": ["SEASON_ID"], "data": []},
+        }
+
+    def test_call_endpoint_falls_back_to_normalized_dict(self):
+        """Test that non-tabular payloads still go through get_normalized_dict."""
+
+        class _Response:
+            def __init__(self, **params):
+                pass
+
+            def get_dict(self):
+                return {"meta": {}, "boxScore": {}}
+
+            def get_normalized_dict(self):
+                return {"PlayerStats": [{"PLAYER_ID": 1, "PTS": 10}]}
+
+        try:
+            adapter = NbaApiAdapter(timeout=30)
+        except ImportError:
+            return
+        adapter.endpoints["commonplayerinfo"] = _Response
+
+        result = adapter._call_endpoint("commonplayerinfo", player_id=1)
+
+        assert result == {"PlayerStats": {"headers": ["PLAYER_ID", "PTS"], "data": [[1, 10]]}}
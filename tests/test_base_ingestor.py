@@ -5,6 +5,7 @@ Tests cover error handling, quarantine logic, and the ingest pipeline.
 
 import json
 import sqlite3
+import weakref
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -100,6 +101,30 @@ class TestBaseIngestorIngest:
         assert ingestor.validate_called
         assert ingestor.upsert_called
 
+    def test_ingest_releases_raw_data_before_upsert(self, db_connection):
+        """The fetched payload is not kept alive while upsert runs."""
+
+        class Payload(dict):
+            pass
+
+        payload_refs = []
+        alive_during_upsert = []
+
+        class ReleasingIngestor(DummyIngestor):
+            def fetch(self, entity_id: str, **kwargs):
+                payload = Payload(id=entity_id)
+                payload_refs.append(weakref.ref(payload))
+                return payload
+
+            def upsert(self, model: list, conn) -> int:
+                alive_during_upsert.append(payload_refs[0]() is not None)
+                return len(model)
+
+        result = ReleasingIngestor().ingest("123", db_connection)
+
+        assert result["status"] == "SUCCESS"
+        assert alive_during_upsert == [False]
+
     def test_ingest_without_entity_type(self, db_connection):
         """Test that missing entity_type raises AttributeError."""
         ingestor = DummyIngestor()
@@ -477,3 +502,20 @@ class TestBaseIngestorErrorRecovery:
                         content = json.load(f)
 
                     assert content["raw_data"]["complex"]["nested"]["data"] == "value"
+
+
+class TestResultSetHelpers:
+    """Tests for the shared headers/data payload helpers."""
+
+    def test_result_set_folds_legacy_row_dicts(self):
+        from nba_vault.ingestion.base import result_set
+
+        legacy = {"rows": [{"A": 1, "B": 2}, {"A": 3}]}
+        assert result_set(legacy, "rows") == (["A", "B"], [[1, 2], [3, None]])
+        assert result_set({"headers": ["A"], "data": [[1]]}, "rows") == (["A"], [[1]])
+
+    def test_pad_row_truncates_or_pads_to_width(self):
+        from nba_vault.ingestion.base import pad_row
+
+        assert pad_row([1, 2, 3], 2) == [1, 2]
+        assert pad_row([1], 3) == [1, None, None]
@@ -244,11 +244,9 @@ def test_ingestor_registry():
         create_ingestor,
         get_ingestor,
         list_ingestors,
-        register_ingestor,
     )
 
-    # Create a test ingestor
-    @register_ingestor
+    # Create a test ingestor; subclassing registers it
     class TestIngestor(BaseIngestor):
         entity_type = "test"
 
@@ -279,6 +277,39 @@ def test_ingestor_registry():
     assert create_ingestor("nonexistent") is None
 
 
+def test_ingestor_registry_skips_inherited_entity_type():
+    """Subclasses that only inherit entity_type do not replace their parent."""
+    from nba_vault.ingestion.player_tracking import PlayerTrackingIngestor
+    from nba_vault.ingestion.registry import get_ingestor
+
+    class CustomTrackingIngestor(PlayerTrackingIngestor):
+        pass
+
+    assert get_ingestor("player_tracking") is PlayerTrackingIngestor
+
+
+def test_register_ingestor_is_deprecated_pass_through():
+    """register_ingestor still registers, but warns."""
+    from nba_vault.ingestion.base import BaseIngestor
+    from nba_vault.ingestion.registry import get_ingestor, register_ingestor
+
+    class LegacyIngestor(BaseIngestor):
+        entity_type = "legacy_decorated"
+
+        def fetch(self, entity_id, **kwargs):
+            return {}
+
+        def validate(self, raw):
+            return []
+
+        def upsert(self, model, conn):
+            return 0
+
+    with pytest.warns(DeprecationWarning):
+        assert register_ingestor(LegacyIngestor) is LegacyIngestor
+    assert get_ingestor("legacy_decorated") is LegacyIngestor
+
+
 def test_rate_limiter():
     """Test rate limiter functionality."""
 
@@ -3,6 +3,7 @@
 import sqlite3
 from unittest.mock import patch
 
+import pydantic
 import pytest
 
 from nba_vault.ingestion.players import PlayersIngestor
@@ -270,6 +271,14 @@ class TestPlayersIngestor:
         assert validated[0].slug == "jamesle01"
         assert validated[1].slug == "curryst01"
 
+    def test_validate_players_rejects_bad_row(self, ingestor, sample_players_data):
+        """One invalid player fails the whole batch."""
+        bad = {"slug": "nonamepl01"}
+        raw_data = {"players": [*sample_players_data, bad], "season_end_year": 2024}
+
+        with pytest.raises(pydantic.ValidationError):
+            ingestor.validate(raw_data)
+
     def test_upsert_new_players(self, ingestor, sample_players_data, test_db):
         """Test inserting new players."""
         # Create validated models
@@ -318,6 +327,48 @@ class TestPlayersIngestor:
         assert row["player_id"] == initial_id
         assert row["weight_lbs"] == 260.0
 
+    def test_upsert_assigns_ids_and_dedupes_within_batch(
+        self, ingestor, sample_players_data, test_db
+    ):
+        """New ids follow MAX(player_id); a repeated bbref_id updates its own insert."""
+        test_db.execute(
+            "INSERT INTO player (player_id, first_name, last_name, full_name) "
+            "VALUES (500, 'Existing', 'Player', 'Existing Player')"
+        )
+        test_db.commit()
+
+        repeat = {**sample_players_data[0], "weight": "260"}
+        validated = [
+            BasketballReferencePlayer.model_validate(p) for p in (*sample_players_data, repeat)
+        ]
+        rows_affected = ingestor.upsert(validated, test_db)
+
+        assert rows_affected == 3
+        rows = test_db.execute(
+            "SELECT bbref_id, player_id, weight_lbs FROM player "
+            "WHERE bbref_id IS NOT NULL ORDER BY player_id"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [
+            ("jamesle01", 501, 260.0),
+            ("curryst01", 502, 185.0),
+        ]
+
+    def test_upsert_assigned_ids_skip_past_explicit_nba_ids(
+        self, ingestor, sample_players_data, test_db
+    ):
+        """Ids assigned after an explicit NBA.com id continue above it."""
+        with_nba_id = {**sample_players_data[0], "nba_person_id": 2544}
+        validated = [
+            BasketballReferencePlayer.model_validate(with_nba_id),
+            BasketballReferencePlayer.model_validate(sample_players_data[1]),
+        ]
+        ingestor.upsert(validated, test_db)
+
+        rows = test_db.execute(
+            "SELECT bbref_id, player_id FROM player ORDER BY player_id"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [("jamesle01", 2544), ("curryst01", 2545)]
+
     def test_ingest_pipeline(self, ingestor, sample_players_data, test_db):
         """Test complete ingestion pipeline."""
         with patch.object(
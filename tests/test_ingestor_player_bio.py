@@ -0,0 +1,76 @@
+"""Tests for PlayerBioIngestor."""
+
+import pytest
+
+from nba_vault.ingestion.player_bio import PlayerBioIngestor, _parse_height_inches
+from nba_vault.models.entities import PlayerBioCreate
+
+
+@pytest.mark.parametrize(
+    ("height", "expected"),
+    [
+        ("6-9", 81.0),
+        ("7-10", 94.0),
+        ("5-11", 71.0),
+        ("", None),
+        ("-9", None),
+        ("6", None),
+        ("6-", None),
+        ("6-9-1", None),
+        ("six-nine", None),
+    ],
+)
+def test_parse_height_inches(height, expected):
+    assert _parse_height_inches(height) == expected
+
+
+def test_upsert_counts_updated_rows(db_connection):
+    db_connection.execute(
+        "INSERT OR REPLACE INTO player (player_id, first_name, last_name, full_name) "
+        "VALUES (9190001, 'Bio', 'Test', 'Bio Test')"
+    )
+    db_connection.commit()
+    ingestor = PlayerBioIngestor()
+
+    models = [
+        PlayerBioCreate(player_id=9190001, position="Forward", height_inches=81.0),
+        PlayerBioCreate(player_id=9190002, position="Guard"),  # no player row
+    ]
+    rows = ingestor.upsert(models, db_connection)
+
+    assert rows == 1
+    row = db_connection.execute(
+        "SELECT position, height_inches FROM player WHERE player_id = 9190001"
+    ).fetchone()
+    assert tuple(row) == ("Forward", 81.0)
+
+
+def test_validate_maps_common_player_info():
+    ingestor = PlayerBioIngestor()
+    raw = {
+        "player_id": 2544,
+        "info": {
+            "PERSON_ID": 2544,
+            "POSITION": "Forward",
+            "HEIGHT": "6-9",
+            "WEIGHT": "250",
+            "BIRTHDATE": "1984-12-30T00:00:00",
+            "BIRTHPLACE_CITY": "",
+            "COUNTRY": "USA",
+            "SCHOOL": None,
+            "DRAFT_YEAR": "2003",
+            "DRAFT_ROUND": 1,
+            "DRAFT_NUMBER": "Undrafted",
+        },
+    }
+
+    (bio,) = ingestor.validate(raw)
+
+    assert isinstance(bio, PlayerBioCreate)
+    assert bio.position == "Forward"
+    assert bio.height_inches == 81.0
+    assert bio.weight_lbs == 250.0
+    assert bio.birthdate == "1984-12-30"
+    assert bio.birthplace_city is None
+    assert bio.college is None
+    assert (bio.draft_year, bio.draft_round, bio.draft_number) == (2003, 1, None)
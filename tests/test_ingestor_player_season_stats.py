@@ -0,0 +1,212 @@
+"""Tests for PlayerSeasonStatsIngestor."""
+
+import pytest
+
+from nba_vault.ingestion.player_season_stats import (
+    PlayerSeasonStatsIngestor,
+    _float_column,
+    _int_column,
+    _safe_float,
+    _safe_int,
+)
+from nba_vault.models.entities import PlayerSeasonStatsCreate
+
+_HEADERS = ["SEASON_ID", "TEAM_ID", "GP", "GS", "MIN", "FG_PCT", "PTS"]
+
+
+@pytest.fixture
+def ingestor():
+    return PlayerSeasonStatsIngestor()
+
+
+def test_validate_indexes_columns_by_header(ingestor):
+    raw = {
+        "player_id": "2544",
+        "headers": _HEADERS,
+        "data": [
+            ["2022-23", 1610612747, 55, 54, 35.5, 0.5, 28.9],
+            ["2023-24", 1610612747, "71", "71", "35.3", "0.54", "25.7"],
+        ],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert len(result) == 2
+    second = result[1]
+    assert isinstance(second, PlayerSeasonStatsCreate)
+    assert second.season_id == 2023
+    assert second.team_id == 1610612747
+    assert second.games_played == 71
+    assert second.fg_pct == pytest.approx(0.54)
+    assert second.pts == pytest.approx(25.7)
+    assert second.fgm is None  # column absent from headers
+
+
+def test_validate_pads_ragged_rows(ingestor):
+    raw = {
+        "player_id": "2544",
+        "headers": _HEADERS,
+        "data": [
+            ["2021-22", 1610612747, 56, 56, 37.2, 0.52, 30.3],
+            ["2022-23", 1610612747, 55],  # short row
+            ["2023-24", 1610612747, 71, 71, 35.3, 0.54, 25.7, "extra"],
+        ],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert [(m.season_id, m.games_played, m.pts) for m in result] == [
+        (2021, 56, pytest.approx(30.3)),
+        (2022, 55, None),
+        (2023, 71, pytest.approx(25.7)),
+    ]
+
+
+def test_validate_skips_rows_without_season(ingestor):
+    raw = {
+        "player_id": "2544",
+        "headers": _HEADERS,
+        "data": [[None, 0, 1, 0, 1.0, 0.0, 0.0], ["2023-24", None, 1, 0, 1.0, 0.0, 0.0]],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert [m.season_id for m in result] == [2023]
+    assert result[0].team_id == 0
+
+
+def test_validate_accepts_legacy_row_dict_payload(ingestor):
+    raw = {
+        "player_id": "2544",
+        "totals": [{"SEASON_ID": "2023-24", "TEAM_ID": 1610612747, "GP": 71, "PTS": 25.7}],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert len(result) == 1
+    assert result[0].games_played == 71
+
+
+def test_validate_empty_payload(ingestor):
+    assert ingestor.validate({"player_id": "2544", "headers": [], "data": []}) == []
+
+
+def test_validate_skips_only_invalid_season(ingestor):
+    raw = {
+        "player_id": "2544",
+        "headers": _HEADERS,
+        "data": [
+            ["2022-23", 1610612747, 55, 54, 35.5, 1.5, 28.9],  # fg_pct out of range
+            ["2023-24", 1610612747, 71, 71, 35.3, 0.54, 25.7],
+        ],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert [m.season_id for m in result] == [2023]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), (7, 7), (7.9, 7), ("12", 12), (" 3.0 ", 3), ("", None), ("null", None)],
+)
+def test_safe_int(value, expected):
+    assert _safe_int(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), (0.5, 0.5), (2, 2.0), ("1.25", 1.25), ("None", None), ("abc", None)],
+)
+def test_safe_float(value, expected):
+    assert _safe_float(value) == expected
+
+
+def test_float_column_falls_back_per_cell_on_bad_value():
+    assert _float_column((1, 2.5, None)) == [1.0, 2.5, None]
+    assert _float_column((1, "", "null", " 0.5 ")) == [1.0, None, None, 0.5]
+
+
+def test_int_column_passes_typed_ints_through():
+    assert _int_column((1, None, 3)) == [1, None, 3]
+    assert _int_column((1, "2", 3.7, "")) == [1, 2, 3, None]
+
+
+def test_upsert_skips_rows_for_unknown_players(ingestor, db_connection):
+    db_connection.execute(
+        "INSERT OR REPLACE INTO player (player_id, first_name, last_name, full_name) "
+        "VALUES (9160001, 'Season', 'Test', 'Season Test')"
+    )
+    db_connection.commit()
+    models = [
+        PlayerSeasonStatsCreate(player_id=9160001, season_id=2023, team_id=0, pts=10.0),
+        PlayerSeasonStatsCreate(player_id=9160002, season_id=2023, team_id=0, pts=5.0),
+    ]
+
+    assert ingestor.upsert(models, db_connection) == 1
+    rows = db_connection.execute(
+        "SELECT player_id FROM player_season_stats WHERE player_id IN (9160001, 9160002)"
+    ).fetchall()
+    assert [r[0] for r in rows] == [9160001]
+
+
+def test_fetch_claims_career_stats_prefetched_by_bio(tmp_path):
+    """The bio fetch starts the career-stats request; season stats reuses it."""
+    from unittest.mock import Mock
+
+    from nba_vault.ingestion import prefetch
+    from nba_vault.ingestion.player_bio import PlayerBioIngestor
+    from nba_vault.utils.cache import ContentCache
+
+    prefetch.clear()
+    cache = ContentCache(cache_dir=tmp_path)
+    career = {"SeasonTotalsRegularSeason": {"headers": _HEADERS, "data": []}}
+    adapter = Mock()
+    adapter.get_common_player_info.return_value = {}
+    adapter.get_player_career_stats.return_value = career
+
+    bio = PlayerBioIngestor(cache=cache)
+    bio._client.adapter = adapter
+    bio.fetch("2544", prefetch_career_stats=True)
+
+    stats = PlayerSeasonStatsIngestor(cache=cache)
+    stats._client.adapter = Mock()
+    payload = stats.fetch("2544")
+
+    adapter.get_player_career_stats.assert_called_once_with(player_id=2544, per_mode="PerGame")
+    stats._client.adapter.get_player_career_stats.assert_not_called()
+    assert payload["headers"] == _HEADERS
+    assert cache.get("player_career_2544_PerGame") == payload
+
+
+def test_bio_fetch_does_not_prefetch_by_default(tmp_path):
+    """A bio-only run spends no API calls on career stats."""
+    from unittest.mock import Mock
+
+    from nba_vault.ingestion import prefetch
+    from nba_vault.ingestion.player_bio import PlayerBioIngestor
+    from nba_vault.utils.cache import ContentCache
+
+    prefetch.clear()
+    bio = PlayerBioIngestor(cache=ContentCache(cache_dir=tmp_path))
+    bio._client.adapter = Mock()
+    bio._client.adapter.get_common_player_info.return_value = {}
+    bio.fetch("2544")
+    bio.fetch("2544")  # cache hit
+
+    bio._client.adapter.get_player_career_stats.assert_not_called()
+    assert prefetch.take("player_career_2544_PerGame") is None
+
+
+def test_prefetch_evicts_oldest_unclaimed_entry(monkeypatch):
+    from nba_vault.ingestion import prefetch
+
+    prefetch.clear()
+    monkeypatch.setattr(prefetch, "_PREFETCH_MAX_PENDING", 2)
+    for key in ("a", "b", "c"):
+        prefetch.schedule(key, lambda k=key: k)
+
+    assert prefetch.take("a") is None
+    assert prefetch.take("b") == "b"
+    assert prefetch.take("c") == "c"
+    assert prefetch.take("c") is None
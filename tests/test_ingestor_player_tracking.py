@@ -178,6 +178,212 @@ class TestPlayerTrackingUpsert:
         )
         assert cursor.fetchone()[0] == 3.1
 
+    def test_upsert_skips_unchanged_rows(self, db_connection):
+        ingestor = PlayerTrackingIngestor()
+        model = PlayerGameTrackingCreate(
+            game_id="0022300003",
+            player_id=201939,
+            team_id=1610612738,
+            season_id=2023,
+            minutes_played=32.0,
+            distance_miles=None,
+        )
+        assert ingestor.upsert([model], db_connection) == 1
+        changes_before = db_connection.total_changes
+
+        # Identical re-ingest (including NULL columns) writes nothing
+        assert ingestor.upsert([model], db_connection) == 0
+        # Only the audit row was touched
+        assert db_connection.total_changes - changes_before == 1
+
+    def test_upsert_writes_one_audit_row_per_season(self, db_connection):
+        ingestor = PlayerTrackingIngestor()
+        models = [
+            PlayerGameTrackingCreate(
+                game_id=f"00223000{i:02d}",
+                player_id=2544,
+                team_id=1610612747,
+                season_id=2023,
+            )
+            for i in range(3)
+        ]
+        ingestor.upsert(models, db_connection)
+
+        rows = db_connection.execute(
+            "SELECT entity_id, row_count FROM ingestion_audit WHERE entity_type = ?",
+            (ingestor.entity_type,),
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [("2023", 3)]
+
+    def test_upsert_commits_in_batches(self, db_connection, monkeypatch):
+        from nba_vault.ingestion import player_tracking
+
+        monkeypatch.setattr(player_tracking, "_COMMIT_BATCH", 2)
+        statements: list[str] = []
+        db_connection.set_trace_callback(statements.append)
+
+        ingestor = PlayerTrackingIngestor()
+        models = [
+            PlayerGameTrackingCreate(
+                game_id="0022308888",
+                player_id=9_400_000 + i,
+                team_id=1610612747,
+                season_id=2023,
+            )
+            for i in range(5)
+        ]
+        rows = ingestor.upsert(models, db_connection)
+        db_connection.set_trace_callback(None)
+
+        assert rows == 5
+        # Three data chunks (2 + 2 + 1); the audit row rides in each of them
+        assert statements.count("COMMIT") == 3
+
+    def test_large_upsert_rebuilds_deferred_indexes(self, db_connection, monkeypatch):
+        from nba_vault.ingestion import player_tracking
+
+        monkeypatch.setattr(player_tracking, "_DEFER_INDEX_THRESHOLD", 1)
+        index_sql = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = ?"
+        before = db_connection.execute(index_sql, ("player_game_tracking",)).fetchone()[0]
+
+        models = [
+            PlayerGameTrackingCreate(
+                game_id="0022307777",
+                player_id=9_500_000 + i,
+                team_id=1610612747,
+                season_id=2023,
+            )
+            for i in range(3)
+        ]
+        assert PlayerTrackingIngestor().upsert(models, db_connection) == 3
+        after = db_connection.execute(index_sql, ("player_game_tracking",)).fetchone()[0]
+        assert after == before
+
+    def test_ingest_defers_indexes_for_large_loads(
+        self, db_connection, mock_tracking_validate_data, monkeypatch
+    ):
+        from nba_vault.ingestion import player_tracking
+
+        monkeypatch.setattr(player_tracking, "_DEFER_INDEX_THRESHOLD", 1)
+        deferred: list[str] = []
+        real_deferred_indexes = player_tracking.deferred_indexes
+
+        def spy(conn, table):
+            deferred.append(table)
+            return real_deferred_indexes(conn, table)
+
+        monkeypatch.setattr(player_tracking, "deferred_indexes", spy)
+        dataset = mock_tracking_validate_data["data"]["PlayerTracking"]
+        dataset["headers"].append("GAME_ID")
+        dataset["data"][0].append("0022303333")
+        dataset["data"].append([2545, *dataset["data"][0][1:]])
+
+        ingestor = PlayerTrackingIngestor()
+        with patch.object(ingestor, "fetch", return_value=mock_tracking_validate_data):
+            result = ingestor.ingest("2544", db_connection, season="2023-24")
+
+        assert result["rows_affected"] == 2
+        assert deferred == ["player_game_tracking"]
+
+    def test_streamed_rows_upsert_like_models(self, db_connection, mock_tracking_validate_data):
+        from nba_vault.ingestion.player_tracking import _tracking_row
+
+        ingestor = PlayerTrackingIngestor()
+        mock_tracking_validate_data["data"]["PlayerTracking"]["headers"].append("GAME_ID")
+        mock_tracking_validate_data["data"]["PlayerTracking"]["data"][0].append("0022306666")
+
+        rows = list(ingestor._iter_validated_rows(mock_tracking_validate_data))
+        [model] = ingestor.validate(mock_tracking_validate_data)
+        assert isinstance(model, PlayerGameTrackingCreate)
+
+        assert rows == [_tracking_row(model)]
+        assert ingestor.upsert(iter(rows), db_connection) == 1
+        touches = db_connection.execute(
+            "SELECT touches FROM player_game_tracking WHERE game_id = '0022306666'"
+        ).fetchone()[0]
+        assert touches == model.touches == 50
+
+    def test_ingest_passes_validated_tuples_to_upsert(
+        self, db_connection, mock_tracking_validate_data
+    ):
+        ingestor = PlayerTrackingIngestor()
+        mock_tracking_validate_data["data"]["PlayerTracking"]["headers"].append("GAME_ID")
+        mock_tracking_validate_data["data"]["PlayerTracking"]["data"][0].append("0022305555")
+
+        with (
+            patch.object(ingestor, "fetch", return_value=mock_tracking_validate_data),
+            patch.object(ingestor, "validate", side_effect=AssertionError("built models")),
+        ):
+            result = ingestor.ingest("2544", db_connection, season="2023-24")
+
+        assert result["status"] == "SUCCESS"
+        assert result["rows_affected"] == 1
+        audit = db_connection.execute(
+            "SELECT row_count FROM ingestion_audit WHERE entity_type = ? AND entity_id = '2023'",
+            (ingestor.entity_type,),
+        ).fetchone()
+        assert audit[0] >= 1
+
+    def test_ingest_writes_nothing_when_a_later_batch_fails(
+        self, db_connection, mock_tracking_validate_data, monkeypatch
+    ):
+        from nba_vault.ingestion import player_tracking
+
+        monkeypatch.setattr(player_tracking, "_COMMIT_BATCH", 1)
+        dataset = mock_tracking_validate_data["data"]["PlayerTracking"]
+        dataset["headers"].append("GAME_ID")
+        dataset["data"][0].append("0022304444")
+        # Second row validates in a later batch and fails the ge=0 bound
+        dataset["data"].append([2545, *dataset["data"][0][1:7], -1, *dataset["data"][0][8:]])
+        mock_tracking_validate_data["season"] = "2019-20"
+
+        ingestor = PlayerTrackingIngestor()
+        with patch.object(ingestor, "fetch", return_value=mock_tracking_validate_data):
+            result = ingestor.ingest("2544", db_connection, season="2019-20")
+
+        assert result["status"] == "FAILED"
+        assert result["error"] == "ValidationError"
+        stored = db_connection.execute(
+            "SELECT COUNT(*) FROM player_game_tracking WHERE game_id = '0022304444'"
+        ).fetchone()[0]
+        audits = db_connection.execute(
+            "SELECT COUNT(*) FROM ingestion_audit WHERE entity_type = ? AND entity_id = '2019'",
+            (ingestor.entity_type,),
+        ).fetchone()[0]
+        assert (stored, audits) == (0, 0)
+
+    def test_ingest_audits_empty_fetch_under_its_season(self, db_connection):
+        ingestor = PlayerTrackingIngestor()
+        with patch.object(
+            ingestor, "fetch", return_value={"player_id": 2544, "season": "2021-22", "data": {}}
+        ):
+            result = ingestor.ingest("2544", db_connection, season="2021-22")
+
+        assert result["rows_affected"] == 0
+        audit = db_connection.execute(
+            "SELECT row_count FROM ingestion_audit WHERE entity_type = ? AND entity_id = '2021'",
+            (ingestor.entity_type,),
+        ).fetchone()
+        assert audit[0] == 0
+
+    def test_validated_rows_use_process_pool(self, mock_tracking_validate_data, monkeypatch):
+        from nba_vault.ingestion import player_tracking
+
+        monkeypatch.setattr(player_tracking, "_PARALLEL_VALIDATE_THRESHOLD", 1)
+        monkeypatch.setattr(player_tracking, "_PARALLEL_VALIDATE_CHUNK", 1)
+        dataset = mock_tracking_validate_data["data"]["PlayerTracking"]
+        dataset["data"].append([2545, *dataset["data"][0][1:]])
+        dataset["data"].append(["bad", *dataset["data"][0][1:]])
+
+        ingestor = PlayerTrackingIngestor()
+        rows = ingestor.validated_rows(mock_tracking_validate_data)
+
+        # Row order is preserved; the unparseable PLAYER_ID falls back to the payload's id
+        assert [r[1] for r in rows] == [2544, 2545, 2544]
+        assert rows == list(
+            map(player_tracking._tracking_row, ingestor.validate(mock_tracking_validate_data))
+        )
+
     def test_upsert_skips_non_tracking_models(self, db_connection):
         from pydantic import BaseModel
 
@@ -187,3 +393,46 @@ class TestPlayerTrackingUpsert:
         ingestor = PlayerTrackingIngestor()
         rows = ingestor.upsert([Other()], db_connection)
         assert rows == 0
+
+    def test_upsert_accepts_mixed_models_and_tuples(self, db_connection):
+        from pydantic import BaseModel
+
+        from nba_vault.ingestion.player_tracking import _tracking_row
+
+        class Other(BaseModel):
+            x: int = 1
+
+        first, second = (
+            PlayerGameTrackingCreate(
+                game_id=f"002230009{i}", player_id=2544, team_id=1610612747, season_id=2023
+            )
+            for i in range(2)
+        )
+        ingestor = PlayerTrackingIngestor()
+        rows = ingestor.upsert([first, _tracking_row(second), Other()], db_connection)
+        assert rows == 2
+
+    def test_upsert_spans_multiple_batches(self, db_connection):
+        ingestor = PlayerTrackingIngestor()
+        models = [
+            PlayerGameTrackingCreate(
+                game_id="0022309999",
+                player_id=9_300_000 + i,
+                team_id=1610612747,
+                season_id=2023,
+                distance_miles=1.0,
+            )
+            for i in range(1100)
+        ]
+        # Duplicate key within the batch: the later record wins
+        models.append(models[0].model_copy(update={"distance_miles": 9.9}))
+
+        rows = ingestor.upsert(models, db_connection)
+        assert rows == 1101
+
+        count, dist = db_connection.execute(
+            "SELECT COUNT(*), MAX(distance_miles) FROM player_game_tracking "
+            "WHERE game_id = '0022309999'"
+        ).fetchone()
+        assert count == 1100
+        assert dist == 9.9
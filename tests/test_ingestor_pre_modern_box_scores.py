@@ -0,0 +1,349 @@
+"""Tests for PreModernBoxScoreIngestor."""
+
+import csv
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from nba_vault.ingestion import pre_modern_box_scores
+from nba_vault.ingestion.pre_modern_box_scores import (
+    PreModernBoxScoreIngestor,
+    _decode_batch,
+    _game_id_list,
+    _read_ahead,
+    _safe_float,
+    _safe_int,
+    _season_from_game_id,
+)
+
+_FIELDS = [
+    "gameId",
+    "personId",
+    "teamId",
+    "seasonYear",
+    "minutes",
+    "fieldGoalsMade",
+    "fieldGoalsAttempted",
+    "fieldGoalsPercentage",
+    "points",
+]
+
+# Distinct IDs so rows accumulated in the session database do not collide
+_GAME_IDS = [f"00285{i:05d}" for i in range(4)]
+_PLAYER_ID = 9_210_001
+_TEAM_ID = 1610612747
+
+
+@pytest.fixture
+def ingestor():
+    return PreModernBoxScoreIngestor()
+
+
+@pytest.fixture
+def seeded_db(db_connection):
+    db_connection.execute(
+        "INSERT OR IGNORE INTO player (player_id, first_name, last_name, full_name) "
+        "VALUES (?, 'Pre', 'Modern', 'Pre Modern')",
+        (_PLAYER_ID,),
+    )
+    db_connection.executemany(
+        "INSERT OR IGNORE INTO game (game_id, season_id, game_date, game_type, "
+        "home_team_id, away_team_id) VALUES (?, 1984, '1985-01-01', 'Regular Season', ?, ?)",
+        [(g, _TEAM_ID, 1610612738) for g in _GAME_IDS],
+    )
+    db_connection.commit()
+    return db_connection
+
+
+def _write_csv(path, rows):
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _row(game_id, **overrides):
+    row = {
+        "gameId": str(int(game_id)),
+        "personId": str(_PLAYER_ID),
+        "teamId": str(_TEAM_ID),
+        "seasonYear": "1985",
+        "minutes": "32:30",
+        "fieldGoalsMade": "10",
+        "fieldGoalsAttempted": "20",
+        "fieldGoalsPercentage": "50.0",
+        "points": "24",
+    }
+    row.update(overrides)
+    return row
+
+
+def test_ingest_loads_rows_in_batches(ingestor, seeded_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(pre_modern_box_scores, "_CSV_BLOCK_BYTES", 256)
+    rows = [_row(g) for g in _GAME_IDS]
+    rows.append(_row("0028599999"))  # game not in the game table
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", rows)
+
+    result = ingestor.ingest(str(csv_path), seeded_db)
+
+    assert result["status"] == "SUCCESS"
+    assert result["rows_affected"] == len(_GAME_IDS)
+    stored = seeded_db.execute(
+        "SELECT game_id, season_id, minutes_played, fg_pct, pts FROM player_game_log "
+        "WHERE player_id = ? ORDER BY game_id",
+        (_PLAYER_ID,),
+    ).fetchall()
+    assert [r["game_id"] for r in stored] == _GAME_IDS
+    first = stored[0]
+    assert first["season_id"] == 1984
+    assert first["minutes_played"] == pytest.approx(32.5)
+    assert first["fg_pct"] == pytest.approx(0.5)
+    assert first["pts"] == 24
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_ingest_reads_compressed_csv(ingestor, seeded_db, tmp_path, codec):
+    plain = _write_csv(tmp_path / "plain.csv", [_row(_GAME_IDS[0], points="31")])
+    csv_path = tmp_path / f"PlayerStatistics.csv.{codec}"
+    with pa.CompressedOutputStream(str(csv_path), codec) as out:
+        out.write(plain.read_bytes())
+
+    result = ingestor.ingest(str(csv_path), seeded_db, bulk=True)
+
+    assert result["rows_affected"] == 1
+    assert (
+        seeded_db.execute(
+            "SELECT pts FROM player_game_log WHERE game_id = ? AND player_id = ?",
+            (_GAME_IDS[0], _PLAYER_ID),
+        ).fetchone()[0]
+        == 31
+    )
+
+
+def test_fetch_defers_reading_rows(ingestor, tmp_path):
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", [_row(_GAME_IDS[0])])
+
+    payload = ingestor.fetch(str(csv_path))
+
+    assert payload == {"csv_path": str(csv_path), "cutoff": 1996, "bulk": False}
+
+
+def test_ingest_skips_modern_seasons_by_default(ingestor, seeded_db, tmp_path):
+    csv_path = _write_csv(
+        tmp_path / "PlayerStatistics.csv", [_row(_GAME_IDS[0], seasonYear="1998")]
+    )
+
+    result = ingestor.ingest(str(csv_path), seeded_db)
+
+    assert result["rows_affected"] == 0
+
+
+def test_upsert_skips_unknown_players(ingestor, seeded_db, tmp_path):
+    rows = [_row(_GAME_IDS[0], personId="9219999"), _row(_GAME_IDS[1], personId="")]
+    rows.append(_row(_GAME_IDS[2]))
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", rows)
+
+    inserted = ingestor.upsert([{"csv_path": str(csv_path), "cutoff": None}], seeded_db)
+
+    assert inserted == 1
+
+
+def test_upsert_filters_staged_rows_in_sql(ingestor, seeded_db, tmp_path):
+    rows = [
+        _row(_GAME_IDS[0]),
+        _row(_GAME_IDS[1], personId="9219999"),
+        _row("0028599998"),
+        _row("0028599999", personId="9219999"),  # counted once, as the missing game
+    ]
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", rows)
+
+    with patch.object(ingestor, "logger") as mock_logger:
+        inserted = ingestor.upsert([{"csv_path": str(csv_path), "cutoff": None}], seeded_db)
+
+    assert inserted == 1
+    mock_logger.info.assert_called_once_with(
+        "Pre-modern box scores upserted", inserted=1, skipped_no_game=2, skipped_no_player=1
+    )
+    assert not seeded_db.execute(
+        "SELECT 1 FROM sqlite_temp_master WHERE name = ?",
+        (pre_modern_box_scores._STAGING_TABLE,),
+    ).fetchone()
+
+
+def test_large_csv_rebuilds_deferred_indexes(ingestor, seeded_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(pre_modern_box_scores, "_DEFER_INDEX_BYTES", 0)
+    index_sql = "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ?"
+    before = seeded_db.execute(index_sql, ("player_game_log",)).fetchall()
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", [_row(_GAME_IDS[0])])
+    statements = []
+    seeded_db.set_trace_callback(statements.append)
+    try:
+        inserted = ingestor.upsert([{"csv_path": str(csv_path), "cutoff": None}], seeded_db)
+    finally:
+        seeded_db.set_trace_callback(None)
+
+    assert inserted == 1
+    assert any(s.startswith("DROP INDEX") for s in statements)
+    assert seeded_db.execute(index_sql, ("player_game_log",)).fetchall() == before
+
+
+def test_upsert_parses_season_once_per_row(ingestor, seeded_db, tmp_path):
+    rows = [_row(_GAME_IDS[0]), _row(_GAME_IDS[1], seasonYear="")]
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", rows)
+
+    with patch.object(
+        pre_modern_box_scores, "_season_from_game_id", wraps=_season_from_game_id
+    ) as fallback:
+        assert ingestor.upsert([{"csv_path": str(csv_path), "cutoff": 1996}], seeded_db) == 2
+
+    # Only the row without a seasonYear derives one, and only once
+    fallback.assert_called_once_with(_GAME_IDS[1])
+
+
+def test_upsert_falls_back_per_cell_for_malformed_values(ingestor, seeded_db, tmp_path):
+    rows = [
+        _row(_GAME_IDS[0], points="abc", minutes="30.5", seasonYear=""),
+        _row(_GAME_IDS[1], points="nan", fieldGoalsMade=" 7 ", fieldGoalsPercentage="0.45"),
+    ]
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", rows)
+
+    assert ingestor.upsert([{"csv_path": str(csv_path), "cutoff": None}], seeded_db) == 2
+
+    stored = seeded_db.execute(
+        "SELECT season_id, minutes_played, fgm, fg_pct, pts FROM player_game_log "
+        "WHERE player_id = ? AND game_id IN (?, ?) ORDER BY game_id",
+        (_PLAYER_ID, *_GAME_IDS[:2]),
+    ).fetchall()
+    # No seasonYear: the season comes from the gameId ("...285..." -> 1984-85)
+    assert tuple(stored[0]) == (1984, 30.5, 10, 0.5, None)
+    assert tuple(stored[1]) == (1984, pytest.approx(32.5), 7, 0.45, None)
+
+
+def _attach_as_table(conn, csv_path):
+    """Stand in for the csv virtual table with a plain all-TEXT temp table."""
+    with Path(csv_path).open(newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        header = next(reader)
+        cols = ", ".join(f'"{h}" TEXT' for h in header)
+        conn.execute(f"CREATE TEMP TABLE {pre_modern_box_scores._BULK_TABLE} ({cols})")
+        conn.executemany(
+            f"INSERT INTO temp.{pre_modern_box_scores._BULK_TABLE} "
+            f"VALUES ({', '.join('?' * len(header))})",
+            list(reader),
+        )
+    conn.commit()
+    return True
+
+
+def test_bulk_upsert_matches_streamed_path(ingestor, seeded_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(pre_modern_box_scores, "_attach_csv", _attach_as_table)
+    rows = [
+        _row(_GAME_IDS[0], points="abc", minutes="30.5", seasonYear=""),
+        _row(_GAME_IDS[1], fieldGoalsMade=" 7 ", fieldGoalsPercentage="0.45"),
+        _row(_GAME_IDS[2], seasonYear="1998"),  # at the cutoff
+        _row(_GAME_IDS[3], personId="9219999"),  # unknown player
+        _row("0028599999"),  # unknown game
+    ]
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", rows)
+
+    result = ingestor.ingest(str(csv_path), seeded_db, bulk=True)
+
+    assert result["rows_affected"] == 2
+    stored = seeded_db.execute(
+        "SELECT game_id, season_id, minutes_played, fgm, fg_pct, pts FROM player_game_log "
+        "WHERE player_id = ? AND game_id IN (?, ?) ORDER BY game_id",
+        (_PLAYER_ID, *_GAME_IDS[:2]),
+    ).fetchall()
+    assert tuple(stored[0]) == (_GAME_IDS[0], 1984, 30.5, 10, 0.5, None)
+    assert tuple(stored[1]) == (_GAME_IDS[1], 1984, pytest.approx(32.5), 7, 0.45, 24)
+    # The staged table is dropped once loaded
+    assert not seeded_db.execute(
+        "SELECT 1 FROM sqlite_temp_master WHERE name = ?",
+        (pre_modern_box_scores._BULK_TABLE,),
+    ).fetchone()
+
+
+def test_bulk_falls_back_to_streaming(ingestor, seeded_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(pre_modern_box_scores, "_CSV_EXTENSION", "no_such_extension")
+    csv_path = _write_csv(tmp_path / "PlayerStatistics.csv", [_row(_GAME_IDS[0])])
+
+    result = ingestor.ingest(str(csv_path), seeded_db, bulk=True)
+
+    assert result["rows_affected"] == 1
+
+
+@pytest.mark.parametrize(
+    ("game_id", "expected"),
+    [("0028500001", 1984), ("0040200015", 2001), ("0020000001", 1999), ("00ab500001", None)],
+)
+def test_season_from_game_id(game_id, expected):
+    assert _season_from_game_id(game_id) == expected
+
+
+@pytest.mark.parametrize(
+    ("val", "expected"),
+    [("12", 12), (" -3 ", -3), ("7.9", 7), ("NULL", None), ("", None), ("inf", None), (None, None)],
+)
+def test_safe_int(val, expected):
+    assert _safe_int(val) == expected
+
+
+@pytest.mark.parametrize(
+    ("val", "expected"), [("0.455", 0.455), (" 12 ", 12.0), ("none", None), ("x", None)]
+)
+def test_safe_float(val, expected):
+    assert _safe_float(val) == expected
+
+
+@pytest.mark.parametrize(
+    ("cells", "expected"),
+    [
+        (["28500001", " 29600001.0 ", None], ["0028500001", "0029600001", ""]),
+        # One malformed id sends the block down the per-cell path
+        (["abc", "0028500001", "28500002"], ["", "0028500001", "0028500002"]),
+    ],
+)
+def test_game_id_list(cells, expected):
+    assert _game_id_list(pa.array(cells, pa.string())) == expected
+
+
+def test_decode_batch_applies_cutoff_before_and_after_fallback():
+    cells = dict.fromkeys(pre_modern_box_scores._CSV_COLUMNS, [None] * 4)
+    cells["gameId"] = ["28500001", "29800001", "29700002", "28500003"]
+    cells["personId"] = [str(_PLAYER_ID)] * 4
+    # 1998 is past the cutoff; the blank seasons fall back to the gameId
+    cells["seasonYear"] = ["1985", "1998", "", ""]
+    batch = pa.RecordBatch.from_pydict(
+        {name: pa.array(values, pa.string()) for name, values in cells.items()}
+    )
+
+    rows = _decode_batch(batch, 1996)
+
+    assert [(r[0], r[3]) for r in rows] == [("0028500001", 1984), ("0028500003", 1984)]
+
+
+def test_read_ahead_preserves_order_and_runs_off_thread():
+    seen_threads = []
+
+    def produce():
+        for i in range(5):
+            seen_threads.append(threading.current_thread())
+            yield [i]
+
+    assert list(_read_ahead(produce(), 2)) == [[0], [1], [2], [3], [4]]
+    assert threading.current_thread() not in seen_threads
+
+
+def test_read_ahead_reraises_in_order():
+    def produce():
+        yield [1]
+        raise ValueError("bad block")
+
+    items = _read_ahead(produce(), 3)
+    assert next(items) == [1]
+    with pytest.raises(ValueError, match="bad block"):
+        next(items)
@@ -0,0 +1,128 @@
+"""Tests for RaptorIngestor."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nba_vault.ingestion import raptor
+from nba_vault.ingestion.raptor import RaptorIngestor
+from nba_vault.models.entities import PlayerRaptorCreate
+
+# Distinct IDs so rows accumulated in the session database do not collide
+_PLAYER_ID = 9_211_001
+_BBREF_ID = "raptorpl01"
+
+
+@pytest.fixture
+def ingestor():
+    return RaptorIngestor()
+
+
+@pytest.fixture
+def seeded_db(db_connection):
+    db_connection.execute(
+        "INSERT OR IGNORE INTO player (player_id, first_name, last_name, full_name, bbref_id) "
+        "VALUES (?, 'Rap', 'Tor', 'Rap Tor', ?)",
+        (_PLAYER_ID, _BBREF_ID),
+    )
+    db_connection.commit()
+    return db_connection
+
+
+def _model(season_id, **overrides):
+    fields = {
+        "bbref_id": _BBREF_ID,
+        "season_id": season_id,
+        "season_type": "RS",
+        "bbref_team_id": "LAL",
+        "mp": 2000,
+        "raptor_total": 4.5,
+        "raptor_version": "modern",
+    }
+    fields.update(overrides)
+    return PlayerRaptorCreate(**fields)
+
+
+def test_upsert_resolves_player_and_skips_unknown_seasons(ingestor, seeded_db):
+    # 1990 is not in the seeded season table
+    rows = ingestor.upsert(
+        [_model(2020), _model(2021, bbref_id="unknownpl01"), _model(1990)], seeded_db
+    )
+
+    assert rows == 2
+    stored = seeded_db.execute(
+        "SELECT bbref_id, player_id, raptor_total FROM player_raptor "
+        "WHERE season_id IN (2020, 2021) AND bbref_id IN (?, 'unknownpl01') ORDER BY season_id",
+        (_BBREF_ID,),
+    ).fetchall()
+    assert [tuple(r) for r in stored] == [(_BBREF_ID, _PLAYER_ID, 4.5), ("unknownpl01", None, 4.5)]
+
+
+def test_validate_indexes_columns_by_header(ingestor):
+    raw = {
+        "headers": ["player_id", "year_id", "type", "team_id", "Min", "Raptor+/-", "Raptor WAR"],
+        "data": [
+            [_BBREF_ID, "2021", "PO", "LAL", "850", "3.2", "1.1"],
+            [_BBREF_ID, "1995", "", "", "1500"],  # ragged row, blank type
+            ["", "2021", "RS", "LAL", "10", "0", "0"],  # no player: skipped
+        ],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert [(m.season_id, m.season_type, m.raptor_version) for m in result] == [
+        (2020, "PO", "modern"),
+        (1994, "RS", "box"),
+    ]
+    assert result[0].mp == 850
+    assert result[0].raptor_total == pytest.approx(3.2)
+    assert result[0].raptor_offense is None  # column absent from headers
+    assert result[1].bbref_team_id is None
+
+
+def test_validate_accepts_legacy_row_dict_payload(ingestor):
+    raw = {"rows": [{"player_id": _BBREF_ID, "year_id": "2021", "type": "RS", "Min": "10"}]}
+
+    result = ingestor.validate(raw)
+
+    assert [(m.bbref_id, m.season_id, m.mp) for m in result] == [(_BBREF_ID, 2020, 10)]
+
+
+def test_validate_enforces_model_bounds_on_every_row(ingestor, seeded_db):
+    raw = {
+        "headers": ["player_id", "year_id", "type", "Min", "Raptor+/-"],
+        "data": [
+            [_BBREF_ID, "2016", "RS", "900", "1.5"],
+            [_BBREF_ID, "1960", "RS", "800", "2.5"],  # season before 1976
+            [_BBREF_ID, "2017", "RS", "-5", "0.5"],  # negative minutes
+        ],
+    }
+
+    result = ingestor.validate(raw)
+
+    assert [(m.season_id, m.mp) for m in result] == [(2015, 900)]
+    assert result[0].poss is None  # defaults still filled in
+    assert ingestor.upsert(result, seeded_db) == 1
+
+
+def test_fetch_streams_csv_response():
+    body = (
+        'player_name,player_id,year_id,type\r\n"Jokić, Nikola",jokicni01,2023,RS\r\n'
+        '"Two\nLines",twolines01,2023,PO\r\n'
+    ).encode()
+    cache = MagicMock()
+    cache.get.return_value = None
+    ingestor = RaptorIngestor(cache=cache)
+
+    with patch.object(raptor.urllib.request, "urlopen", return_value=io.BytesIO(body)):
+        payload = ingestor.fetch("all")
+
+    assert payload == {
+        "headers": ["player_name", "player_id", "year_id", "type"],
+        "data": [
+            ["Jokić, Nikola", "jokicni01", "2023", "RS"],
+            ["Two\nLines", "twolines01", "2023", "PO"],
+        ],
+    }
+    cache.set.assert_called_once_with("raptor_historical_csv", payload)
@@ -0,0 +1,134 @@
+"""Tests for SeasonIngestor and FranchiseIngestor."""
+
+import pytest
+
+from nba_vault.ingestion.seasons import _SEASON_SEED, FranchiseIngestor, SeasonIngestor
+from nba_vault.models.entities import FranchiseCreate, SeasonCreate
+
+
+@pytest.fixture
+def season_ingestor():
+    return SeasonIngestor()
+
+
+@pytest.fixture
+def franchise_ingestor():
+    return FranchiseIngestor()
+
+
+def test_season_upsert_inserts_and_updates(season_ingestor, db_connection):
+    seasons = [
+        SeasonCreate(season_id=2090, league_id="NBA", season_label="2090-91", games_per_team=82),
+        SeasonCreate(season_id=2091, league_id="NBA", season_label="2091-92", games_per_team=None),
+    ]
+
+    assert season_ingestor.upsert(seasons, db_connection) == 2
+    db_connection.commit()
+
+    updated = [
+        SeasonCreate(season_id=2090, league_id="NBA", season_label="2090-91", games_per_team=66)
+    ]
+    assert season_ingestor.upsert(updated, db_connection) == 1
+
+    rows = db_connection.execute(
+        "SELECT season_id, games_per_team FROM season WHERE season_id >= 2090 ORDER BY season_id"
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [(2090, 66), (2091, None)]
+
+
+def test_season_seed_has_one_row_per_year():
+    season_ids = [row[0] for row in _SEASON_SEED]
+    assert len(season_ids) == len(set(season_ids))
+
+
+def test_season_seed_rows_pass_validation():
+    for season_id, league_id, season_label, games_per_team in _SEASON_SEED:
+        SeasonCreate(
+            season_id=season_id,
+            league_id=league_id,
+            season_label=season_label,
+            games_per_team=games_per_team,
+        )
+
+
+def test_validate_constructs_seed_and_validates_other_rows(season_ingestor):
+    seeded = season_ingestor.validate(season_ingestor.fetch("all"))
+    assert len(seeded) == len(_SEASON_SEED)
+    assert seeded[0] == SeasonCreate(
+        season_id=1946, league_id="BAA", season_label="1946-47", games_per_team=60
+    )
+
+    # Rows that are not the seed object still go through the validators
+    rows = [(2030, "NBA", "2030-31", 82), (2031, "XYZ", "2031-32", 82)]
+    assert [m.season_id for m in season_ingestor.validate({"seasons": rows})] == [2030]
+
+
+def test_season_seed_keeps_nba_rows_for_aba_years(season_ingestor, db_connection):
+    validated = season_ingestor.validate(season_ingestor.fetch("all"))
+    season_ingestor.upsert(validated, db_connection)
+
+    row = db_connection.execute(
+        "SELECT league_id, games_per_team FROM season WHERE season_id = 1967"
+    ).fetchone()
+    assert tuple(row) == ("NBA", 82)
+
+
+def test_season_upsert_empty(season_ingestor, db_connection):
+    assert season_ingestor.upsert([], db_connection) == 0
+
+
+def test_franchise_upsert_inserts_and_updates(franchise_ingestor, db_connection):
+    franchise = FranchiseCreate(
+        franchise_id=9900000001,
+        nba_franchise_id=9900000001,
+        current_team_name="Testers",
+        current_city="Testville",
+        abbreviation="TST",
+        conference="East",
+        division="Atlantic",
+        founded_year=1999,
+        league_id="NBA",
+    )
+
+    assert franchise_ingestor.upsert([franchise], db_connection) == 1
+    db_connection.commit()
+    moved = franchise.model_copy(update={"current_city": "New Testville"})
+    assert franchise_ingestor.upsert([moved], db_connection) == 1
+
+    row = db_connection.execute(
+        "SELECT current_city, abbreviation FROM franchise WHERE franchise_id = ?",
+        (9900000001,),
+    ).fetchone()
+    assert tuple(row) == ("New Testville", "TST")
+
+
+def test_franchise_validate_maps_fields_and_skips_bad_rows(franchise_ingestor):
+    raw = {
+        "franchises": [
+            {
+                "TEAM_ID": 1610612747,
+                "TEAM_NAME": "Lakers",
+                "TEAM_CITY": "Los Angeles",
+                "TEAM_ABBREVIATION": "LAL",
+                "START_YEAR": 1948,
+                "LEAGUE_ID": "00",
+            },
+            {"FRANCHISE_ID": 42, "TEAM_NAME": "Squires", "TEAM_ABBREVIATION": "X"},
+            {
+                "FRANCHISE_ID": "1610610024",
+                "TEAM_NAME": "Squires",
+                "TEAM_CITY": "Virginia",
+                "TEAM_ABBREVIATION": "VIR",
+                "LEAGUE_ID": "01",
+            },
+        ]
+    }
+
+    result = franchise_ingestor.validate(raw)
+
+    assert [(f.franchise_id, f.abbreviation, f.league_id) for f in result] == [
+        (1610612747, "LAL", "NBA"),
+        (1610610024, "VIR", "ABA"),
+    ]
+    assert result[0].current_city == "Los Angeles"
+    assert result[0].founded_year == 1948
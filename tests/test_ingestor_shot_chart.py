@@ -0,0 +1,115 @@
+"""Tests for ShotChartIngestor validation and upsert."""
+
+import pytest
+
+from nba_vault.ingestion import shot_chart
+from nba_vault.ingestion.shot_chart import ShotChartIngestor
+from nba_vault.models.entities import ShotChartRowCreate
+
+_GAME_ID = "0022300001"
+
+
+@pytest.fixture
+def ingestor():
+    return ShotChartIngestor()
+
+
+@pytest.fixture
+def quarantined(monkeypatch):
+    rows = []
+    monkeypatch.setattr(
+        shot_chart, "quarantine_row", lambda path, entity, entity_id, row, reason: rows.append(row)
+    )
+    return rows
+
+
+def _shot(**overrides):
+    shot = {
+        "GAME_ID": "22300001",
+        "PLAYER_ID": 201939,
+        "TEAM_ID": 1610612744,
+        "PERIOD": 1,
+        "MINUTES_REMAINING": 11,
+        "SECONDS_REMAINING": "42",
+        "ACTION_TYPE": "Jump Shot",
+        "SHOT_TYPE": "3PT Field Goal",
+        "SHOT_DISTANCE": 26,
+        "LOC_X": -150,
+        "LOC_Y": "210",
+        "SHOT_MADE_FLAG": 1,
+        "HTM": "GSW",
+        "VTM": "",
+    }
+    return {**shot, **overrides}
+
+
+def _fields(row):
+    return dict(zip(shot_chart._SHOT_CHART_COLS, row, strict=True))
+
+
+def test_validate_returns_insert_tuples(ingestor, quarantined):
+    (row,) = ingestor.validate({"game_id": _GAME_ID, "shots": [_shot()]})
+
+    assert isinstance(row, tuple)
+    shot = _fields(row)
+    assert shot["game_id"] == _GAME_ID
+    assert (shot["player_id"], shot["period"], shot["seconds_remaining"]) == (201939, 1, 42)
+    assert (shot["loc_x"], shot["loc_y"], shot["shot_made_flag"]) == (-150, 210, 1)
+    assert (shot["htm"], shot["vtm"]) == ("GSW", None)
+    assert quarantined == []
+
+
+def test_validate_quarantines_only_bad_rows(ingestor, quarantined):
+    bad_period = _shot(PERIOD=11)
+    bad_player = _shot(PLAYER_ID="abc")
+    raw = {"game_id": _GAME_ID, "shots": [_shot(), bad_period, bad_player, _shot(LOC_X=5)]}
+
+    validated = ingestor.validate(raw)
+
+    assert [_fields(r)["loc_x"] for r in validated] == [-150, 5]
+    assert quarantined == [bad_player, bad_period]
+
+
+def test_upsert_writes_tuples_and_models_for_known_games(ingestor, quarantined, db_connection):
+    db_connection.execute(
+        "INSERT OR IGNORE INTO game (game_id, season_id, game_date, game_type, "
+        "home_team_id, away_team_id) "
+        "VALUES (?, 2023, '2023-10-24', 'Regular Season', 1610612744, 1610612756)",
+        (_GAME_ID,),
+    )
+    db_connection.commit()
+    rows = ingestor.validate(
+        {"game_id": _GAME_ID, "shots": [_shot(), _shot(GAME_ID="0022399999", LOC_X=7)]}
+    )
+
+    assert ingestor.upsert(rows, db_connection) == 1
+    db_connection.commit()
+    model = ShotChartRowCreate.model_validate({**_fields(rows[0]), "loc_x": 33})
+    assert ingestor.upsert([model], db_connection) == 1
+
+    stored = db_connection.execute(
+        "SELECT loc_x FROM shot_chart WHERE game_id = ? AND player_id = 201939 ORDER BY loc_x",
+        (_GAME_ID,),
+    ).fetchall()
+    assert [r[0] for r in stored] == [-150, 33]
+
+
+def test_upsert_same_game_twice_does_not_duplicate_shots(ingestor, quarantined, db_connection):
+    game_id = "0022300002"
+    db_connection.execute(
+        "INSERT OR IGNORE INTO game (game_id, season_id, game_date, game_type, "
+        "home_team_id, away_team_id) "
+        "VALUES (?, 2023, '2023-10-25', 'Regular Season', 1610612744, 1610612756)",
+        (game_id,),
+    )
+    db_connection.commit()
+    raw = {"game_id": game_id, "shots": [_shot(GAME_ID=game_id), _shot(GAME_ID=game_id, LOC_X=9)]}
+
+    assert ingestor.upsert(ingestor.validate(raw), db_connection) == 2
+    db_connection.commit()
+    assert ingestor.upsert(ingestor.validate(raw), db_connection) == 0
+
+    (count,) = db_connection.execute(
+        "SELECT COUNT(*) FROM shot_chart WHERE game_id = ?", (game_id,)
+    ).fetchone()
+    assert count == 2
@@ -0,0 +1,443 @@
+"""Tests for ShufinskiyPBPIngestor CSV loaders."""
+
+import csv
+import io
+import sqlite3
+import tarfile
+import urllib.error
+from email.message import Message
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from nba_vault.ingestion import shufinskiy
+from nba_vault.ingestion.shufinskiy import (
+    ShufinskiyPBPIngestor,
+    _known_game_ids,
+    _parse_pc_time,
+    _parse_score,
+    _safe_int,
+)
+from nba_vault.utils.cache import ContentCache
+
+_GAME_ID = "0029600901"
+_MISSING_GAME_ID = "0029600999"
+
+
+@pytest.fixture
+def ingestor():
+    return ShufinskiyPBPIngestor()
+
+
+@pytest.fixture
+def seeded_db(db_connection):
+    db_connection.execute(
+        "INSERT OR IGNORE INTO game (game_id, season_id, game_date, game_type, "
+        "home_team_id, away_team_id) "
+        "VALUES (?, 1996, '1996-11-01', 'Regular Season', 1610612747, 1610612738)",
+        (_GAME_ID,),
+    )
+    db_connection.commit()
+    return db_connection
+
+
+def _tar_xz(members):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:xz") as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _serve(monkeypatch, rows):
+    """Serve rows as a CSV inside a tar.xz archive from every urlopen() call."""
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    text = io.StringIO()
+    writer = csv.DictWriter(text, fieldnames=fields, restval="")
+    writer.writeheader()
+    writer.writerows(rows)
+    archive = _tar_xz([("data.csv", text.getvalue().encode())])
+    monkeypatch.setattr(
+        shufinskiy.urllib.request, "urlopen", lambda url, timeout: io.BytesIO(archive)
+    )
+
+
+def _known(conn):
+    return pa.array(list(_known_game_ids(conn)), pa.string())
+
+
+def _load(ingestor, source, conn):
+    """Download one archive source as its own season and write it."""
+    parsed = ingestor._download_season({f"{source}_2000": "url"}, _known(conn), 2000, "rg")
+    return ingestor._write_season(conn, *parsed)
+
+
+def test_load_nbastats_upserts_rows_for_known_games(ingestor, seeded_db, monkeypatch):
+    _serve(
+        monkeypatch,
+        [
+            {
+                "GAME_ID": _GAME_ID,
+                "EVENTNUM": "2",
+                "PERIOD": "1",
+                "PCTIMESTRING": "11:41",
+                "EVENTMSGTYPE": "1",
+                "HOMEDESCRIPTION": "Jump shot",
+                "SCORE": "2 - 0",
+                "SCOREMARGIN": "2",
+                "VIDEO_AVAILABLE_FLAG": "1",
+            },
+            {
+                "GAME_ID": _GAME_ID,
+                "EVENTNUM": "3",
+                "PERIOD": "1",
+                "PCTIMESTRING": "11:20",
+                "EVENTMSGTYPE": "2",
+            },
+            {"GAME_ID": _MISSING_GAME_ID, "EVENTNUM": "2", "PERIOD": "1"},
+            {"GAME_ID": _GAME_ID, "EVENTNUM": "", "PERIOD": "1"},
+        ],
+    )
+
+    assert _load(ingestor, "nbastats", seeded_db) == 2
+    # Re-loading the same events updates them in place
+    assert _load(ingestor, "nbastats", seeded_db) == 2
+
+    rows = seeded_db.execute(
+        "SELECT event_num, pc_time, score_home, score_visitor, video_available "
+        "FROM play_by_play WHERE game_id = ? ORDER BY event_num",
+        (_GAME_ID,),
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [(2, 701, 2, 0, 1), (3, 680, None, None, 0)]
+
+
+def test_load_shotdetail_inserts_rows_for_known_games(ingestor, seeded_db, monkeypatch):
+    shot = {
+        "GAME_ID": _GAME_ID,
+        "PLAYER_ID": "977",
+        "TEAM_ID": "1610612747",
+        "PERIOD": "2",
+        "SHOT_DISTANCE": "24",
+        "LOC_X": "-120",
+        "LOC_Y": "205",
+        "SHOT_MADE_FLAG": "1",
+        "ACTION_TYPE": "Jump Shot",
+    }
+    _serve(monkeypatch, [shot, {**shot, "GAME_ID": _MISSING_GAME_ID}])
+
+    assert _load(ingestor, "shotdetail", seeded_db) == 1
+    # shot_chart has no unique key; a re-run must not store the shot twice
+    assert _load(ingestor, "shotdetail", seeded_db) == 0
+
+    rows = seeded_db.execute(
+        "SELECT player_id, loc_x, loc_y, shot_made_flag, action_type "
+        "FROM shot_chart WHERE game_id = ?",
+        (_GAME_ID,),
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [(977, -120, 205, 1, "Jump Shot")]
+
+
+def test_write_keeps_repeated_shots_within_one_archive(ingestor, seeded_db, monkeypatch):
+    putback = {
+        "GAME_ID": _GAME_ID,
+        "PLAYER_ID": "1495",
+        "TEAM_ID": "1610612759",
+        "PERIOD": "3",
+        "LOC_X": "0",
+        "LOC_Y": "0",
+        "ACTION_TYPE": "Tip Shot",
+    }
+    _serve(monkeypatch, [putback, {**putback, "SHOT_MADE_FLAG": "1"}])
+
+    assert _load(ingestor, "shotdetail", seeded_db) == 2
+    assert _load(ingestor, "shotdetail", seeded_db) == 0
+
+
+def _secondary_indexes(conn):
+    return {
+        r[0]
+        for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            "AND tbl_name IN ('play_by_play', 'shot_chart', 'possession')"
+        )
+    }
+
+
+def test_upsert_writes_seasons_in_order_and_looks_up_games_once(ingestor, seeded_db, monkeypatch):
+    rows = [
+        {"GAME_ID": _GAME_ID, "EVENTNUM": str(n), "PERIOD": "1", "EVENTMSGTYPE": "1"}
+        for n in range(100, 150)
+    ]
+    _serve(monkeypatch, rows)
+    targets = [(2001, "rg"), (2001, "po"), (2002, "rg"), (2003, "rg"), (2004, "po")]
+    monkeypatch.setattr(shufinskiy, "_resolve_targets", lambda entity_id: targets)
+    manifest = {f"nbastats{'_po' if t == 'po' else ''}_{s}": "url" for s, t in targets}
+    payload = [{"manifest": manifest, "entity_id": "shufinskiy-test"}]
+    written = []
+    write_season = ingestor._write_season
+
+    def record_write(conn, season, season_type, parsed):
+        written.append((season, season_type, _secondary_indexes(conn)))
+        return write_season(conn, season, season_type, parsed)
+
+    monkeypatch.setattr(ingestor, "_write_season", record_write)
+    indexes = _secondary_indexes(seeded_db)
+    statements = []
+    seeded_db.set_trace_callback(statements.append)
+
+    assert ingestor.upsert(payload, seeded_db) == len(rows) * len(targets)
+
+    seeded_db.set_trace_callback(None)
+    assert sum("FROM game" in sql for sql in statements) == 1
+    # Five seasons is enough to defer the secondary indexes until the end
+    assert written == [(s, t, set()) for s, t in targets]
+    assert indexes and _secondary_indexes(seeded_db) == indexes
+
+    # Every season is now recorded as done, so a re-run downloads nothing
+    with patch.object(shufinskiy.urllib.request, "urlopen") as urlopen:
+        assert ingestor.upsert(payload, seeded_db) == 0
+    urlopen.assert_not_called()
+
+
+def test_download_batches_streams_first_csv_member(ingestor):
+    archive = _tar_xz(
+        [
+            ("README.txt", b"not a csv"),
+            ("nbastats_1996.csv", "GAME_ID,PLAYER\n0029600901,Jokić\n0029600902,\n".encode()),
+            ("other.csv", b"GAME_ID\nignored\n"),
+        ]
+    )
+
+    with patch.object(shufinskiy.urllib.request, "urlopen", return_value=io.BytesIO(archive)):
+        batches = ingestor._download_batches("url", ("GAME_ID", "PLAYER", "ABSENT"))
+        assert not isinstance(batches, list)
+        assert [row for batch in batches for row in batch.to_pylist()] == [
+            {"GAME_ID": "0029600901", "PLAYER": "Jokić", "ABSENT": None},
+            {"GAME_ID": "0029600902", "PLAYER": None, "ABSENT": None},
+        ]
+
+
+def test_download_batches_without_csv_member_yields_nothing(ingestor):
+    archive = _tar_xz([("README.txt", b"no data")])
+
+    with patch.object(shufinskiy.urllib.request, "urlopen", return_value=io.BytesIO(archive)):
+        assert list(ingestor._download_batches("url", ("GAME_ID",))) == []
+
+
+def test_parse_skips_archive_that_fails_mid_stream(ingestor, monkeypatch):
+    archive = _tar_xz([("data.csv", b"GAME_ID,PLAYER_ID,PERIOD\n" * 2000)])
+    monkeypatch.setattr(
+        shufinskiy.urllib.request,
+        "urlopen",
+        lambda url, timeout: io.BytesIO(archive[: len(archive) // 2]),
+    )
+
+    assert ingestor._parse_shotdetail("url", pa.array([_GAME_ID])) is None
+
+
+def test_parse_pbpstats_numbers_rows_across_skipped_rows(ingestor, monkeypatch):
+    _serve(
+        monkeypatch,
+        [
+            {"GAMEID": _GAME_ID, "PERIOD": "1", "STARTTIME": "0", "ENDTIME": "14.5", "FG2M": "1"},
+            {"GAMEID": _MISSING_GAME_ID, "PERIOD": "1", "STARTTIME": "14.5"},
+            {"GAMEID": _GAME_ID, "PERIOD": "1", "STARTTIME": "", "FG3M": "1"},
+            {
+                "GAMEID": _GAME_ID,
+                "PERIOD": "1",
+                "STARTTIME": "0:30",
+                "ENDTIME": "0:41",
+                "FG3M": "1.0",
+                "STARTTYPE": "OffMissedShot",
+                "TURNOVERS": "1",
+            },
+        ],
+    )
+
+    assert ingestor._parse_pbpstats("url", pa.array([_GAME_ID])) == [
+        (_GAME_ID, 1, 1, 0.0, 14.5, 2, None, None),
+        (_GAME_ID, 4, 1, 30.0, 41.0, 3, "OffMissedShot", "turnover"),
+    ]
+
+
+def test_load_nbastats_coerces_malformed_cells_like_row_parser(ingestor, seeded_db, monkeypatch):
+    _serve(
+        monkeypatch,
+        [
+            {
+                "GAME_ID": f" {_GAME_ID} ",
+                "EVENTNUM": "907.0",
+                "PERIOD": "2",
+                "PCTIMESTRING": "5:07",
+                "EVENTMSGTYPE": "1",
+                "SCORE": "10 - 12",
+                "SCOREMARGIN": "TIE",
+                "PLAYER1_ID": "0",
+                "HOMEDESCRIPTION": "   ",
+            },
+            {
+                "GAME_ID": _GAME_ID,
+                "EVENTNUM": "908",
+                "PERIOD": "2",
+                "PCTIMESTRING": "bad",
+                "EVENTMSGTYPE": "1",
+                "SCORE": "1-2-3",
+                "SCOREMARGIN": "-2",
+            },
+        ],
+    )
+
+    assert _load(ingestor, "nbastats", seeded_db) == 2
+
+    rows = seeded_db.execute(
+        "SELECT event_num, pc_time, score_home, score_visitor, score_margin, player1_id, "
+        "description_home FROM play_by_play WHERE game_id = ? AND event_num IN (907, 908) "
+        "ORDER BY event_num",
+        (_GAME_ID,),
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [
+        (907, 307, 10, 12, None, None, None),
+        (908, None, None, None, -2, None, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("val", "expected"),
+    [
+        (12, 12),
+        (0, None),
+        (7.9, 7),
+        (float("nan"), None),
+        (float("inf"), None),
+        (" 12.0 ", 12),
+        ("0.0", None),
+        ("NA", None),
+        (" null ", None),
+        ("1e400", None),
+        ("TIE", None),
+        (None, None),
+        (True, None),
+    ],
+)
+def test_safe_int(val, expected):
+    assert _safe_int(val) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("11:41", 701), (" 0:07 ", 7), ("5 : 07", 307), ("12", None), ("1:2:3", None), ("", None)],
+)
+def test_parse_pc_time(text, expected):
+    assert _parse_pc_time(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("102 - 99", (102, 99)), ("2-0", (2, 0)), ("1-2-3", (None, None)), ("", (None, None))],
+)
+def test_parse_score(text, expected):
+    assert (_parse_score(text, "home"), _parse_score(text, "visitor")) == expected
+
+
+class _Response(io.BytesIO):
+    def __init__(self, body, etag):
+        super().__init__(body)
+        self.headers = {"ETag": etag}
+
+
+def test_fetch_revalidates_cached_manifest_with_etag(tmp_path):
+    ingestor = ShufinskiyPBPIngestor(cache=ContentCache(cache_dir=tmp_path))
+    body = b"nbastats_1996=https://example.test/a.tar.xz\nnot a pair\n"
+    requests = []
+
+    def urlopen(request, timeout):
+        requests.append(request)
+        if len(requests) == 1:
+            return _Response(body, '"v1"')
+        raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+
+    with patch.object(shufinskiy.urllib.request, "urlopen", side_effect=urlopen):
+        first = ingestor.fetch("all")
+        second = ingestor.fetch("1996_po")
+
+    assert first["manifest"] == {"nbastats_1996": "https://example.test/a.tar.xz"}
+    assert requests[0].get_header("If-none-match") is None
+    assert requests[1].get_header("If-none-match") == '"v1"'
+    assert second["manifest"] == first["manifest"]
+    # The cached payload must not pin the entity_id of the run that stored it
+    assert second["entity_id"] == "1996_po"
+
+
+def test_fetch_falls_back_to_cached_manifest_when_offline(tmp_path):
+    ingestor = ShufinskiyPBPIngestor(cache=ContentCache(cache_dir=tmp_path))
+    with patch.object(
+        shufinskiy.urllib.request, "urlopen", return_value=_Response(b"k=https://x\n", '"v1"')
+    ):
+        ingestor.fetch("all")
+
+    offline = urllib.error.URLError("no network")
+    with patch.object(shufinskiy.urllib.request, "urlopen", side_effect=offline):
+        assert ingestor.fetch("2000")["manifest"] == {"k": "https://x"}
+
+    empty = ShufinskiyPBPIngestor(cache=ContentCache(cache_dir=tmp_path / "empty"))
+    with (
+        patch.object(shufinskiy.urllib.request, "urlopen", side_effect=offline),
+        pytest.raises(urllib.error.URLError),
+    ):
+        empty.fetch("all")
+
+
+def test_write_season_is_all_or_nothing(ingestor, seeded_db):
+    event = (_GAME_ID, 990, 1, None, None, 1, None, None, None, None, None, None)
+    event += (None,) * 6 + (0,)
+    # shot_chart.player_id is NOT NULL, so the shot fails after the event is written
+    bad_shot = (_GAME_ID, None, None, 1) + (None,) * 10 + (0, None, None)
+    rows = {"nbastats": [event], "shotdetail": [bad_shot]}
+
+    with pytest.raises(sqlite3.IntegrityError):
+        ingestor._write_season(seeded_db, 2005, "po", rows)
+
+    assert not seeded_db.in_transaction
+    assert (
+        seeded_db.execute(
+            "SELECT COUNT(*) FROM play_by_play WHERE game_id = ? AND event_num = 990", (_GAME_ID,)
+        ).fetchone()[0]
+        == 0
+    )
+    assert not shufinskiy._already_done(seeded_db, ingestor.entity_type, "2005_po")
+
+
+def test_failed_download_leaves_season_to_retry(ingestor, seeded_db):
+    manifest = {"nbastats_2006": "url", "shotdetail_2006": "url"}
+    offline = urllib.error.URLError("no network")
+
+    with patch.object(shufinskiy.urllib.request, "urlopen", side_effect=offline):
+        parsed = ingestor._download_season(manifest, _known(seeded_db), 2006, "rg")
+
+    assert ingestor._write_season(seeded_db, *parsed) == 0
+    assert not shufinskiy._already_done(seeded_db, ingestor.entity_type, "2006")
+    status, error = seeded_db.execute(
+        "SELECT status, error_message FROM ingestion_audit WHERE entity_type = ? "
+        "AND entity_id = '2006'",
+        (ingestor.entity_type,),
+    ).fetchone()
+    assert (status, error) == ("FAILED", "download failed: nbastats, shotdetail")
+
+
+def test_possession_upsert_matches_field_order():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        f"CREATE TABLE possession ({', '.join(shufinskiy._POSSESSION_FIELDS)}, "
+        "UNIQUE(game_id, possession_number))"
+    )
+    row = (_GAME_ID, 4, 1, 30.0, 41.0, 3, "OffMissedShot", "turnover")
+
+    conn.execute(shufinskiy._POSSESSION_UPSERT, row)
+    conn.execute(shufinskiy._POSSESSION_UPSERT, (*row[:5], 0, None, None))
+
+    assert conn.execute("SELECT * FROM possession").fetchall() == [
+        (_GAME_ID, 4, 1, 30.0, 41.0, 0, None, None)
+    ]
@@ -3,11 +3,13 @@
 Tests cover error paths, edge cases, and web scraping logic.
 """
 
+import threading
 from datetime import date
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from nba_vault.ingestion.injuries import InjuryIngestor
 from nba_vault.models.advanced_stats import InjuryCreate
@@ -22,7 +24,8 @@ class TestInjuryIngestorFetch:
 
         # Mock successful response
         mock_response = Mock()
-        mock_response.content = """
+        mock_response.iter_content.return_value = [
+            b"""
         <html>
             <body>
                 <table>
@@ -45,6 +48,7 @@ class TestInjuryIngestorFetch:
             </body>
         </html>
         """
+        ]
         mock_response.raise_for_status = Mock()
 
         with patch.object(ingestor.session, "get", return_value=mock_response):
@@ -63,7 +67,8 @@ class TestInjuryIngestorFetch:
         ingestor = InjuryIngestor()
 
         mock_response = Mock()
-        mock_response.content = """
+        mock_response.iter_content.return_value = [
+            b"""
         <html>
             <body>
                 <table>
@@ -84,6 +89,7 @@ class TestInjuryIngestorFetch:
             </body>
         </html>
         """
+        ]
         mock_response.raise_for_status = Mock()
 
         with patch.object(ingestor.session, "get", return_value=mock_response):
@@ -115,12 +121,55 @@ class TestInjuryIngestorFetch:
         with pytest.raises(ValueError, match="Invalid entity_id format"):
             ingestor.fetch("invalid_format")
 
+    def test_session_retries_gateway_errors_on_pooled_connections(self):
+        """Test that the scraper session retries transient 5xx responses at the transport."""
+        ingestor = InjuryIngestor()
+
+        adapter = ingestor.session.get_adapter("https://www.espn.com/nba/injuries")
+        assert isinstance(adapter, HTTPAdapter)
+        retry = adapter.max_retries
+
+        assert retry.total == 3
+        assert retry.connect == 0
+        assert set(retry.status_forcelist) == {502, 503, 504}
+        assert retry.raise_on_status is False
+        assert ingestor.session.get_adapter("https://www.rotowire.com/") is adapter
+
+    def test_fetch_all_sources_concurrently(self):
+        """Test that source="all" merges ESPN and Rotowire results."""
+        ingestor = InjuryIngestor()
+        pages = {
+            ingestor.espn_scraper.BASE_URL: b"""
+                <table><tr><th>Name</th><th>Team</th><th>Status</th></tr>
+                <tr><td>Stephen Curry</td><td>GSW</td><td>Out</td></tr></table>
+            """,
+            ingestor.rotowire_scraper.BASE_URL: b"""
+                <div class="lineup"><span class="team-name">LAL</span>
+                <div class="player"><a class="player-name">LeBron James</a></div></div>
+            """,
+        }
+        threads = set()
+
+        def fake_get(url, **kwargs):
+            threads.add(threading.get_ident())
+            response = Mock()
+            response.iter_content.return_value = [pages[url]]
+            return response
+
+        with patch.object(ingestor.session, "get", side_effect=fake_get):
+            result = ingestor.fetch("all", source="all")
+
+        assert result["source"] == "all"
+        assert [i["player_name"] for i in result["injuries"]] == ["Stephen Curry", "LeBron James"]
+        assert threading.get_ident() not in threads
+
     def test_fetch_rotowire_success(self):
         """Test successful fetch from Rotowire."""
         ingestor = InjuryIngestor()
 
         mock_response = Mock()
-        mock_response.content = """
+        mock_response.iter_content.return_value = [
+            b"""
         <html>
             <body>
                 <div class="lineup">
@@ -134,6 +183,7 @@ class TestInjuryIngestorFetch:
             </body>
         </html>
         """
+        ]
         mock_response.raise_for_status = Mock()
 
         with patch.object(ingestor.session, "get", return_value=mock_response):
@@ -178,7 +228,7 @@ class TestInjuryIngestorFetch:
         ingestor = InjuryIngestor()
 
         mock_response = Mock()
-        mock_response.content = "<html><body>Broken content</body></html>"
+        mock_response.iter_content.return_value = [b"<html><body>Broken content</body></html>"]
         mock_response.raise_for_status = Mock()
 
         with patch.object(ingestor.session, "get", return_value=mock_response):
@@ -430,7 +480,8 @@ class TestInjuryIngestorIntegration:
         ingestor = InjuryIngestor()
 
         mock_response = Mock()
-        mock_response.content = """
+        mock_response.iter_content.return_value = [
+            b"""
         <html>
             <body>
                 <table>
@@ -445,6 +496,7 @@ class TestInjuryIngestorIntegration:
             </body>
         </html>
         """
+        ]
         mock_response.raise_for_status = Mock()
 
         with patch.object(ingestor.session, "get", return_value=mock_response):
@@ -1,11 +1,15 @@
 """Tests for injury scrapers."""
 
 from datetime import date
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from lxml import html as lxml_html
 
+from nba_vault.ingestion.scrapers import injury_scrapers
 from nba_vault.ingestion.scrapers.injury_scrapers import (
+    _BODY_PARTS,
+    _INJURY_TYPES,
     ESPNInjuryScraper,
     RotowireInjuryScraper,
 )
@@ -73,6 +77,15 @@ class TestBaseInjuryScraper:
         assert injury_type is None
         assert body_part is None
 
+    def test_parse_injury_description_whitespace_only(self):
+        """Test that a blank description skips the keyword scans."""
+        scraper = ESPNInjuryScraper(MagicMock(), MagicMock())
+
+        with patch.object(injury_scrapers, "_first_keyword") as first_keyword:
+            assert scraper.parse_injury_description(" \n\t ") == (None, None)
+
+        first_keyword.assert_not_called()
+
     def test_parse_injury_description_case_insensitive(self):
         """Test that parsing is case-insensitive."""
         rate_limiter = MagicMock()
@@ -84,6 +97,27 @@ class TestBaseInjuryScraper:
         assert injury_type == "sprain"
         assert body_part == "knee"
 
+    @pytest.mark.parametrize(
+        "desc",
+        [
+            "Right knee ACL tear",  # acl outranks knee though it appears later
+            "Sore hamstring after setback",  # substring hits, as before
+            "Concussion protocol",
+            "Illness / strain of left calf and a bruise",
+            "Rest",
+        ],
+    )
+    def test_parse_injury_description_keeps_keyword_priority(self, desc):
+        """Test that the first listed keyword wins, wherever it appears."""
+        scraper = ESPNInjuryScraper(MagicMock(), MagicMock())
+        lower = desc.lower()
+        expected = (
+            next((k for k in _INJURY_TYPES if k in lower), None),
+            next((k for k in _BODY_PARTS if k in lower), None),
+        )
+
+        assert scraper.parse_injury_description(desc) == expected
+
     def test_parse_date_iso_format(self):
         """Test parsing ISO format date."""
         rate_limiter = MagicMock()
@@ -124,6 +158,18 @@ class TestBaseInjuryScraper:
 
         assert result == date(2024, 1, 15)
 
+    def test_parse_date_tries_last_matched_format_first(self):
+        """Test that parse_date remembers the format a source uses."""
+        scraper = ESPNInjuryScraper(MagicMock(), MagicMock())
+
+        assert scraper.parse_date("01/15/24") == date(2024, 1, 15)
+        remembered = scraper._date_format_index
+        assert scraper.parse_date("02/03/24") == date(2024, 2, 3)
+        assert scraper._date_format_index == remembered
+        # Other formats still parse after a switch
+        assert scraper.parse_date("Jan 5, 2024") == date(2024, 1, 5)
+        assert scraper.parse_date("2024-1-5") == date(2024, 1, 5)
+
     def test_parse_date_invalid(self):
         """Test parsing invalid date string."""
         rate_limiter = MagicMock()
@@ -159,6 +205,34 @@ class TestBaseInjuryScraper:
         assert scraper.normalize_team_name("") == ""
         assert scraper.normalize_team_name(None) == ""
 
+    def test_normalize_team_name_shares_one_string_per_team(self):
+        """Test that repeated team names normalize to the same string object."""
+        scraper = ESPNInjuryScraper(MagicMock(), MagicMock())
+
+        first = scraper.normalize_team_name("".join(["Los Angeles ", " Lakers"]))
+        second = RotowireInjuryScraper(MagicMock(), MagicMock()).normalize_team_name(
+            "Los Angeles   Lakers"
+        )
+
+        assert first == "Los Angeles Lakers"
+        assert first is second
+
+
+@pytest.mark.parametrize(
+    ("markup", "expected"),
+    [
+        ("<td>  LeBron James </td>", "LeBron James"),
+        ("<td></td>", ""),
+        ("<td><a>Nikola</a> Jokić <span>(C)</span></td>", "Nikola Jokić (C)"),
+        ("<td><br/></td>", ""),
+    ],
+)
+def test_text_reads_leaf_and_nested_cells(markup, expected):
+    """Test that _text gives the same result for leaf cells and cells with children."""
+    cell = lxml_html.fragment_fromstring(markup)
+    assert injury_scrapers._text(cell) == expected
+    assert injury_scrapers._text(None) == ""
+
 
 class TestESPNInjuryScraper:
     """Tests for ESPNInjuryScraper."""
@@ -195,7 +269,7 @@ class TestESPNInjuryScraper:
         rate_limiter = MagicMock()
         session = Mock()
         mock_response = Mock()
-        mock_response.content = html.encode()
+        mock_response.iter_content.return_value = [html.encode()]
         mock_response.raise_for_status = MagicMock()
         session.get = Mock(return_value=mock_response)
 
@@ -229,6 +303,115 @@ class TestESPNInjuryScraper:
         with pytest.raises(Exception, match="HTTP 404"):
             scraper.fetch()
 
+    def test_fetch_decodes_utf8_without_meta_charset(self):
+        """Test that non-ASCII names survive pages that do not declare a charset."""
+        html = "<table><tr><th>Name</th></tr><tr><td>Nikola Jokić</td><td>DEN</td><td>Out</td></tr></table>"
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [html.encode()]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        injuries = ESPNInjuryScraper(rate_limiter, session).fetch()
+
+        assert injuries[0]["player_name"] == "Nikola Jokić"
+
+    def test_fetch_streams_response_in_chunks(self):
+        """Test that the page is parsed from streamed chunks, even mid-character."""
+        body = "<table><tr><th>Name</th></tr><tr><td>Nikola Jokić</td><td>DEN</td><td>Out</td></tr></table>".encode()
+        split = body.index("ć".encode()) + 1  # inside the two-byte character
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [body[:split], b"", body[split:]]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        injuries = ESPNInjuryScraper(rate_limiter, session).fetch()
+
+        assert injuries[0]["player_name"] == "Nikola Jokić"
+        assert session.get.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
+
+    def test_fetch_empty_page(self):
+        """Test that an empty response body yields no injuries."""
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b""]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        assert ESPNInjuryScraper(rate_limiter, session).fetch() == []
+
+    def test_fetch_reuses_cached_page_without_rate_limiting(self):
+        """Test that a repeat fetch within the TTL skips the request and the rate limiter."""
+        html = "<table><tr><th>Name</th></tr><tr><td>LeBron James</td><td>LAL</td><td>Out</td></tr></table>"
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [html.encode()]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        scraper = ESPNInjuryScraper(rate_limiter, session)
+        first = scraper.fetch()
+        second = scraper.fetch()
+
+        assert first == second
+        session.get.assert_called_once()
+        rate_limiter.acquire.assert_called_once()
+
+    def test_fetch_refetches_expired_page(self):
+        """Test that a page older than the TTL is requested again."""
+        html = "<table><tr><th>Name</th></tr><tr><td>LeBron James</td><td>LAL</td><td>Out</td></tr></table>"
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [html.encode()]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        scraper = ESPNInjuryScraper(rate_limiter, session)
+        with patch.object(injury_scrapers.time, "monotonic", side_effect=[0.0, 901.0]):
+            scraper.fetch()
+            scraper.fetch()
+
+        assert session.get.call_count == 2
+        assert rate_limiter.acquire.call_count == 2
+
+    def test_fetch_finds_tables_inside_page_chrome(self):
+        """Test that injury tables nested in layout markup are still parsed."""
+        html = """
+        <html><head><script>var x = "<td>not a row</td>";</script></head><body>
+        <nav><ul><li>Scores</li></ul></nav>
+        <div class="ResponsiveTable"><div class="Table__Title">Boston Celtics</div>
+            <table>
+                <tr><th>Name</th><th>Team</th><th>Status</th></tr>
+                <tr><td>Jayson Tatum</td><td>BOS</td><td>Out</td><td>Wrist sprain</td></tr>
+            </table>
+        </div>
+        </body></html>
+        """
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [html.encode()]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        injuries = ESPNInjuryScraper(rate_limiter, session).fetch()
+
+        assert [(i["player_name"], i["team"], i["status"]) for i in injuries] == [
+            ("Jayson Tatum", "BOS", "Out")
+        ]
+
     def test_rate_limiting(self):
         """Test that rate limiter is called."""
         html = "<table><tr><td>Player</td><td>Team</td><td>Status</td></tr></table>"
@@ -236,7 +419,7 @@ class TestESPNInjuryScraper:
         rate_limiter = MagicMock()
         session = Mock()
         mock_response = Mock()
-        mock_response.content = html.encode()
+        mock_response.iter_content.return_value = [html.encode()]
         mock_response.raise_for_status = MagicMock()
         session.get = Mock(return_value=mock_response)
 
@@ -249,6 +432,31 @@ class TestESPNInjuryScraper:
 class TestRotowireInjuryScraper:
     """Tests for RotowireInjuryScraper."""
 
+    def test_fetch_stamps_all_rows_with_one_date(self):
+        """Test that every row of one fetch gets the same date, even across midnight."""
+        html = """
+        <div class="lineup">
+            <span class="team-name">Lakers</span>
+            <div class="player"><a class="player-name">LeBron James</a></div>
+            <div class="player"><a class="player-name">Anthony Davis</a></div>
+        </div>
+        """
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [html.encode()]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        fake_date = Mock()
+        fake_date.today.side_effect = [date(2024, 1, 15), date(2024, 1, 16)]
+        with patch.object(injury_scrapers, "date", fake_date):
+            injuries = RotowireInjuryScraper(rate_limiter, session).fetch()
+
+        assert [i["injury_date"] for i in injuries] == [date(2024, 1, 15)] * 2
+        fake_date.today.assert_called_once()
+
     def test_fetch_success(self):
         """Test successful fetch from Rotowire."""
         # Mock HTML response
@@ -279,7 +487,7 @@ class TestRotowireInjuryScraper:
         rate_limiter = MagicMock()
         session = Mock()
         mock_response = Mock()
-        mock_response.content = html.encode()
+        mock_response.iter_content.return_value = [html.encode()]
         mock_response.raise_for_status = MagicMock()
         session.get = Mock(return_value=mock_response)
 
@@ -303,6 +511,36 @@ class TestRotowireInjuryScraper:
         assert injuries[2]["team"] == "Warriors"
         assert injuries[2]["injury_type"] == "contusion"
 
+    def test_fetch_only_parses_lineup_divs(self):
+        """Test that lineup divs are found inside page chrome and with extra classes."""
+        html = """
+        <html><body>
+        <nav><div class="player"><a class="player-name">Nav Link</a></div></nav>
+        <main><section>
+            <div class="lineup is-nba">
+                <span class="team-name">Celtics</span>
+                <div class="player">
+                    <a class="player-name">Jayson Tatum</a>
+                    <span class="status">Out</span>
+                    <div class="news">Right wrist sprain</div>
+                </div>
+            </div>
+        </section></main>
+        <div class="lineups-ad"><span class="team-name">Ad</span></div>
+        </body></html>
+        """
+
+        rate_limiter = MagicMock()
+        session = Mock()
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [html.encode()]
+        mock_response.raise_for_status = MagicMock()
+        session.get = Mock(return_value=mock_response)
+
+        injuries = RotowireInjuryScraper(rate_limiter, session).fetch()
+
+        assert [(i["player_name"], i["team"]) for i in injuries] == [("Jayson Tatum", "Celtics")]
+
     def test_fetch_http_error(self):
         """Test fetch with HTTP error."""
         rate_limiter = MagicMock()
@@ -323,7 +561,7 @@ class TestRotowireInjuryScraper:
         rate_limiter = MagicMock()
         session = Mock()
         mock_response = Mock()
-        mock_response.content = html.encode()
+        mock_response.iter_content.return_value = [html.encode()]
         mock_response.raise_for_status = MagicMock()
         session.get = Mock(return_value=mock_response)
 
@@ -3,6 +3,7 @@
 Tests cover the main API client functionality.
 """
 
+import asyncio
 from unittest.mock import Mock, patch
 
 from nba_vault.ingestion.nba_stats_client import NBAStatsClient
@@ -34,6 +35,22 @@ class TestNBAStatsClientInit:
         assert client.rate_limiter == rate_limiter
         assert client.timeout == 60
 
+    def test_get_nba_stats_client_shares_adapter_and_session(self):
+        """Clients from get_nba_stats_client share one adapter and pooled session."""
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        from nba_vault.ingestion.nba_stats_client import get_nba_stats_client
+
+        cache = ContentCache()
+        first = get_nba_stats_client(cache=cache)
+        second = get_nba_stats_client()
+
+        assert first.adapter is second.adapter
+        assert first.cache is cache
+        assert first.rate_limiter is not second.rate_limiter
+        pooled = NBAStatsHTTP.get_session().get_adapter("https://stats.nba.com")
+        assert pooled._pool_maxsize == 32
+
 
 class TestNBAStatsClientAPIEndpoints:
     """Tests for NBAStatsClient API endpoint methods."""
@@ -53,6 +70,20 @@ class TestNBAStatsClientAPIEndpoints:
 
             assert mock_request.called
 
+    def test_get_player_tracking_async(self):
+        """The async variant runs get_player_tracking and returns its result."""
+        client = NBAStatsClient()
+
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = {"PlayerTracking": {"data": []}}
+
+            result = asyncio.run(
+                client.get_player_tracking_async(2544, "2023-24", season_type="Playoffs")
+            )
+
+            assert result == {"PlayerTracking": {"data": []}}
+            assert mock_request.call_args.kwargs["season_type"] == "Playoffs"
+
     def test_get_team_lineups(self):
         """Test get_team_lineups endpoint."""
         client = NBAStatsClient()
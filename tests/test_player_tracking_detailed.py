@@ -36,11 +36,51 @@ class TestPlayerTrackingIngestorFetch:
     def test_fetch_team_players(self):
         """Test fetching tracking data for all players on a team."""
         ingestor = PlayerTrackingIngestor()
+        roster = {
+            "CommonTeamRoster": {
+                "headers": ["TeamID", "PLAYER", "PLAYER_ID"],
+                "data": [[1610612747, "LeBron James", 2544], [1610612747, "Anthony Davis", 203076]],
+            }
+        }
+
+        def _tracking(player_id, **kwargs):
+            return {
+                "PlayerTracking": {
+                    "headers": ["PLAYER_ID", "TEAM_ID", "DIST_MILES"],
+                    "data": [[player_id, 1610612747, 2.5]],
+                }
+            }
 
-        result = ingestor.fetch("team:1610612747", season="2023-24")
+        with (
+            patch.object(ingestor.nba_client, "get_common_team_roster", return_value=roster),
+            patch.object(ingestor.nba_client, "get_player_tracking", side_effect=_tracking),
+        ):
+            result = ingestor.fetch("team:1610612747", season="2023-24")
 
         assert result["team_id"] == 1610612747
-        assert result["players"] == []  # Not fully implemented
+        assert [p["player_id"] for p in result["players"]] == [2544, 203076]
+
+        validated = ingestor.validate(result)
+        player_ids = [r.player_id for r in validated if isinstance(r, PlayerGameTrackingCreate)]
+        assert player_ids == [2544, 203076]
+
+    def test_fetch_team_players_skips_failed_player(self):
+        """Test that one failed player request does not fail the team fetch."""
+        ingestor = PlayerTrackingIngestor()
+        roster = {"CommonTeamRoster": {"headers": ["PLAYER_ID"], "data": [[2544], [203076]]}}
+
+        def _tracking(player_id, **kwargs):
+            if player_id == 203076:
+                raise ConnectionError("boom")
+            return {"PlayerTracking": {"headers": ["PLAYER_ID"], "data": [[player_id]]}}
+
+        with (
+            patch.object(ingestor.nba_client, "get_common_team_roster", return_value=roster),
+            patch.object(ingestor.nba_client, "get_player_tracking", side_effect=_tracking),
+        ):
+            result = ingestor.fetch("team:1610612747", season="2023-24")
+
+        assert [p["player_id"] for p in result["players"]] == [2544]
 
     def test_fetch_pre_2013_season_raises_error(self):
         """Test that fetching pre-2013 season raises ValueError."""
@@ -173,6 +213,34 @@ class TestPlayerTrackingIngestorValidate:
         result = ingestor.validate(raw_data)
         assert len(result) == 0
 
+    def test_validate_logs_skipped_rows_once(self):
+        """Skipped rows are tallied into a single warning, not one per row."""
+        ingestor = PlayerTrackingIngestor()
+
+        raw_data = {
+            "data": {
+                "PlayerTracking": {
+                    "data": [
+                        [2544, None, 2.5],
+                        [2544, None, 2.6],
+                        [None, 1610612747, 2.7],
+                        [2544, 1610612747, 2.8],
+                    ],
+                    "headers": ["PLAYER_ID", "TEAM_ID", "DIST_MILES"],
+                }
+            },
+            "player_id": None,
+            "season": "2023-24",
+        }
+
+        with patch.object(ingestor, "logger") as mock_logger:
+            result = ingestor.validate(raw_data)
+
+        assert len(result) == 1
+        mock_logger.warning.assert_called_once_with(
+            "Skipped tracking rows", season="2023-24", missing_team_id=2, missing_player_id=1
+        )
+
     def test_validate_with_empty_data(self):
         """Test validation with empty data."""
         ingestor = PlayerTrackingIngestor()
@@ -205,7 +273,8 @@ class TestPlayerTrackingIngestorValidate:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].player_id == 9999  # type: ignore[attr-defined]  # Should use row player_id
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].player_id == 9999  # Should use row player_id
 
     def test_validate_generates_game_id_when_missing(self):
         """Test that game_id is generated when not in data."""
@@ -226,7 +295,8 @@ class TestPlayerTrackingIngestorValidate:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].game_id == "season_2023"  # type: ignore[attr-defined]
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].game_id == "season_2023"
 
     def test_validate_uses_game_id_from_row(self):
         """Test that game_id from row is used when available."""
@@ -247,7 +317,8 @@ class TestPlayerTrackingIngestorValidate:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].game_id == "0022300001"  # type: ignore[attr-defined]
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].game_id == "0022300001"
 
     def test_validate_with_null_values(self):
         """Test validation with null/empty values."""
@@ -310,7 +381,8 @@ class TestPlayerTrackingIngestorValidate:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].season_id == 2022  # type: ignore[attr-defined]
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].season_id == 2022
 
 
 class TestPlayerTrackingIngestorUpsert:
@@ -328,20 +400,14 @@ class TestPlayerTrackingIngestorUpsert:
             distance_miles=2.5,
         )
 
-        # Use a MagicMock connection so execute can be patched
+        # Use a Mock connection whose batched write fails after BEGIN
         mock_conn = Mock()
-        call_count = [0]
-
-        def mock_execute(sql, params=None):
-            call_count[0] += 1
-            if call_count[0] > 1:
-                raise sqlite3.IntegrityError("UNIQUE constraint failed")
-            return Mock()
-
-        mock_conn.execute = mock_execute
+        mock_conn.total_changes = 0
+        mock_conn.executemany.side_effect = sqlite3.IntegrityError("FOREIGN KEY constraint failed")
 
         with pytest.raises(sqlite3.IntegrityError):
             ingestor.upsert([tracking], mock_conn)
+        mock_conn.execute.assert_called_with("ROLLBACK")
 
     def test_upsert_with_operational_error(self, db_connection):
         """Test handling of operational errors during upsert."""
@@ -390,6 +456,17 @@ class TestPlayerTrackingSafeConversions:
         assert PlayerTrackingIngestor._safe_int(None) is None
         assert PlayerTrackingIngestor._safe_int("") is None
         assert PlayerTrackingIngestor._safe_int("invalid") is None
+        assert PlayerTrackingIngestor._safe_int(float("inf")) is None
+        assert PlayerTrackingIngestor._safe_int(float("nan")) is None
+
+    def test_column_coercion(self):
+        """Test whole-column coercion with typed and untyped cells."""
+        from nba_vault.ingestion.player_tracking import _float_column, _int_column
+
+        assert _float_column((1, 2.5, None)) == [1.0, 2.5, None]
+        assert _float_column(("1.5", "", None)) == [1.5, None, None]
+        assert _int_column((3, None)) == [3, None]
+        assert _int_column(("3", "4.0", "x")) == [3, 4, None]
 
 
 class TestPlayerTrackingEdgeCases:
@@ -463,8 +540,9 @@ class TestPlayerTrackingEdgeCases:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].distance_miles == 99.9  # type: ignore[attr-defined]
-        assert result[0].speed_mph_avg == 99.9  # type: ignore[attr-defined]
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].distance_miles == 99.9
+        assert result[0].speed_mph_avg == 99.9
 
     def test_validate_with_zero_values(self):
         """Test validation with zero values."""
@@ -498,8 +576,9 @@ class TestPlayerTrackingEdgeCases:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].distance_miles == 0.0  # type: ignore[attr-defined]
-        assert result[0].touches == 0  # type: ignore[attr-defined]
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].distance_miles == 0.0
+        assert result[0].touches == 0
 
     def test_validate_with_string_numbers(self):
         """Test validation when numeric values are strings."""
@@ -518,9 +597,36 @@ class TestPlayerTrackingEdgeCases:
 
         result = ingestor.validate(raw_data)
         assert len(result) == 1
-        assert result[0].distance_miles == 2.5  # type: ignore[attr-defined]
-        assert result[0].speed_mph_avg == 3.5  # type: ignore[attr-defined]
-        assert result[0].touches == 85  # type: ignore[attr-defined]
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].distance_miles == 2.5
+        assert result[0].speed_mph_avg == 3.5
+        assert result[0].touches == 85
+
+    def test_validate_with_ragged_rows(self):
+        """Test validation when rows are shorter or longer than the headers."""
+        ingestor = PlayerTrackingIngestor()
+
+        raw_data = {
+            "data": {
+                "PlayerTracking": {
+                    "data": [
+                        [2544, 1610612747, "2.5"],
+                        [201939, 1610612744, "2.1", "4.0", 70, "extra"],
+                    ],
+                    "headers": ["PLAYER_ID", "TEAM_ID", "DIST_MILES", "SPD", "TOUCHES"],
+                }
+            },
+            "player_id": 2544,
+            "season": "2023-24",
+        }
+
+        result = ingestor.validate(raw_data)
+        assert len(result) == 2
+        assert isinstance(result[0], PlayerGameTrackingCreate)
+        assert result[0].distance_miles == 2.5
+        assert result[0].speed_mph_avg is None
+        assert isinstance(result[1], PlayerGameTrackingCreate)
+        assert result[1].touches == 70
 
     def test_validate_non_dict_dataset(self):
         """Test validation when dataset is not a dict."""
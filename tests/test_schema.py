@@ -98,3 +98,178 @@ def test_indexes_created(temp_db_path):
     assert "idx_ingestion_audit_entity" in indexes
 
     conn.close()
+
+
+def test_tune_for_ingest_applies_write_pragmas(temp_db_path):
+    """Test that tune_for_ingest switches a plain connection to WAL/NORMAL."""
+    import sqlite3
+
+    from nba_vault.schema.connection import tune_for_ingest
+
+    conn = sqlite3.connect(str(temp_db_path), isolation_level=None)
+    try:
+        tune_for_ingest(conn)
+        tune_for_ingest(conn)  # idempotent
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 256 * 1024 * 1024
+
+        # A larger cache configured by get_db_connection() is left alone
+        conn.execute("PRAGMA cache_size = -131072")
+        tune_for_ingest(conn)
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -131072
+    finally:
+        conn.close()
+
+
+def test_tune_for_ingest_skips_open_transaction(temp_db_path):
+    """Test that tune_for_ingest does not touch a connection mid-transaction."""
+    import sqlite3
+
+    from nba_vault.schema.connection import tune_for_ingest
+
+    conn = sqlite3.connect(str(temp_db_path), isolation_level=None)
+    try:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO t VALUES (1)")
+        tune_for_ingest(conn)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def test_deferred_indexes_drops_and_restores_secondary_indexes(temp_db_path):
+    """Test that deferred_indexes keeps UNIQUE autoindexes and rebuilds the rest."""
+    import sqlite3
+
+    import pytest
+
+    from nba_vault.schema.connection import deferred_indexes
+
+    conn = sqlite3.connect(str(temp_db_path), isolation_level=None)
+    try:
+        conn.execute("CREATE TABLE t (a INTEGER, b INTEGER, UNIQUE(a))")
+        conn.execute("CREATE INDEX idx_t_b ON t(b)")
+
+        def index_names() -> set[str]:
+            rows = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 't'"
+            )
+            return {r[0] for r in rows}
+
+        with pytest.raises(RuntimeError), deferred_indexes(conn, "t"):
+            assert index_names() == {"sqlite_autoindex_t_1"}
+            conn.execute("INSERT INTO t VALUES (1, 2)")
+            raise RuntimeError("load failed")
+
+        assert index_names() == {"sqlite_autoindex_t_1", "idx_t_b"}
+        assert not conn.in_transaction
+        # The bookkeeping table only outlives a load that was killed
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        assert "_deferred_index" not in {r[0] for r in tables}
+    finally:
+        conn.close()
+
+
+def test_deferred_indexes_commits_transaction_left_open(temp_db_path):
+    """Test that a transaction the body leaves open implicitly is kept on success."""
+    import sqlite3
+
+    from nba_vault.schema.connection import deferred_indexes
+
+    conn = sqlite3.connect(str(temp_db_path))
+    try:
+        conn.execute("CREATE TABLE t (a INTEGER, b INTEGER)")
+        conn.execute("CREATE INDEX idx_t_b ON t(b)")
+        conn.commit()
+
+        with deferred_indexes(conn, "t"):
+            # Legacy isolation opens a transaction implicitly for the INSERT
+            conn.execute("INSERT INTO t VALUES (1, 2)")
+            assert conn.in_transaction
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_restore_deferred_indexes_after_killed_load(temp_db_path):
+    """Test that indexes dropped by a load killed mid-way are recreated."""
+    import sqlite3
+    import subprocess
+    import sys
+
+    from nba_vault.schema.connection import restore_deferred_indexes
+
+    conn = sqlite3.connect(str(temp_db_path), isolation_level=None)
+    try:
+        conn.execute("CREATE TABLE t (a INTEGER, b INTEGER)")
+        conn.execute("CREATE INDEX idx_t_b ON t(b)")
+        script = (
+            "import os, sqlite3, sys\n"
+            "from nba_vault.schema.connection import deferred_indexes\n"
+            "conn = sqlite3.connect(sys.argv[1], isolation_level=None)\n"
+            "with deferred_indexes(conn, 't'):\n"
+            "    os._exit(1)\n"
+        )
+        subprocess.run([sys.executable, "-c", script, str(temp_db_path)], check=False)
+
+        index_sql = "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 't'"
+        assert conn.execute(index_sql).fetchall() == []
+        assert restore_deferred_indexes(conn) == 1
+        assert [r[0] for r in conn.execute(index_sql)] == ["idx_t_b"]
+        assert restore_deferred_indexes(conn) == 0
+    finally:
+        conn.close()
+
+
+def test_transaction_commits_or_rolls_back(temp_db_path):
+    """Test that transaction() wraps the body in BEGIN/COMMIT and undoes it on error."""
+    import sqlite3
+
+    import pytest
+
+    from nba_vault.schema.connection import transaction
+
+    conn = sqlite3.connect(str(temp_db_path), isolation_level=None)
+    try:
+        conn.execute("CREATE TABLE t (a INTEGER)")
+
+        with transaction(conn):
+            assert conn.in_transaction
+            conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+
+        with pytest.raises(sqlite3.IntegrityError), transaction(conn):
+            conn.execute("INSERT INTO t VALUES (3)")
+            raise sqlite3.IntegrityError("load failed")
+
+        assert not conn.in_transaction
+        assert [r[0] for r in conn.execute("SELECT a FROM t ORDER BY a")] == [1, 2]
+    finally:
+        conn.close()
+
+
+def test_transaction_commits_pending_implicit_transaction(temp_db_path):
+    """Test that a legacy-isolation connection's open transaction does not block BEGIN."""
+    import sqlite3
+
+    from nba_vault.schema.connection import transaction
+
+    conn = sqlite3.connect(str(temp_db_path))
+    try:
+        conn.execute("CREATE TABLE t (a INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        assert conn.in_transaction
+
+        with transaction(conn):
+            conn.execute("INSERT INTO t VALUES (2)")
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+    finally:
+        conn.close()
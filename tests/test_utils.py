@@ -89,3 +89,50 @@ def test_audit_logger(db_connection):
     stats = audit.get_stats()
     assert "test_entity" in stats
     assert "SUCCESS" in stats["test_entity"]
+
+
+def test_content_cache_compressed_round_trip(tmp_path):
+    """Compressed entries are written as .json.gz and read back transparently."""
+    from nba_vault.utils.cache import ContentCache
+
+    cache = ContentCache(cache_dir=tmp_path, compress=True)
+    data = {"CommonPlayerInfo": {"headers": ["PERSON_ID"] * 50, "data": [[2544] * 50]}}
+    cache.set("common_player_info_2544", data)
+
+    assert cache.get("common_player_info_2544") == data
+    assert list(tmp_path.rglob("*.json.gz"))
+    assert not list(tmp_path.rglob("*.json"))
+    assert cache.stats()["files"] == 1
+
+
+def test_content_cache_reads_entries_written_in_other_format(tmp_path):
+    """Toggling compression keeps previously cached entries readable."""
+    from nba_vault.utils.cache import ContentCache
+
+    ContentCache(cache_dir=tmp_path, compress=False).set("key", {"a": 1})
+    compressed = ContentCache(cache_dir=tmp_path, compress=True)
+    assert compressed.get("key") == {"a": 1}
+
+    compressed.set("key", {"a": 2})
+    assert ContentCache(cache_dir=tmp_path, compress=False).get("key") == {"a": 2}
+    assert compressed.stats()["files"] == 1
+
+    compressed.clear()
+    assert compressed.stats()["files"] == 0
+
+
+def test_existing_fk_values_chunks_large_lookups(db_connection):
+    """existing_fk_values returns only present keys, across IN-list chunks."""
+    from nba_vault.ingestion.validation import existing_fk_values
+
+    db_connection.executemany(
+        "INSERT OR REPLACE INTO player (player_id, first_name, last_name, full_name) "
+        "VALUES (?, 'F', 'K', 'F K')",
+        [(9_170_000 + i,) for i in range(0, 1200, 2)],
+    )
+    db_connection.commit()
+
+    candidates = [9_170_000 + i for i in range(1200)] + [None, 9_170_000]
+    present = existing_fk_values(db_connection, "player", "player_id", candidates)
+
+    assert present == {9_170_000 + i for i in range(0, 1200, 2)}